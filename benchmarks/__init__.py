@@ -0,0 +1 @@
+"""Benchmarks du SDK Tassi"""
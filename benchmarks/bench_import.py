@@ -0,0 +1,91 @@
+"""Temps d'import du SDK et surcoût par appel de la construction des requêtes
+
+Usage : python -m benchmarks.bench_import [--runs 20]
+
+Le temps d'import est mesuré dans des interpréteurs neufs, comme au
+démarrage à froid d'un worker, en retranchant le temps de démarrage d'un
+interpréteur vide.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+# Dépendances qui ne doivent être importées qu'à la première requête
+HEAVY_MODULES = ('requests', 'urllib3', 'inflection', 'asyncio', 'httpx', 'concurrent.futures')
+
+
+def _interpreter_time(code, runs):
+    """Durée médiane d'exécution de `code` dans un nouvel interpréteur"""
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        durations.append(time.perf_counter() - started_at)
+    return statistics.median(durations)
+
+
+def import_time(runs=20):
+    """Retourne le temps médian de `import tassi`, en secondes"""
+    baseline = _interpreter_time('pass', runs)
+    return max(0.0, _interpreter_time('import tassi', runs) - baseline)
+
+
+def loaded_modules():
+    """Retourne les dépendances lourdes chargées par `import tassi`"""
+    code = (
+        "import sys, json, tassi; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def call_overhead(number=100000):
+    """Retourne le coût moyen, en microsecondes, de la construction d'une requête"""
+    from tassi import Tassi, Package, Requestor
+
+    Tassi.set_api_key('bench_api_key')
+    requestor = Requestor()
+    package = Package(4)
+
+    cases = {
+        'class_path': Package.class_path,
+        'resource_path': lambda: Package.resource_path(4),
+        'instance_url': package.instance_url,
+        'default_headers': requestor._default_headers,
+        'url': lambda: requestor._url('/packages/4')
+    }
+    return {
+        name: timeit.timeit(func, number=number) / number * 1e6
+        for name, func in cases.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--output', help="fichier JSON où enregistrer les résultats")
+    args = parser.parse_args()
+
+    report = {
+        'import_seconds': import_time(args.runs),
+        'heavy_modules_loaded': loaded_modules(),
+        'call_overhead_us': call_overhead()
+    }
+
+    print(f"import tassi : {report['import_seconds'] * 1000:.1f} ms")
+    print(f"dépendances chargées à l'import : {', '.join(report['heavy_modules_loaded']) or 'aucune'}")
+    for name, micros in report['call_overhead_us'].items():
+        print(f"{name:>16}: {micros:8.3f} µs")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Mémoire occupée par une grande liste convertie, selon le mode de conversion
+
+Usage : python -m benchmarks.bench_memory [--items 50000]
+"""
+import argparse
+import gc
+import tracemalloc
+from tassi.util import array_to_tassi_object
+
+
+def make_package(i):
+    """Construit un package tel que retourné par l'API"""
+    return {
+        "id": i,
+        "tracking_number": f"tassi_TRK_{i:016X}",
+        "status": "in_transit",
+        "description": "Colis test contenant accessoires électroniques",
+        "weight": "5.0",
+        "dimensions": "10x10x10",
+        "declared_value": "100.0",
+        "currency": "USD",
+        "insurance": False,
+        "signature_required": True,
+        "customer": {"first_name": "Doe", "last_name": "Jane", "city": "Cotonou"}
+    }
+
+
+def make_payload(items):
+    """Construit une réponse Package.all de `items` packages"""
+    return {
+        "packages": [make_package(i) for i in range(items)],
+        "meta": {"current_page": 1, "total_count": items}
+    }
+
+
+def measure(payload, mode):
+    """Retourne (mémoire retenue, pic) en octets pour la conversion du payload
+
+    Le payload brut n'est pas compté : il est alloué avant la mesure. En
+    mode 'lazy', les objets retenus gardent une référence sur lui.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = array_to_tassi_object(payload, {}, mode=mode)
+    # Lire un champ de chaque élément, comme un traitement typique
+    for package in result.packages:
+        package.status
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def run(items=50000):
+    """Mesure chaque mode et retourne les résultats"""
+    payload = make_payload(items)
+    results = {}
+    for mode in ('eager', 'lazy', 'compact'):
+        current, peak = measure(payload, mode)
+        results[mode] = {'retained_bytes': current, 'peak_bytes': peak}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=50000)
+    args = parser.parse_args()
+
+    results = run(args.items)
+    baseline = results['eager']['retained_bytes']
+    print(f"{args.items} packages")
+    for mode, result in results.items():
+        retained = result['retained_bytes']
+        print(
+            f"{mode:>8}: {retained / 2 ** 20:8.1f} MiB retenus "
+            f"({retained / baseline:6.1%} de eager), pic {result['peak_bytes'] / 2 ** 20:8.1f} MiB"
+        )
+
+
+if __name__ == '__main__':
+    main()
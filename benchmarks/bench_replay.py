@@ -0,0 +1,122 @@
+"""Rejeu hors ligne d'un trafic enregistré (cassette) à travers le SDK
+
+Usage :
+    python -m benchmarks.bench_replay traffic.jsonl.gz [--latency 1] [--speed 1] [--threads 16]
+
+Chaque requête de la cassette est relancée via `Requestor.request` à son
+décalage d'origine divisé par `--speed` (0 : toutes d'un coup), les
+réponses étant servies par `ReplayAdapter` avec la durée enregistrée
+multipliée par `--latency`. Le rapport donne le débit et les latences
+vues par l'appelant, ainsi que le surcoût du SDK par rapport à la durée
+servie.
+
+Pour enregistrer une cassette :
+
+    Resource.set_requestor(Requestor(adapter=RecordAdapter("traffic.jsonl.gz")))
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+from tassi import Requestor
+from tassi.cassette import ReplayAdapter, load_cassette
+from tassi.retry import RetryPolicy
+
+
+def _percentile(values, fraction):
+    """Percentile d'une liste triée"""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def _call(interaction, codec):
+    """Retourne la méthode, le chemin et les paramètres d'un échange enregistré"""
+    parts = urlsplit(interaction['url'])
+    if interaction.get('request_body') and interaction.get('request_encoding') is None:
+        params = codec.loads(interaction['request_body'])
+    else:
+        params = dict(parse_qsl(parts.query)) or None
+    return interaction['method'].lower(), parts.path, params
+
+
+def replay(path, latency=1.0, speed=1.0, threads=16):
+    """Rejoue une cassette et retourne le rapport"""
+    interactions = load_cassette(path)
+    requestor = Requestor(
+        adapter=ReplayAdapter(path, latency=latency),
+        api_base='http://replay.invalid',
+        api_key='replay_api_key',
+        coalesce_gets=False,
+        retry_policy=RetryPolicy(max_retries=0)
+    )
+    lock = threading.Lock()
+    durations = []
+    served = []
+    errors = []
+
+    def run(interaction, start):
+        method, path, params = _call(interaction, requestor.codec)
+        if speed:
+            delay = start + interaction.get('offset', 0.0) / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        started_at = time.perf_counter()
+        try:
+            requestor.request(method, path, params)
+        except Exception as e:
+            with lock:
+                errors.append(type(e).__name__)
+        duration = time.perf_counter() - started_at
+        with lock:
+            durations.append(duration)
+            served.append(interaction.get('elapsed', 0.0) * latency)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda interaction: run(interaction, started_at), interactions))
+    seconds = time.perf_counter() - started_at
+    requestor.close()
+
+    ordered = sorted(durations)
+    overhead = [duration - expected for duration, expected in zip(durations, served)]
+    return {
+        'requests': len(interactions),
+        'errors': len(errors),
+        'seconds': seconds,
+        'ops_per_sec': len(interactions) / seconds if seconds else None,
+        'p50': _percentile(ordered, 0.5),
+        'p95': _percentile(ordered, 0.95),
+        'p99': _percentile(ordered, 0.99),
+        'sdk_overhead_mean': statistics.mean(overhead) if overhead else None
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('cassette', help="cassette enregistrée avec RecordAdapter")
+    parser.add_argument('--latency', type=float, default=1.0,
+                        help="facteur appliqué aux durées enregistrées (0 : pleine vitesse)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="accélération du rythme d'arrivée (0 : toutes les requêtes d'un coup)")
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--output', help="fichier JSON où enregistrer les résultats")
+    args = parser.parse_args(argv)
+
+    report = replay(args.cassette, latency=args.latency, speed=args.speed, threads=args.threads)
+    print(f"{report['requests']} requêtes ({report['errors']} erreurs) en {report['seconds']:.2f} s, "
+          f"{report['ops_per_sec']:.0f} req/s")
+    for name in ('p50', 'p95', 'p99', 'sdk_overhead_mean'):
+        print(f"{name:>18}: {report[name] * 1000:8.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""Benchmarks de performance du SDK contre un serveur local simulé
+
+Usage :
+    python -m benchmarks.bench_suite [--output results.json]
+    python -m benchmarks.bench_suite --compare baseline.json [--threshold 0.25]
+
+Avec `--compare`, le code de sortie vaut 1 si un benchmark est plus lent
+que la référence au-delà du seuil, ce qui permet de détecter les
+régressions en CI.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tassi import Tassi, Requestor, Package, Shipment
+from tassi.retry import RetryPolicy
+from tassi.util import array_to_tassi_object
+from .bench_memory import make_package, make_payload
+from .stub_server import H2StubServer, StubServer
+
+# Tailles par défaut ; `--quick` les divise par 10
+DEFAULTS = {
+    'requests': 2000,
+    'threads': 8,
+    'items': 20000,
+    'total_count': 5000,
+    'per_page': 100,
+    'bulk': 500,
+    'latency': 0.0,
+    'padding': 0,
+    'repeat': 3
+}
+
+
+def _best_of(repeat, func):
+    """Retourne la meilleure durée de `func()` sur `repeat` exécutions"""
+    best = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_requestor_throughput(server, config, http2=False):
+    """GET /packages/<id> depuis plusieurs threads sur un même requestor"""
+    if http2:
+        from tassi.http2 import Http2Adapter
+
+        requestor = Requestor(coalesce_gets=False, adapter=Http2Adapter(max_connections=1, http1=False))
+    else:
+        requestor = Requestor(pool_maxsize=config['threads'], coalesce_gets=False)
+    count = config['requests']
+
+    def run():
+        with ThreadPoolExecutor(max_workers=config['threads']) as executor:
+            list(executor.map(lambda i: requestor.request('get', f'/packages/{i}'), range(count)))
+
+    seconds = _best_of(config['repeat'], run)
+    requestor.close()
+    return {'seconds': seconds, 'ops': count}
+
+
+def bench_conversion(config, mode):
+    """array_to_tassi_object sur une grande liste, puis lecture d'un champ par élément"""
+    payload = make_payload(config['items'])
+
+    def run():
+        for package in array_to_tassi_object(payload, {}, mode=mode).packages:
+            package.status
+
+    seconds = _best_of(config['repeat'], run)
+    return {'seconds': seconds, 'ops': config['items']}
+
+
+def bench_pagination(server, config, prefetch=False, stream=False):
+    """Package.iter_all sur toute la liste"""
+    params = {'per_page': config['per_page']}
+
+    def run():
+        for _ in Package.iter_all(params, prefetch=prefetch, stream=stream):
+            pass
+
+    seconds = _best_of(config['repeat'], run)
+    return {'seconds': seconds, 'ops': server.total_count}
+
+
+def bench_bulk(server, config):
+    """Shipment.create_many, chaque expédition contenant cinq packages (~1,9 Ko)"""
+    params_list = [
+        {'marketplace_id': '1', 'packages': [make_package(i * 5 + k) for k in range(5)]}
+        for i in range(config['bulk'])
+    ]
+
+    def run():
+        result = Shipment.create_many(params_list, max_workers=config['threads'])
+        if not result.ok:
+            raise RuntimeError(f"{len(result.failed)} shipments failed")
+
+    seconds = _best_of(config['repeat'], run)
+    return {'seconds': seconds, 'ops': config['bulk']}
+
+
+def _measure_bytes(server, config, bench):
+    """Exécute `bench()` et ajoute au résultat les octets des corps échangés par exécution"""
+    server.reset_bytes()
+    result = bench()
+    result['wire_bytes'] = server.wire_bytes // config['repeat']
+    result['body_bytes'] = server.body_bytes // config['repeat']
+    return result
+
+
+def run(config=None):
+    """Exécute tous les benchmarks et retourne les résultats"""
+    config = {**DEFAULTS, **(config or {})}
+    results = {}
+
+    for mode in ('eager', 'lazy', 'compact'):
+        results[f'conversion_{mode}'] = bench_conversion(config, mode)
+
+    server = StubServer(
+        latency=config['latency'],
+        total_count=config['total_count'],
+        per_page=config['per_page'],
+        padding=config['padding']
+    )
+    previous = (Tassi.get_api_base(), Tassi.get_api_key())
+    with server:
+        Tassi.set_api_base(server.url)
+        Tassi.set_api_key('bench_api_key')
+        Package.set_requestor(Requestor(pool_maxsize=config['threads']))
+        Shipment.set_requestor(Requestor(
+            pool_maxsize=config['threads'],
+            retry_policy=RetryPolicy(max_retries=0)
+        ))
+        try:
+            results['requestor_throughput'] = bench_requestor_throughput(server, config)
+            results['pagination'] = _measure_bytes(
+                server, config, lambda: bench_pagination(server, config, prefetch=False)
+            )
+            results['pagination_prefetch'] = bench_pagination(server, config, prefetch=True)
+            results['pagination_stream'] = bench_pagination(server, config, stream=True)
+            results['bulk_create'] = _measure_bytes(server, config, lambda: bench_bulk(server, config))
+        finally:
+            Package.set_requestor(None)
+            Shipment.set_requestor(None)
+            Tassi.set_api_base(previous[0])
+            Tassi.set_api_key(previous[1])
+
+    # Mêmes parcours avec réponses gzip et corps de requête compressés
+    server = StubServer(
+        latency=config['latency'],
+        total_count=config['total_count'],
+        per_page=config['per_page'],
+        padding=config['padding'],
+        compress=True
+    )
+    with server:
+        Tassi.set_api_base(server.url)
+        Tassi.set_api_key('bench_api_key')
+        Package.set_requestor(Requestor(pool_maxsize=config['threads']))
+        Shipment.set_requestor(Requestor(
+            pool_maxsize=config['threads'],
+            retry_policy=RetryPolicy(max_retries=0),
+            compression='gzip'
+        ))
+        try:
+            results['pagination_compressed'] = _measure_bytes(
+                server, config, lambda: bench_pagination(server, config)
+            )
+            results['bulk_create_compressed'] = _measure_bytes(
+                server, config, lambda: bench_bulk(server, config)
+            )
+        finally:
+            Package.set_requestor(None)
+            Shipment.set_requestor(None)
+            Tassi.set_api_base(previous[0])
+            Tassi.set_api_key(previous[1])
+
+    with H2StubServer(latency=config['latency']) as server:
+        Tassi.set_api_base(server.url)
+        try:
+            results['requestor_throughput_http2'] = bench_requestor_throughput(server, config, http2=True)
+        finally:
+            Tassi.set_api_base(previous[0])
+
+    for result in results.values():
+        result['ops_per_sec'] = result['ops'] / result['seconds'] if result['seconds'] else None
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'config': config,
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold, min_seconds=0.005):
+    """Retourne les benchmarks plus lents que la référence au-delà du seuil
+
+    Chaque régression est un tuple (nom, durée de référence, durée actuelle).
+    Les écarts de moins de `min_seconds`, dominés par le bruit, sont ignorés.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline.get('results', {}).get(name)
+        if not reference or not reference.get('seconds'):
+            continue
+        if result['seconds'] - reference['seconds'] < min_seconds:
+            continue
+        if result['seconds'] > reference['seconds'] * (1 + threshold):
+            regressions.append((name, reference['seconds'], result['seconds']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help="fichier JSON où enregistrer les résultats")
+    parser.add_argument('--compare', help="résultats de référence (JSON)")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="ralentissement toléré par rapport à la référence (0.25 = 25 %%)")
+    parser.add_argument('--quick', action='store_true', help="tailles réduites")
+    for name, default in DEFAULTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=None)
+    args = parser.parse_args(argv)
+
+    config = dict(DEFAULTS)
+    if args.quick:
+        for name in ('requests', 'items', 'total_count', 'bulk'):
+            config[name] //= 10
+    for name in DEFAULTS:
+        value = getattr(args, name)
+        if value is not None:
+            config[name] = value
+
+    report = run(config)
+    for name, result in report['results'].items():
+        line = f"{name:>26}: {result['seconds'] * 1000:9.1f} ms  {result['ops_per_sec']:12.0f} ops/s"
+        if 'wire_bytes' in result:
+            line += f"  {result['wire_bytes'] / 1024:10.1f} Kio transmis ({result['body_bytes'] / 1024:.1f} Kio décompressés)"
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.threshold)
+        for name, reference, seconds in regressions:
+            print(f"REGRESSION {name}: {reference * 1000:.1f} ms -> {seconds * 1000:.1f} ms")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""Serveur HTTP local simulant l'API Tassi pour les benchmarks
+
+Le serveur tourne dans un thread du processus courant et répond sur
+127.0.0.1, en HTTP/1.1 (`StubServer`) ou en HTTP/2 (`H2StubServer`), avec
+une latence et une taille de réponse configurables :
+
+- `GET /packages?page=N&per_page=M` : page de packages avec métadonnées
+- `GET /packages/<id>` : un package
+- `POST /shipments` : l'expédition créée, avec les paramètres reçus
+
+Le serveur HTTP/1.1 décompresse les corps de requête gzip et, avec
+`compress=True`, compresse ses réponses en gzip pour les clients qui
+l'acceptent. `wire_bytes` et `body_bytes` comptent les octets des corps
+échangés, respectivement tels que transmis et une fois décompressés.
+"""
+import gzip
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import BaseRequestHandler
+from urllib.parse import parse_qs, urlsplit
+from .bench_memory import make_package
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Gestionnaire HTTP/1.1 des requêtes du serveur simulé"""
+
+    # Keep-alive, comme l'API réelle
+    protocol_version = 'HTTP/1.1'
+    # Sans quoi l'envoi séparé des en-têtes et du corps subit l'ACK retardé
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._reply(*self.server.handle('GET', self.path, b''))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        self.server.count_bytes(length, len(body))
+        self._reply(*self.server.handle('POST', self.path, body))
+
+    def _reply(self, status, data):
+        body = json.dumps(data).encode()
+        size = len(body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if self.server.compress and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        # Compté avant l'envoi : le client peut avoir fini dès la réponse reçue
+        self.server.count_bytes(len(body), size)
+        self.wfile.write(body)
+
+
+class _H2Handler(BaseRequestHandler):
+    """Gestionnaire HTTP/2 (h2c, sans négociation) d'une connexion
+
+    Chaque flux est traité dans son propre thread : les requêtes
+    multiplexées sur la connexion sont servies simultanément.
+    """
+
+    def handle(self):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        sock = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding='utf-8')
+        )
+        self.lock = threading.Lock()
+        self.pending = {}
+        streams = {}
+
+        with self.server.lock:
+            self.server.connections += 1
+
+        with self.lock:
+            self.conn.initiate_connection()
+            self._flush()
+
+        while True:
+            try:
+                data = sock.recv(65535)
+            except OSError:
+                return
+            if not data:
+                return
+
+            with self.lock:
+                events = self.conn.receive_data(data)
+
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    streams[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    streams[event.stream_id][1].extend(event.data)
+                    with self.lock:
+                        self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = streams.pop(event.stream_id)
+                    threading.Thread(
+                        target=self._respond,
+                        args=(event.stream_id, headers, bytes(body)),
+                        daemon=True
+                    ).start()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+
+            with self.lock:
+                self._flush()
+
+    def _respond(self, stream_id, headers, body):
+        """Traite une requête et envoie sa réponse sur le flux"""
+        import h2.exceptions
+
+        status, data = self.server.handle(headers[':method'], headers[':path'], body)
+        payload = json.dumps(data).encode()
+
+        with self.lock:
+            try:
+                self.conn.send_headers(stream_id, [
+                    (':status', str(status)),
+                    ('content-type', 'application/json'),
+                    ('content-length', str(len(payload)))
+                ])
+            except h2.exceptions.StreamClosedError:
+                return
+            self.pending[stream_id] = payload
+            self._flush()
+
+    def _flush(self):
+        """Envoie les corps en attente dans la limite des fenêtres de contrôle de flux"""
+        for stream_id, payload in list(self.pending.items()):
+            while payload:
+                size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                if size <= 0:
+                    break
+                self.conn.send_data(stream_id, payload[:size])
+                payload = payload[size:]
+
+            if payload:
+                self.pending[stream_id] = payload
+            else:
+                del self.pending[stream_id]
+                self.conn.end_stream(stream_id)
+
+        data = self.conn.data_to_send()
+        if data:
+            try:
+                self.request.sendall(data)
+            except OSError:
+                pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Serveur simulé de l'API Tassi
+
+    - `latency` : délai ajouté à chaque réponse, en secondes
+    - `total_count` : nombre de packages de la liste paginée
+    - `per_page` : taille de page par défaut
+    - `padding` : octets ajoutés à chaque package (champ `notes`), pour
+      faire varier la taille des réponses
+    - `compress` : compresse les réponses en gzip (HTTP/1.1 uniquement)
+    """
+
+    daemon_threads = True
+    handler_class = _Handler
+
+    def __init__(self, latency=0.0, total_count=1000, per_page=100, padding=0, compress=False):
+        super().__init__(('127.0.0.1', 0), self.handler_class)
+        self.latency = latency
+        self.total_count = total_count
+        self.per_page = per_page
+        self.padding = padding
+        self.compress = compress
+        self.created = 0
+        self.connections = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.lock = threading.Lock()
+        self._pages = {}
+        self._thread = None
+
+    @property
+    def url(self):
+        """URL de base du serveur"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, method, target, body):
+        """Traite une requête et retourne (statut, données)"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(target)
+        parts = url.path.strip('/').split('/')
+
+        if method == 'GET' and parts == ['packages']:
+            query = parse_qs(url.query)
+            page = int(query.get('page', ['1'])[0])
+            per_page = int(query.get('per_page', [str(self.per_page)])[0])
+            return 200, self.list_page(page, per_page)
+
+        if method == 'GET' and len(parts) == 2 and parts[0] == 'packages':
+            return 200, {'package': self.package(int(parts[1]))}
+
+        if method == 'POST' and parts == ['shipments']:
+            params = json.loads(body or b'{}')
+            with self.lock:
+                self.created += 1
+                shipment_id = self.created
+            return 200, {'shipment': {'id': shipment_id, **params}}
+
+        return 404, {'error': 'not found'}
+
+    def count_bytes(self, wire, body):
+        """Ajoute la taille d'un corps, transmis puis décompressé"""
+        with self.lock:
+            self.wire_bytes += wire
+            self.body_bytes += body
+
+    def reset_bytes(self):
+        """Remet à zéro les compteurs d'octets"""
+        with self.lock:
+            self.wire_bytes = 0
+            self.body_bytes = 0
+
+    def package(self, i):
+        """Retourne un package"""
+        package = make_package(i)
+        if self.padding:
+            package['notes'] = 'x' * self.padding
+        return package
+
+    def list_page(self, page, per_page):
+        """Retourne une page de la liste des packages"""
+        key = (page, per_page)
+        if key not in self._pages:
+            start = (page - 1) * per_page
+            stop = min(start + per_page, self.total_count)
+            total_pages = -(-self.total_count // per_page)
+            self._pages[key] = {
+                'packages': [self.package(i) for i in range(start, stop)],
+                'meta': {
+                    'current_page': page,
+                    'per_page': per_page,
+                    'total_pages': total_pages,
+                    'total_count': self.total_count
+                }
+            }
+        return self._pages[key]
+
+    def start(self):
+        """Démarre le serveur dans un thread d'arrière-plan"""
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            name='tassi-stub-server',
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête le serveur"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class H2StubServer(StubServer):
+    """Serveur simulé de l'API Tassi parlant HTTP/2 sans TLS (h2c)
+
+    À utiliser avec `Http2Adapter(http1=False)`. `connections` compte les
+    connexions TCP ouvertes par les clients.
+    """
+
+    handler_class = _H2Handler
@@ -20,10 +20,23 @@ setuptools.setup(
         "inflection>=0.5.0"
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0"
+        ],
+        "fast": [
+            "orjson>=3.6.0"
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0"
+        ],
+        "brotli": [
+            "brotli>=1.0.9"
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.10.0",
             "responses>=0.18.0",
+            "httpx[http2]>=0.23.0",
             "black>=21.0.0",
             "flake8>=3.8.0"
         ]
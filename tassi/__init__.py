@@ -6,9 +6,10 @@ Un SDK Python pour interagir avec l'API Tassi.
 """
 
 from .tassi import Tassi
-from .tassi_object import TassiObject
+from .tassi_object import TassiObject, TassiRecord
 from .resource import Resource
 from .requestor import Requestor
+from .async_requestor import AsyncRequestor
 from .package import Package
 from .shipment import Shipment
 from .marketplace import Marketplace
@@ -18,9 +19,22 @@ from .error import (
     ApiConnectionError,
     AuthenticationError,
     NotFoundError,
-    ValidationError
+    ValidationError,
+    CircuitOpenError,
+    CassetteError,
+    ChecksumMismatchError
 )
 from .util import array_to_tassi_object
+from .bulk import BulkItemResult, BulkResult
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .tracking import TrackingWatcher
+from .hooks import RequestInfo
+from .metrics import MetricsCollector
+from .ratelimit import RateLimiter, MemoryBackend, FileBackend
+from .circuit import CircuitBreaker
+from .sync import SyncResult, MemoryCheckpointStore, FileCheckpointStore, SqliteCheckpointStore
+from .client import TassiClient
 
 __version__ = "1.0.0"
 __author__ = "Tassi Team"
@@ -29,8 +43,10 @@ __email__ = "dev@tassi.com"
 __all__ = [
     "Tassi",
     "TassiObject",
+    "TassiRecord",
     "Resource",
     "Requestor",
+    "AsyncRequestor",
     "Package",
     "Shipment",
     "Marketplace",
@@ -40,5 +56,24 @@ __all__ = [
     "AuthenticationError",
     "NotFoundError",
     "ValidationError",
-    "array_to_tassi_object"
+    "CircuitOpenError",
+    "CassetteError",
+    "ChecksumMismatchError",
+    "array_to_tassi_object",
+    "BulkItemResult",
+    "BulkResult",
+    "RetryPolicy",
+    "ResponseCache",
+    "TrackingWatcher",
+    "RequestInfo",
+    "MetricsCollector",
+    "RateLimiter",
+    "MemoryBackend",
+    "FileBackend",
+    "CircuitBreaker",
+    "SyncResult",
+    "MemoryCheckpointStore",
+    "FileCheckpointStore",
+    "SqliteCheckpointStore",
+    "TassiClient"
 ]
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""Gestionnaire asynchrone des requêtes HTTP"""
+import time
+from .error import ApiConnectionError
+from .compression import DEFAULT_THRESHOLD
+from .requestor import Requestor
+from .retry import with_idempotency_key
+from .singleflight import AsyncSingleFlight
+from .hooks import RequestInfo
+
+
+class AsyncRequestor(Requestor):
+    """Requestor asyncio basé sur httpx.AsyncClient
+
+    Un seul client (et donc un seul pool de connexions) est partagé par
+    toutes les requêtes du requestor. Le client est créé au premier appel,
+    il doit donc être utilisé depuis une seule boucle d'événements.
+
+    Les options `retry_policy`, `json_codec`, `coalesce_gets`,
+    `rate_limiter`, `circuit_breaker`, `compression` et de configuration (`api_key`, `api_base`,
+    `environment`, `verify_ssl_certs`) ainsi que les hooks se comportent
+    comme pour `Requestor`.
+    """
+
+    def __init__(self, client=None, max_connections=100, max_keepalive_connections=20,
+                 timeout=None, retry_policy=None, json_codec=None, coalesce_gets=True,
+                 rate_limiter=None, api_key=None, api_base=None, environment=None,
+                 verify_ssl_certs=None, circuit_breaker=None, compression=None,
+                 compression_threshold=DEFAULT_THRESHOLD):
+        super().__init__(
+            retry_policy=retry_policy,
+            json_codec=json_codec,
+            coalesce_gets=coalesce_gets,
+            rate_limiter=rate_limiter,
+            api_key=api_key,
+            api_base=api_base,
+            environment=environment,
+            verify_ssl_certs=verify_ssl_certs,
+            circuit_breaker=circuit_breaker,
+            compression=compression,
+            compression_threshold=compression_threshold
+        )
+        self._single_flight = AsyncSingleFlight()
+        self._client = client
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+
+    def _get_client(self):
+        """Retourne le client httpx, créé à la demande"""
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "AsyncRequestor requires httpx. Install it with: pip install tassi[async]"
+                )
+
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                timeout=self.timeout,
+                verify=self.get_verify_ssl_certs()
+            )
+        return self._client
+
+    async def request(self, method, path, params=None, headers=None):
+        """Effectue une requête HTTP asynchrone"""
+        url = self._url(path)
+        request_headers = {**self._default_headers(), **(headers or {})}
+        with_idempotency_key(method, request_headers)
+
+        if self.coalesce_gets and method.upper() == 'GET':
+            key = self._coalesce_key(method, url, params, request_headers)
+            result, shared = await self._single_flight.do(
+                key,
+                lambda: self._request(method, path, url, params, request_headers)
+            )
+            return dict(result) if shared else result
+
+        return await self._request(method, path, url, params, request_headers)
+
+    async def _request(self, method, path, url, params, headers):
+        """Effectue la requête en réessayant les erreurs transitoires"""
+        import asyncio
+        import httpx
+
+        body = None if self._is_query_method(method) else self._encode(params)
+        body, headers = self._compress(body, headers)
+        info = RequestInfo(method, url, path, params, headers, len(body or b''))
+        started_at = time.monotonic()
+
+        while True:
+            info.start_attempt()
+            probe = self._before_call(info)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(info.method, info.path_template)
+                self.hooks.run('before_request', info)
+                attempt_started_at = time.monotonic()
+                try:
+                    timeout = self.retry_policy.timeout_for(started_at)
+                    response = await self._send(method, url, params, body, headers, timeout)
+                    info.status = response.status_code
+                    info.elapsed = time.monotonic() - attempt_started_at
+                    info.bytes_in = len(response.content)
+                    self._record_call(info)
+                    probe = False
+                    self._check_rate_limited(info, response)
+                    self.hooks.run('after_response', info, response)
+
+                    # Comme requests, seules les réponses 4xx et 5xx sont des erreurs
+                    if response.is_error:
+                        response.raise_for_status()
+
+                    return {
+                        'data': self._decode(response),
+                        'options': {
+                            'environment': self.get_environment()
+                        },
+                        'status': response.status_code,
+                        'headers': response.headers
+                    }
+                except httpx.HTTPError as e:
+                    if info.elapsed is None:
+                        info.elapsed = time.monotonic() - attempt_started_at
+                    if info.status is None:
+                        self._record_call(info)
+                    probe = False
+                    info.error = e
+                    self.hooks.run('on_error', info, e)
+
+                    delay = self._async_retry_delay(e, info.attempt, started_at)
+                    if delay is None:
+                        self._handle_async_exception(e)
+            finally:
+                if probe:
+                    # Tentative abandonnée sans résultat (annulation, délai) : la place de test est rendue
+                    self.circuit_breaker.release(info.method, info.path_template)
+
+            await asyncio.sleep(delay)
+            info.attempt += 1
+
+    async def _send(self, method, url, params, body, headers, timeout=None):
+        """Envoie une requête sur le client partagé
+
+        Sans `timeout`, le délai configuré sur le client s'applique.
+        """
+        client = self._get_client()
+        options = {} if timeout is None else {'timeout': timeout}
+
+        if self._is_query_method(method):
+            return await client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                **options
+            )
+
+        return await client.request(
+            method,
+            url,
+            content=body,
+            headers=headers,
+            **options
+        )
+
+    def _async_retry_delay(self, e, attempt, started_at):
+        """Retourne le délai avant une nouvelle tentative, ou None"""
+        import httpx
+
+        if isinstance(e, httpx.HTTPStatusError):
+            return self.retry_policy.next_delay(
+                attempt,
+                started_at,
+                status=e.response.status_code,
+                retry_after=e.response.headers.get('Retry-After')
+            )
+
+        if isinstance(e, httpx.TransportError):
+            return self.retry_policy.next_delay(attempt, started_at)
+
+        return None
+
+    async def aclose(self):
+        """Ferme le client et libère les connexions"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _handle_async_exception(self, e):
+        """Gère les exceptions httpx"""
+        message = f"Request error: {str(e)}"
+        http_response = getattr(e, 'response', None)
+        http_status = http_response.status_code if http_response is not None else None
+        try:
+            http_request = e.request
+        except RuntimeError:
+            http_request = None
+
+        raise ApiConnectionError(
+            message,
+            http_status=http_status,
+            http_request=http_request,
+            http_response=http_response
+        )
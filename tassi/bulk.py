@@ -0,0 +1,118 @@
+"""Exécution concurrente des opérations groupées"""
+from collections import deque
+from .error import TassiError, ApiConnectionError
+from .retry import RETRYABLE_STATUSES
+
+
+class BulkItemResult:
+    """Résultat d'une opération unitaire au sein d'un lot"""
+
+    def __init__(self, key, result=None, error=None):
+        self.key = key
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        """Indique si l'opération a réussi"""
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"<{self.__class__.__name__} key={self.key!r} {status}>"
+
+
+class BulkResult:
+    """Bilan d'un lot : succès, échecs définitifs et erreurs réessayables"""
+
+    def __init__(self):
+        self.succeeded = []
+        self.failed = []
+        self.retryable = []
+
+    def add(self, item):
+        """Classe le résultat d'une opération"""
+        if item.ok:
+            self.succeeded.append(item)
+        elif is_retryable_error(item.error):
+            self.retryable.append(item)
+        else:
+            self.failed.append(item)
+
+    def sort(self):
+        """Trie chaque liste par clé"""
+        for items in (self.succeeded, self.failed, self.retryable):
+            items.sort(key=lambda item: item.key)
+
+    @property
+    def ok(self):
+        """Indique si toutes les opérations ont réussi"""
+        return not self.failed and not self.retryable
+
+    def __len__(self):
+        return len(self.succeeded) + len(self.failed) + len(self.retryable)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} succeeded={len(self.succeeded)} "
+            f"failed={len(self.failed)} retryable={len(self.retryable)}>"
+        )
+
+
+def is_retryable_error(error):
+    """Indique si l'erreur est transitoire (connexion, 429 ou 5xx)"""
+    if not isinstance(error, ApiConnectionError):
+        return False
+    return error.http_status is None or error.http_status in RETRYABLE_STATUSES
+
+
+def run_concurrently(func, items, max_workers=8, ordered=True, key=None):
+    """Applique `func` à chaque élément avec au plus `max_workers` appels simultanés
+
+    Génère un `BulkItemResult` par élément, dans l'ordre d'entrée si
+    `ordered` est vrai, sinon dans l'ordre de fin. Les erreurs Tassi sont
+    rapportées dans le résultat sans interrompre le lot. Le nombre de
+    tâches en attente est borné, les entrées sont donc consommées au fur
+    et à mesure. `key(item)` détermine la clé de chaque résultat (par
+    défaut l'élément lui-même).
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def call(item):
+        item_key = key(item) if key is not None else item
+        try:
+            return BulkItemResult(item_key, result=func(item))
+        except TassiError as e:
+            return BulkItemResult(item_key, error=e)
+
+    window = max_workers * 2
+    iterator = iter(items)
+
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque() if ordered else set()
+
+        def fill():
+            while len(pending) < window:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                future = executor.submit(call, item)
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+
+        fill()
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    yield future.result()
+            fill()
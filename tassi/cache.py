@@ -0,0 +1,92 @@
+"""Cache des réponses des requêtes de récupération"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry:
+    """Réponse mise en cache"""
+
+    def __init__(self, response, etag, expires_at):
+        self.response = response
+        self.etag = etag
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self):
+        """Indique si l'entrée peut être servie sans revalidation"""
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """Cache LRU à durée de vie limitée, thread-safe
+
+    - `ttl` : durée (en secondes) pendant laquelle une réponse est servie
+      sans requête réseau
+    - `maxsize` : nombre maximal d'entrées ; les moins récemment utilisées
+      sont évincées
+
+    Une entrée expirée est conservée tant qu'elle porte un ETag : la requête
+    suivante est alors envoyée avec `If-None-Match`, et une réponse 304
+    prolonge l'entrée sans retransférer le corps.
+    """
+
+    def __init__(self, ttl=60.0, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Retourne l'entrée (fraîche ou non) associée à la clé"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.fresh and not entry.etag:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def version(self):
+        """Retourne le numéro de version du cache, incrémenté à chaque invalidation"""
+        with self._lock:
+            return self._generation
+
+    def set(self, key, response, etag=None, version=None):
+        """Met une réponse en cache
+
+        Si `version` est fourni et qu'une invalidation a eu lieu depuis, la
+        réponse est ignorée : elle a pu être lue avant une modification.
+        """
+        with self._lock:
+            if version is not None and self._generation != version:
+                return
+            self._entries[key] = CacheEntry(response, etag, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def touch(self, key):
+        """Prolonge une entrée revalidée par le serveur"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self, key):
+        """Supprime l'entrée associée à la clé"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,198 @@
+"""Enregistrement et rejeu des échanges HTTP"""
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from .error import CassetteError
+
+# En-têtes qui décrivent le transport du corps enregistré, pas son contenu
+_TRANSPORT_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def _open(path, mode):
+    """Ouvre une cassette, compressée en gzip si le chemin se termine par .gz"""
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _encode_body(body):
+    """Encode un corps pour la cassette : texte si possible, base64 sinon"""
+    if body is None:
+        return None, None
+    if isinstance(body, str):
+        return body, None
+    try:
+        return body.decode('utf-8'), None
+    except UnicodeDecodeError:
+        return base64.b64encode(body).decode('ascii'), 'base64'
+
+
+def _decode_body(body, encoding):
+    """Décode un corps de la cassette"""
+    if body is None:
+        return b''
+    if encoding == 'base64':
+        return base64.b64decode(body)
+    return body.encode('utf-8')
+
+
+def load_cassette(path):
+    """Retourne la liste des échanges d'une cassette, dans l'ordre d'enregistrement"""
+    with _open(path, 'r') as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def interaction_key(method, url, body):
+    """Clé de correspondance d'une requête : méthode, chemin avec requête et corps
+
+    L'hôte est ignoré, une cassette enregistrée sur une URL de base peut
+    donc être rejouée sur une autre.
+    """
+    parts = urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    return (method.upper(), target, body or None)
+
+
+class RecordAdapter(BaseAdapter):
+    """Adaptateur requests qui enregistre chaque échange dans une cassette
+
+    Les requêtes passent par `adapter` (par défaut un `HTTPAdapter`) ;
+    chaque échange est ajouté, au fil de l'eau, sous forme d'une ligne JSON
+    dans le fichier `path` (compressé si le chemin se termine par `.gz`).
+    Une ligne contient la méthode, l'URL, le corps de la requête, le statut,
+    les en-têtes et le corps de la réponse, la durée de l'échange
+    (`elapsed`) et son décalage depuis le premier échange (`offset`). Les
+    en-têtes de requête, dont la clé d'API, ne sont pas enregistrés.
+
+    Les corps étant lus en entier, les téléchargements en flux sont
+    chargés en mémoire pendant l'enregistrement.
+    """
+
+    def __init__(self, path, adapter=None):
+        super().__init__()
+        self.path = path
+        self.adapter = adapter if adapter is not None else HTTPAdapter()
+        self._file = None
+        self._started_at = None
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Envoie la requête sur l'adaptateur réel et enregistre l'échange"""
+        sent_at = time.monotonic()
+        response = self.adapter.send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
+        content = response.content
+        elapsed = time.monotonic() - sent_at
+
+        request_body, request_encoding = _encode_body(request.body)
+        body, encoding = _encode_body(content)
+        interaction = {
+            'method': request.method,
+            'url': request.url,
+            'request_body': request_body,
+            'request_encoding': request_encoding,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in _TRANSPORT_HEADERS
+            },
+            'body': body,
+            'encoding': encoding,
+            'elapsed': round(elapsed, 6)
+        }
+        self._write(interaction, sent_at)
+        return response
+
+    def _write(self, interaction, sent_at):
+        """Ajoute un échange à la cassette"""
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = sent_at
+            interaction['offset'] = round(sent_at - self._started_at, 6)
+            if self._file is None:
+                self._file = _open(self.path, 'a')
+            self._file.write(json.dumps(interaction, separators=(',', ':')) + '\n')
+            self._file.flush()
+
+    def close(self):
+        """Ferme la cassette et les connexions"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Adaptateur requests qui sert les réponses d'une cassette, sans réseau
+
+    Une requête est associée aux échanges enregistrés de même méthode,
+    chemin, paramètres et corps ; les réponses d'une même requête sont
+    rejouées dans l'ordre d'enregistrement, puis en boucle si `repeat` est
+    vrai. Sinon, ou si aucun échange ne correspond, `CassetteError` est
+    levée.
+
+    `latency` multiplie la durée enregistrée de chaque échange avant de
+    rendre la réponse : 0 pour rejouer à pleine vitesse, 1 pour reproduire
+    les temps de réponse de l'API.
+    """
+
+    def __init__(self, path, latency=0.0, repeat=True):
+        super().__init__()
+        self.path = path
+        self.latency = latency
+        self.repeat = repeat
+        self.interactions = load_cassette(path)
+        self._by_key = defaultdict(list)
+        for interaction in self.interactions:
+            body = _decode_body(interaction.get('request_body'), interaction.get('request_encoding'))
+            key = interaction_key(interaction['method'], interaction['url'], body)
+            self._by_key[key].append(interaction)
+        self._positions = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _next(self, request):
+        """Retourne l'échange enregistré à servir pour la requête"""
+        key = interaction_key(request.method, request.url, request.body)
+        with self._lock:
+            recorded = self._by_key.get(key)
+            position = self._positions[key]
+            if not recorded or (position >= len(recorded) and not self.repeat):
+                raise CassetteError(f"No recorded response for {key[0]} {key[1]}")
+            self._positions[key] = position + 1
+        return recorded[position % len(recorded)]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Retourne la réponse enregistrée"""
+        interaction = self._next(request)
+        if self.latency:
+            time.sleep(interaction.get('elapsed', 0.0) * self.latency)
+
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction.get('headers') or {})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(_decode_body(interaction.get('body'), interaction.get('encoding')))
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        """Rien à libérer : aucune connexion n'est ouverte"""
+        pass
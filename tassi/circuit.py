@@ -0,0 +1,209 @@
+"""Disjoncteur par endpoint"""
+import threading
+import time
+from collections import deque
+from .error import CircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class _Circuit:
+    """État du circuit d'un endpoint"""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.calls = deque()
+        self.opened_at = None
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class CircuitBreaker:
+    """Disjoncteur par méthode et modèle de chemin (`GET /packages/{id}`)
+
+    Sur une fenêtre glissante de `window` secondes, le circuit s'ouvre dès
+    qu'au moins `minimum_calls` appels ont été faits et que la part
+    d'échecs (erreur de connexion, délai dépassé, statut 5xx ou 408)
+    atteint `failure_rate_threshold`, ou que la part d'appels plus lents
+    que `slow_call_duration` atteint `slow_call_rate_threshold`.
+
+    Tant que le circuit est ouvert, les requêtes échouent immédiatement
+    avec `CircuitOpenError`. Après `reset_timeout` secondes, le circuit
+    passe à moitié ouvert et laisse passer `half_open_max_calls` requêtes
+    de test : si elles réussissent toutes il se referme, sinon il se rouvre.
+
+    Un même disjoncteur peut être partagé par plusieurs requestors.
+    """
+
+    def __init__(self, failure_rate_threshold=0.5, slow_call_duration=None,
+                 slow_call_rate_threshold=0.5, minimum_calls=10, window=60.0,
+                 reset_timeout=30.0, half_open_max_calls=1, clock=time.monotonic):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(method, path_template):
+        """Clé du circuit d'un endpoint"""
+        return f"{method.upper()} {path_template}"
+
+    @staticmethod
+    def is_failure(status):
+        """Indique si le résultat d'un appel compte comme un échec
+
+        `status` vaut None pour une erreur de connexion. Les erreurs 4xx
+        (hors 408) sont imputables à la requête, pas à l'API.
+        """
+        return status is None or status >= 500 or status == 408
+
+    def before_call(self, method, path_template):
+        """Autorise l'appel ou lève CircuitOpenError
+
+        Retourne vrai si l'appel occupe une place de requête de test : elle
+        est libérée par `record`, ou par `release` si l'appel est abandonné
+        sans résultat.
+        """
+        endpoint = self.endpoint(method, path_template)
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.state == CLOSED:
+                return False
+
+            now = self.clock()
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Circuit open for {endpoint}, retry in {remaining:.1f}s",
+                        endpoint=endpoint,
+                        retry_after=remaining
+                    )
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+                circuit.probe_successes = 0
+
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenError(
+                    f"Circuit half-open for {endpoint}, probe in progress",
+                    endpoint=endpoint,
+                    retry_after=0.0
+                )
+            circuit.probes += 1
+            return True
+
+    def release(self, method, path_template):
+        """Libère la place d'une requête de test abandonnée (annulation, exception)"""
+        with self._lock:
+            circuit = self._circuits.get(self.endpoint(method, path_template))
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record(self, method, path_template, status, elapsed):
+        """Enregistre le résultat d'un appel"""
+        endpoint = self.endpoint(method, path_template)
+        failed = self.is_failure(status)
+        slow = self.slow_call_duration is not None and (elapsed or 0.0) > self.slow_call_duration
+
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit()
+            now = self.clock()
+
+            if circuit.state == HALF_OPEN:
+                if failed or slow:
+                    self._open(circuit, now)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_max_calls:
+                        circuit.state = CLOSED
+                        circuit.calls.clear()
+                return
+
+            if circuit.state == OPEN:
+                # Appel lancé avant l'ouverture du circuit
+                return
+
+            circuit.calls.append((now, failed, slow))
+            self._prune(circuit, now)
+
+            count = len(circuit.calls)
+            if count < self.minimum_calls:
+                return
+            failures = sum(1 for _, f, _ in circuit.calls if f)
+            slows = sum(1 for _, _, s in circuit.calls if s)
+            if (failures / count >= self.failure_rate_threshold
+                    or (self.slow_call_duration is not None
+                        and slows / count >= self.slow_call_rate_threshold)):
+                self._open(circuit, now)
+
+    def state(self, method, path_template):
+        """Retourne l'état ('closed', 'open' ou 'half_open') du circuit d'un endpoint"""
+        with self._lock:
+            circuit = self._circuits.get(self.endpoint(method, path_template))
+            if circuit is None:
+                return CLOSED
+            return self._current_state(circuit, self.clock())
+
+    def states(self):
+        """Retourne l'état de chaque endpoint connu
+
+        Par endpoint : `state`, `calls` et `failure_rate` sur la fenêtre, et
+        `retry_after` (secondes avant la prochaine requête de test) si le
+        circuit est ouvert.
+        """
+        result = {}
+        with self._lock:
+            now = self.clock()
+            for endpoint, circuit in self._circuits.items():
+                self._prune(circuit, now)
+                count = len(circuit.calls)
+                failures = sum(1 for _, f, _ in circuit.calls if f)
+                state = self._current_state(circuit, now)
+                result[endpoint] = {
+                    'state': state,
+                    'calls': count,
+                    'failure_rate': failures / count if count else 0.0,
+                    'retry_after': (
+                        max(0.0, circuit.opened_at + self.reset_timeout - now)
+                        if state == OPEN else None
+                    )
+                }
+        return result
+
+    @property
+    def healthy(self):
+        """Vrai si aucun circuit n'est ouvert"""
+        return all(info['state'] != OPEN for info in self.states().values())
+
+    def reset(self):
+        """Referme tous les circuits"""
+        with self._lock:
+            self._circuits.clear()
+
+    def _current_state(self, circuit, now):
+        """État du circuit, un circuit ouvert dont le délai est écoulé étant à moitié ouvert"""
+        if circuit.state == OPEN and now >= circuit.opened_at + self.reset_timeout:
+            return HALF_OPEN
+        return circuit.state
+
+    def _open(self, circuit, now):
+        """Ouvre le circuit"""
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.calls.clear()
+
+    def _prune(self, circuit, now):
+        """Retire les appels sortis de la fenêtre"""
+        calls = circuit.calls
+        while calls and calls[0][0] <= now - self.window:
+            calls.popleft()
@@ -0,0 +1,95 @@
+"""Client Tassi disposant de sa propre configuration"""
+from .requestor import Requestor
+from .async_requestor import AsyncRequestor
+from .package import Package
+from .shipment import Shipment
+from .marketplace import Marketplace
+
+# Options de Requestor également transmises à l'AsyncRequestor
+ASYNC_OPTIONS = (
+    'retry_policy', 'json_codec', 'coalesce_gets', 'rate_limiter', 'circuit_breaker',
+    'compression', 'compression_threshold'
+)
+
+
+class TassiClient:
+    """Client Tassi indépendant de la configuration globale `Tassi`
+
+    Chaque client possède son API key, son environnement, ses headers
+    précalculés, ses requestors (et donc ses pools de connexions) et ses
+    caches. Les ressources sont exposées comme attributs du client :
+
+        client = TassiClient("sk_marketplace_a", environment="live")
+        package = client.Package.retrieve(4)
+
+    `client.Package` est une sous-classe de `Package` liée au client ; ses
+    méthodes sont celles de `Package`. Plusieurs clients peuvent ainsi être
+    utilisés simultanément, depuis plusieurs threads, sans modifier l'état
+    global. Les options supplémentaires (`retry_policy`, `pool_maxsize`,
+    `rate_limiter`…) sont transmises au `Requestor`.
+    """
+
+    RESOURCES = (Package, Shipment, Marketplace)
+
+    def __init__(self, api_key, environment='sandbox', api_base=None, verify_ssl_certs=True,
+                 requestor=None, async_requestor=None, **requestor_options):
+        self.api_key = api_key
+        self.environment = environment
+        self.api_base = api_base
+        self.verify_ssl_certs = verify_ssl_certs
+
+        config = {
+            'api_key': api_key,
+            'api_base': api_base,
+            'environment': environment,
+            'verify_ssl_certs': verify_ssl_certs
+        }
+        if requestor is None:
+            requestor = Requestor(**config, **requestor_options)
+        if async_requestor is None:
+            async_options = {
+                key: value for key, value in requestor_options.items()
+                if key in ASYNC_OPTIONS
+            }
+            async_requestor = AsyncRequestor(**config, **async_options)
+
+        self.requestor = requestor
+        self.async_requestor = async_requestor
+
+        for resource in self.RESOURCES:
+            setattr(self, resource.__name__, self._bind(resource))
+
+    def _bind(self, resource):
+        """Crée la sous-classe de la ressource liée au client"""
+        return type(resource.__name__, (resource,), {
+            '__module__': resource.__module__,
+            '__doc__': resource.__doc__,
+            'client': self,
+            '_requestor': self.requestor,
+            '_async_requestor': self.async_requestor,
+            '_cache': None
+        })
+
+    def close(self):
+        """Ferme les connexions du requestor"""
+        self.requestor.close()
+
+    async def aclose(self):
+        """Ferme les connexions des requestors"""
+        self.requestor.close()
+        await self.async_requestor.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} environment={self.environment}>"
@@ -0,0 +1,92 @@
+"""Encodage et décodage JSON des requêtes et réponses"""
+import json
+
+
+class JsonCodec:
+    """Codec basé sur le module json de la bibliothèque standard"""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        """Encode un objet en JSON (bytes)"""
+        return json.dumps(obj, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+    def loads(self, data):
+        """Décode un document JSON (bytes ou str)"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec basé sur orjson"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj):
+        """Encode un objet en JSON (bytes)"""
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types non gérés par orjson (Decimal, ...) : repli sur json
+            return super().dumps(obj)
+
+    def loads(self, data):
+        """Décode un document JSON (bytes ou str)"""
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """Codec basé sur ujson"""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        """Encode un objet en JSON (bytes)"""
+        try:
+            return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+        except (TypeError, OverflowError):
+            return super().dumps(obj)
+
+    def loads(self, data):
+        """Décode un document JSON (bytes ou str)"""
+        return self._ujson.loads(data)
+
+
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JsonCodec,
+}
+
+# Ordre de préférence pour le mode 'auto'
+AUTO_ORDER = ('orjson', 'ujson', 'json')
+
+_instances = {}
+
+
+def get_codec(name='auto'):
+    """Retourne le codec demandé
+
+    `name` vaut 'auto' (le plus rapide disponible), 'orjson', 'ujson' ou
+    'json'. Si le module correspondant n'est pas installé, le codec de la
+    bibliothèque standard est utilisé.
+    """
+    if name not in _instances:
+        candidates = AUTO_ORDER if name == 'auto' else (name, 'json')
+        for candidate in candidates:
+            if candidate not in CODECS:
+                raise ValueError(f"Unknown JSON codec: {name}")
+            try:
+                _instances[name] = CODECS[candidate]()
+                break
+            except ImportError:
+                continue
+
+    return _instances[name]
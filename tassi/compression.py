@@ -0,0 +1,93 @@
+"""Compression des corps de requête et négociation de l'encodage des réponses"""
+
+# Taille minimale, en octets, d'un corps compressé par défaut
+DEFAULT_THRESHOLD = 1024
+
+
+class GzipCompressor:
+    """Compression gzip (bibliothèque standard)"""
+
+    name = 'gzip'
+
+    def __init__(self, level=6):
+        import gzip
+        self._gzip = gzip
+        self.level = level
+
+    def compress(self, data):
+        """Compresse un corps (bytes)"""
+        # mtime fixe : un même corps donne toujours les mêmes octets
+        return self._gzip.compress(data, compresslevel=self.level, mtime=0)
+
+
+class BrotliCompressor:
+    """Compression brotli (module brotli ou brotlicffi)"""
+
+    name = 'br'
+
+    def __init__(self, level=5):
+        self._brotli = _brotli()
+        if self._brotli is None:
+            raise ImportError("brotli is not installed")
+        self.level = level
+
+    def compress(self, data):
+        """Compresse un corps (bytes)"""
+        return self._brotli.compress(data, quality=self.level)
+
+
+COMPRESSORS = {
+    'br': BrotliCompressor,
+    'gzip': GzipCompressor,
+}
+
+# Ordre de préférence pour le mode 'auto'
+AUTO_ORDER = ('br', 'gzip')
+
+_instances = {}
+_brotli_module = []
+
+
+def _brotli():
+    """Retourne le module brotli installé (brotli ou brotlicffi), ou None"""
+    if not _brotli_module:
+        module = None
+        for name in ('brotli', 'brotlicffi'):
+            try:
+                module = __import__(name)
+                break
+            except ImportError:
+                continue
+        _brotli_module.append(module)
+    return _brotli_module[0]
+
+
+def get_compressor(name='auto'):
+    """Retourne le compresseur demandé
+
+    `name` vaut 'auto' (brotli si installé, sinon gzip), 'br' ou 'gzip'.
+    Si brotli n'est pas installé, gzip est utilisé.
+    """
+    if name not in _instances:
+        candidates = AUTO_ORDER if name == 'auto' else (name, 'gzip')
+        for candidate in candidates:
+            if candidate not in COMPRESSORS:
+                raise ValueError(f"Unknown compression: {name}")
+            try:
+                _instances[name] = COMPRESSORS[candidate]()
+                break
+            except ImportError:
+                continue
+
+    return _instances[name]
+
+
+def accept_encoding():
+    """Valeur de l'en-tête Accept-Encoding : encodages que le SDK sait décompresser
+
+    requests (via urllib3) et httpx décompressent gzip et deflate, et
+    brotli lorsque le module est installé.
+    """
+    if _brotli() is not None:
+        return 'br, gzip, deflate'
+    return 'gzip, deflate'
@@ -21,6 +21,29 @@ class ApiConnectionError(TassiError):
         self.http_response = http_response
 
 
+class CircuitOpenError(ApiConnectionError):
+    """Requête refusée sans appel réseau : le circuit de l'endpoint est ouvert"""
+
+    def __init__(self, message, endpoint=None, retry_after=None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class ChecksumMismatchError(TassiError):
+    """Le fichier téléchargé ne correspond pas à l'empreinte annoncée par l'API"""
+
+    def __init__(self, message, expected=None, actual=None):
+        super().__init__(message)
+        self.expected = expected
+        self.actual = actual
+
+
+class CassetteError(TassiError):
+    """Aucun échange enregistré ne correspond à la requête rejouée"""
+    pass
+
+
 class AuthenticationError(TassiError):
     """Erreur d'authentification"""
     pass
@@ -0,0 +1,98 @@
+"""Points d'extension du cycle de vie des requêtes"""
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = ('before_request', 'after_response', 'on_error')
+
+# Segments de chemin considérés comme des identifiants
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|[0-9a-fA-F]{16,}|tassi_[A-Za-z0-9_]+)$'
+)
+
+
+def path_template(path):
+    """Remplace les identifiants du chemin par {id}
+
+    `/packages/4/shipping_labels/1` devient `/packages/{id}/shipping_labels/{id}`,
+    ce qui permet d'agréger les mesures par endpoint.
+    """
+    path = path.split('?', 1)[0]
+    return '/'.join(
+        '{id}' if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split('/')
+    )
+
+
+class RequestInfo:
+    """Description d'une requête transmise aux hooks
+
+    Les champs `attempt`, `status`, `elapsed`, `bytes_in` et `error` sont
+    mis à jour à chaque tentative.
+    """
+
+    def __init__(self, method, url, path, params=None, headers=None, bytes_out=0, stream=False):
+        self.method = method.upper()
+        self.url = url
+        self.path = path
+        self.path_template = path_template(path)
+        self.params = params
+        self.headers = headers
+        self.bytes_out = bytes_out
+        self.stream = stream
+        self.attempt = 0
+        self.status = None
+        self.elapsed = None
+        self.bytes_in = 0
+        self.error = None
+
+    def start_attempt(self):
+        """Réinitialise les champs propres à une tentative"""
+        self.status = None
+        self.elapsed = None
+        self.bytes_in = 0
+        self.error = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.method} {self.path_template} attempt={self.attempt}>"
+
+
+class HookRegistry:
+    """Hooks enregistrés pour chaque événement
+
+    - `before_request(info)` : avant chaque tentative
+    - `after_response(info, response)` : à chaque réponse HTTP reçue, quel
+      que soit son statut
+    - `on_error(info, error)` : à chaque tentative en échec (erreur de
+      connexion ou statut 4xx/5xx)
+
+    Une exception levée par un hook est journalisée sans interrompre la
+    requête.
+    """
+
+    def __init__(self):
+        self._hooks = {event: [] for event in HOOK_EVENTS}
+
+    def add(self, event, func):
+        """Enregistre un hook"""
+        if event not in self._hooks:
+            raise ValueError(f"Unknown hook event: {event}")
+        self._hooks[event].append(func)
+
+    def remove(self, event, func):
+        """Retire un hook"""
+        if event in self._hooks and func in self._hooks[event]:
+            self._hooks[event].remove(func)
+
+    def run(self, event, *args):
+        """Appelle les hooks de l'événement"""
+        for func in list(self._hooks[event]):
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Tassi %s hook failed", event)
+
+    def __bool__(self):
+        return any(self._hooks.values())
@@ -0,0 +1,181 @@
+"""Transport HTTP/2 pour le Requestor"""
+import os
+import ssl
+import threading
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout, RequestException
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers
+
+
+class _HttpxBody:
+    """Corps d'une réponse httpx exposé comme le `raw` d'une réponse requests"""
+
+    def __init__(self, response):
+        self._response = response
+        self._iterator = None
+
+    def stream(self, chunk_size, decode_content=True):
+        """Génère le corps par blocs, puis libère le flux"""
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except Exception as e:
+            raise _convert_error(e)
+        finally:
+            self._response.close()
+
+    def read(self, amt=None):
+        if self._iterator is None:
+            self._iterator = self.stream(amt or 65536)
+        return next(self._iterator, b'')
+
+    def close(self):
+        self._response.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """Adaptateur requests qui envoie les requêtes en HTTP/2 via httpx
+
+    Les requêtes simultanées vers un même hôte sont multiplexées sur
+    quelques connexions au lieu d'ouvrir une connexion TLS par thread.
+    L'adaptateur est partagé par toutes les sessions d'un Requestor.
+
+    - `max_connections` : connexions ouvertes au maximum
+    - `max_keepalive_connections` : connexions conservées entre deux requêtes
+    - `http1` : autorise le repli en HTTP/1.1 si le serveur ne négocie pas
+      HTTP/2 ; si faux, HTTP/2 est utilisé d'emblée, y compris sans TLS
+      (h2c)
+
+    Nécessite `pip install tassi[http2]`.
+    """
+
+    def __init__(self, max_connections=10, max_keepalive_connections=10, http1=True):
+        super().__init__()
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Http2Adapter requires httpx with HTTP/2 support. "
+                "Install it with: pip install tassi[http2]"
+            )
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http1 = http1
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _get_client(self, verify, cert):
+        """Retourne le client httpx associé aux options TLS"""
+        key = (verify, cert)
+        client = self._clients.get(key)
+        if client is None:
+            import httpx
+
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = httpx.Client(
+                        http1=self.http1,
+                        http2=True,
+                        verify=_ssl_context(verify, cert),
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_keepalive_connections
+                        ),
+                        follow_redirects=False,
+                        trust_env=False
+                    )
+                    self._clients[key] = client
+        return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Envoie une requête préparée et retourne une réponse requests"""
+        import httpx
+
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        client = self._get_client(verify, cert)
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        else:
+            timeout = httpx.Timeout(timeout)
+
+        httpx_request = client.build_request(
+            request.method,
+            request.url,
+            headers=list(request.headers.items()),
+            content=request.body,
+            timeout=timeout
+        )
+        try:
+            httpx_response = client.send(httpx_request, stream=True)
+        except Exception as e:
+            raise _convert_error(e, request)
+
+        return self._build_response(request, httpx_response)
+
+    def _build_response(self, request, httpx_response):
+        """Construit la réponse requests"""
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _HttpxBody(httpx_response)
+        # Version HTTP négociée ('HTTP/2' ou 'HTTP/1.1')
+        response.http_version = httpx_response.http_version
+        return response
+
+    def close(self):
+        """Ferme les connexions"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+
+def _ssl_context(verify, cert):
+    """Traduit les options TLS de requests (`verify`, `cert`) pour httpx"""
+    if cert is None and isinstance(verify, bool):
+        return verify
+
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        bundle = verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH
+        if os.path.isdir(bundle):
+            context = ssl.create_default_context(capath=bundle)
+        else:
+            context = ssl.create_default_context(cafile=bundle)
+
+    if cert is not None:
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        else:
+            context.load_cert_chain(*cert)
+    return context
+
+
+def _convert_error(e, request=None):
+    """Convertit une exception httpx en exception requests"""
+    import httpx
+
+    if isinstance(e, RequestException):
+        return e
+    if isinstance(e, httpx.ConnectTimeout):
+        return ConnectTimeout(e, request=request)
+    if isinstance(e, httpx.TimeoutException):
+        return ReadTimeout(e, request=request)
+    if isinstance(e, httpx.TransportError):
+        return ConnectionError(e, request=request)
+    return e
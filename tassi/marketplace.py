@@ -1,6 +1,8 @@
 """Ressource Marketplace"""
 from .resource import Resource
 from .util import array_to_tassi_object
+from .pagination import auto_paging_iter, auto_paging_stream
+from .sync import sync_new_items
 
 
 class Marketplace(Resource):
@@ -22,6 +24,16 @@ class Marketplace(Resource):
             headers = {}
         return cls._update(id, params, headers)
 
+    def save(self, headers=None):
+        """Enregistre les modifications de la marketplace
+
+        Seuls les attributs modifiés depuis la récupération sont envoyés ;
+        aucune requête n'est faite si rien n'a changé.
+        """
+        if headers is None:
+            headers = {}
+        return self._save(headers)
+
     def get_wallet_history(self, params=None, headers=None):
         """Récupère l'historique du wallet"""
         if params is None:
@@ -32,4 +44,103 @@ class Marketplace(Resource):
         url = f"{self.instance_url()}/wallet_history"
 
         response = self.__class__._static_request('get', url, params, headers)
-        return array_to_tassi_object(response['data'], response['options'])
\ No newline at end of file
+        return array_to_tassi_object(response['data'], response['options'])
+
+    def iter_wallet_history(self, params=None, headers=None, prefetch=False, stream=False):
+        """Parcourt l'historique du wallet, page par page
+
+        Si `stream` est vrai, chaque page est analysée au fil de la lecture
+        du corps et `prefetch` est sans effet.
+        """
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        url = f"{self.instance_url()}/wallet_history"
+
+        if stream:
+            return auto_paging_stream(
+                lambda page_params: self.__class__._static_stream_items(
+                    url, 'wallet_movements', page_params, headers
+                ),
+                params
+            )
+
+        def fetch_page(page_params):
+            return self.__class__._static_request('get', url, page_params, headers)
+
+        return auto_paging_iter(fetch_page, 'wallet_movements', params, prefetch)
+
+    def sync_wallet_history(self, callback, store, key=None, cursor_field='id', initial_cursor=None,
+                            params=None, headers=None, stream=False, checkpoint_every=100,
+                            newest_first=False):
+        """Transmet à `callback` les mouvements du wallet apparus depuis la dernière synchronisation
+
+        Le point de reprise (dernier mouvement transmis) est conservé dans
+        `store` (`FileCheckpointStore`, `SqliteCheckpointStore`…) sous la
+        clé `key`, par défaut propre à la marketplace. Seules les pages
+        contenant de nouveaux mouvements sont demandées, l'historique étant
+        retourné du plus récent au plus ancien ; les mouvements sont transmis
+        du plus ancien au plus récent. `cursor_field` désigne le champ
+        croissant servant de curseur ('id' ou un horodatage comme
+        'created_at'). Retourne un `SyncResult`.
+
+        Pour cet ordre, tous les nouveaux mouvements sont gardés en mémoire
+        jusqu'à la fin du parcours : une première synchronisation sans
+        `initial_cursor`, ou après une longue interruption, charge tout
+        l'arriéré avant le premier appel à `callback`. Avec `newest_first`,
+        chaque mouvement est transmis dès sa lecture, du plus récent au plus
+        ancien, et le point de reprise n'est enregistré qu'à la fin.
+        """
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        if key is None:
+            key = f"marketplace:{self.id}:wallet_history"
+
+        return sync_new_items(
+            self.iter_wallet_history(params, headers, stream=stream),
+            callback,
+            store,
+            key,
+            cursor_field=cursor_field,
+            initial_cursor=initial_cursor,
+            checkpoint_every=checkpoint_every,
+            newest_first=newest_first
+        )
+
+    @classmethod
+    async def retrieve_async(cls, id, headers=None):
+        """Récupère une marketplace (asynchrone)"""
+        if headers is None:
+            headers = {}
+        return await cls._retrieve_async(id, headers)
+
+    @classmethod
+    async def update_async(cls, id, params=None, headers=None):
+        """Met à jour une marketplace (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        return await cls._update_async(id, params, headers)
+
+    async def save_async(self, headers=None):
+        """Enregistre les modifications de la marketplace (asynchrone)"""
+        if headers is None:
+            headers = {}
+        return await self._save_async(headers)
+
+    async def get_wallet_history_async(self, params=None, headers=None):
+        """Récupère l'historique du wallet (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        url = f"{self.instance_url()}/wallet_history"
+
+        response = await self.__class__._static_request_async('get', url, params, headers)
+        return array_to_tassi_object(response['data'], response['options'])
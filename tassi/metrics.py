@@ -0,0 +1,188 @@
+"""Mesures des requêtes HTTP"""
+import threading
+import time
+
+# Bornes (en secondes) des histogrammes de latence
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histogramme cumulatif à bornes fixes"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Enregistre une valeur"""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsCollector:
+    """Collecteur de mesures branché sur les hooks d'un requestor
+
+    Enregistre, par méthode et modèle de chemin (`/packages/{id}`) :
+    la latence de chaque tentative (histogramme), le nombre de réponses par
+    statut, les erreurs par type, les nouvelles tentatives et les octets
+    envoyés et reçus. Les mesures s'exportent au format texte Prometheus
+    (`to_prometheus`) ou, tentative par tentative, vers `span_callback(span)`
+    pour un système de traces.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, span_callback=None, prefix='tassi'):
+        self.buckets = tuple(buckets)
+        self.span_callback = span_callback
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset()
+
+    def install(self, requestor):
+        """Enregistre le collecteur sur les hooks du requestor"""
+        requestor.add_hook('after_response', self._after_response)
+        requestor.add_hook('on_error', self._on_error)
+        return self
+
+    def uninstall(self, requestor):
+        """Retire le collecteur des hooks du requestor"""
+        requestor.remove_hook('after_response', self._after_response)
+        requestor.remove_hook('on_error', self._on_error)
+
+    def reset(self):
+        """Remet toutes les mesures à zéro"""
+        with self._lock:
+            self._latency = {}
+            self._responses = {}
+            self._errors = {}
+            self._retries = {}
+            self._bytes_in = {}
+            self._bytes_out = {}
+
+    def _after_response(self, info, response):
+        """Enregistre une réponse HTTP"""
+        self._record(info)
+
+    def _on_error(self, info, error):
+        """Enregistre une tentative en échec"""
+        kind = f"http_{info.status}" if info.status is not None else error.__class__.__name__
+        key = (info.method, info.path_template, kind)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+        # Sans réponse HTTP, la tentative n'est pas passée par after_response
+        if info.status is None:
+            self._record(info, error)
+
+    def _record(self, info, error=None):
+        """Enregistre la latence, le statut, les octets et la span d'une tentative"""
+        endpoint = (info.method, info.path_template)
+        with self._lock:
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = Histogram(self.buckets)
+            histogram.observe(info.elapsed or 0.0)
+
+            status = str(info.status) if info.status is not None else 'error'
+            status_key = endpoint + (status,)
+            self._responses[status_key] = self._responses.get(status_key, 0) + 1
+
+            if info.attempt > 0:
+                self._retries[endpoint] = self._retries.get(endpoint, 0) + 1
+            self._bytes_in[endpoint] = self._bytes_in.get(endpoint, 0) + info.bytes_in
+            self._bytes_out[endpoint] = self._bytes_out.get(endpoint, 0) + info.bytes_out
+
+        if self.span_callback is not None:
+            elapsed = info.elapsed or 0.0
+            self.span_callback({
+                'name': f"{info.method} {info.path_template}",
+                'method': info.method,
+                'path': info.path,
+                'path_template': info.path_template,
+                'url': info.url,
+                'status': info.status,
+                'attempt': info.attempt,
+                'start_time': time.time() - elapsed,
+                'duration': elapsed,
+                'bytes_in': info.bytes_in,
+                'bytes_out': info.bytes_out,
+                'error': repr(error) if error is not None else None
+            })
+
+    def snapshot(self):
+        """Retourne une copie des mesures sous forme de dictionnaire"""
+        with self._lock:
+            return {
+                'latency': {
+                    endpoint: {
+                        'count': histogram.count,
+                        'sum': histogram.sum,
+                        'buckets': dict(zip(histogram.buckets, histogram.counts))
+                    }
+                    for endpoint, histogram in self._latency.items()
+                },
+                'responses': dict(self._responses),
+                'errors': dict(self._errors),
+                'retries': dict(self._retries),
+                'bytes_in': dict(self._bytes_in),
+                'bytes_out': dict(self._bytes_out)
+            }
+
+    def to_prometheus(self):
+        """Exporte les mesures au format texte Prometheus"""
+        p = self.prefix
+        lines = []
+
+        with self._lock:
+            lines.append(f"# HELP {p}_request_duration_seconds Latence des requêtes HTTP")
+            lines.append(f"# TYPE {p}_request_duration_seconds histogram")
+            for (method, path), histogram in sorted(self._latency.items()):
+                labels = _labels(method=method, path=path)
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    bucket_labels = _labels(method=method, path=path, le=_format_bound(bound))
+                    lines.append(f"{p}_request_duration_seconds_bucket{bucket_labels} {count}")
+                inf_labels = _labels(method=method, path=path, le='+Inf')
+                lines.append(f"{p}_request_duration_seconds_bucket{inf_labels} {histogram.count}")
+                lines.append(f"{p}_request_duration_seconds_sum{labels} {histogram.sum}")
+                lines.append(f"{p}_request_duration_seconds_count{labels} {histogram.count}")
+
+            lines.append(f"# HELP {p}_responses_total Réponses HTTP par statut")
+            lines.append(f"# TYPE {p}_responses_total counter")
+            for (method, path, status), count in sorted(self._responses.items()):
+                lines.append(f"{p}_responses_total{_labels(method=method, path=path, status=status)} {count}")
+
+            lines.append(f"# HELP {p}_errors_total Tentatives en échec par type d'erreur")
+            lines.append(f"# TYPE {p}_errors_total counter")
+            for (method, path, kind), count in sorted(self._errors.items()):
+                lines.append(f"{p}_errors_total{_labels(method=method, path=path, error=kind)} {count}")
+
+            lines.append(f"# HELP {p}_retries_total Nouvelles tentatives")
+            lines.append(f"# TYPE {p}_retries_total counter")
+            for (method, path), count in sorted(self._retries.items()):
+                lines.append(f"{p}_retries_total{_labels(method=method, path=path)} {count}")
+
+            lines.append(f"# HELP {p}_bytes_total Octets transférés")
+            lines.append(f"# TYPE {p}_bytes_total counter")
+            for direction, values in (('in', self._bytes_in), ('out', self._bytes_out)):
+                for (method, path), count in sorted(values.items()):
+                    labels = _labels(method=method, path=path, direction=direction)
+                    lines.append(f"{p}_bytes_total{labels} {count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_bound(bound):
+    """Formate une borne d'histogramme"""
+    return repr(float(bound))
+
+
+def _labels(**labels):
+    """Formate les labels Prometheus"""
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in labels.items()) + '}'
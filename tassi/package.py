@@ -1,5 +1,7 @@
 """Ressource Package"""
+import os
 from .resource import Resource
+from .error import ChecksumMismatchError, InvalidRequestError
 from .util import array_to_tassi_object
 
 
@@ -13,6 +15,17 @@ class Package(Resource):
             headers = {}
         return cls._retrieve(id, headers)
 
+    @classmethod
+    def retrieve_many(cls, ids, headers=None, max_workers=8, ordered=True):
+        """Récupère plusieurs packages en parallèle
+
+        Génère un BulkItemResult par ID, dans l'ordre des IDs si `ordered`
+        est vrai, sinon au fur et à mesure des réponses.
+        """
+        if headers is None:
+            headers = {}
+        return cls._retrieve_many(ids, headers, max_workers, ordered)
+
     @classmethod
     def all(cls, params=None, headers=None):
         """Liste tous les packages"""
@@ -22,6 +35,20 @@ class Package(Resource):
             headers = {}
         return cls._all(params, headers)
 
+    @classmethod
+    def iter_all(cls, params=None, headers=None, prefetch=False, stream=False):
+        """Parcourt tous les packages, page par page
+
+        Si `stream` est vrai, chaque page est analysée au fil de la lecture
+        du corps : un seul package à la fois est gardé en mémoire.
+        `prefetch` est alors sans effet.
+        """
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        return cls._iter_all(params, headers, prefetch, stream)
+
     @classmethod
     def update(cls, id, params=None, headers=None):
         """Met à jour un package"""
@@ -31,6 +58,16 @@ class Package(Resource):
             headers = {}
         return cls._update(id, params, headers)
 
+    def save(self, headers=None):
+        """Enregistre les modifications du package
+
+        Seuls les attributs modifiés depuis la récupération sont envoyés ;
+        aucune requête n'est faite si rien n'a changé.
+        """
+        if headers is None:
+            headers = {}
+        return self._save(headers)
+
     def track(self, headers=None):
         """Suivi du package"""
         if headers is None:
@@ -49,4 +86,130 @@ class Package(Resource):
         url = f"{self.instance_url()}/shipping_labels/{label_id}"
 
         response = self.__class__._static_request('get', url, {}, headers)
-        return array_to_tassi_object(response['data'], response['options'])
\ No newline at end of file
+        return array_to_tassi_object(response['data'], response['options'])
+
+    def download_shipping_label(self, label_id, destination, headers=None, chunk_size=65536):
+        """Télécharge le fichier de l'étiquette d'expédition par blocs
+
+        Les métadonnées de l'étiquette sont récupérées, puis le fichier est
+        lu depuis son `file_url`. `destination` est un chemin de fichier ou
+        un objet binaire doté d'une méthode `write`. Le corps de la réponse
+        est écrit au fil de l'eau, sans être chargé en mémoire, et son
+        empreinte SHA-256 est comparée au `checksum` annoncé par l'API. Un
+        fichier n'est créé qu'une fois le téléchargement terminé et vérifié.
+        """
+        if headers is None:
+            headers = {}
+
+        label = self.get_shipping_label(label_id, headers).shipping_label
+        file_url = getattr(label, 'file_url', None)
+        if not file_url:
+            raise InvalidRequestError(f"Shipping label {label_id} has no file to download yet")
+        expected = getattr(label, 'checksum', None)
+
+        chunks = self.__class__._static_stream(
+            'get', file_url, {}, {**headers, 'Accept': '*/*'}, chunk_size
+        )
+
+        if hasattr(destination, 'write'):
+            bytes_written, checksum = _write_chunks(chunks, destination)
+            _verify_checksum(label_id, expected, checksum)
+        else:
+            path = os.fspath(destination)
+            partial_path = f"{path}.part"
+            try:
+                with open(partial_path, 'wb') as fh:
+                    bytes_written, checksum = _write_chunks(chunks, fh)
+                _verify_checksum(label_id, expected, checksum)
+                os.replace(partial_path, path)
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+
+        return array_to_tassi_object({
+            'label_id': label_id,
+            'filename': getattr(label, 'filename', None),
+            'bytes_written': bytes_written,
+            'checksum': checksum,
+            'checksum_algorithm': 'sha256'
+        }, {})
+
+    @classmethod
+    async def retrieve_async(cls, id, headers=None):
+        """Récupère un package (asynchrone)"""
+        if headers is None:
+            headers = {}
+        return await cls._retrieve_async(id, headers)
+
+    @classmethod
+    async def all_async(cls, params=None, headers=None):
+        """Liste tous les packages (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        return await cls._all_async(params, headers)
+
+    @classmethod
+    async def update_async(cls, id, params=None, headers=None):
+        """Met à jour un package (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        return await cls._update_async(id, params, headers)
+
+    async def save_async(self, headers=None):
+        """Enregistre les modifications du package (asynchrone)"""
+        if headers is None:
+            headers = {}
+        return await self._save_async(headers)
+
+    async def track_async(self, headers=None):
+        """Suivi du package (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        url = f"{self.instance_url()}/track"
+
+        response = await self.__class__._static_request_async('get', url, {}, headers)
+        return array_to_tassi_object(response['data'], response['options'])
+
+    async def get_shipping_label_async(self, label_id, headers=None):
+        """Récupère l'étiquette d'expédition (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        url = f"{self.instance_url()}/shipping_labels/{label_id}"
+
+        response = await self.__class__._static_request_async('get', url, {}, headers)
+        return array_to_tassi_object(response['data'], response['options'])
+
+
+def _write_chunks(chunks, fh):
+    """Écrit les blocs dans le fichier et retourne (taille, empreinte SHA-256)"""
+    import hashlib
+
+    digest = hashlib.sha256()
+    bytes_written = 0
+
+    try:
+        for chunk in chunks:
+            fh.write(chunk)
+            digest.update(chunk)
+            bytes_written += len(chunk)
+    finally:
+        chunks.close()
+
+    return bytes_written, digest.hexdigest()
+
+
+def _verify_checksum(label_id, expected, actual):
+    """Vérifie l'empreinte SHA-256 annoncée par l'API, si elle est fournie"""
+    if expected and expected.lower() != actual:
+        raise ChecksumMismatchError(
+            f"Shipping label {label_id} checksum mismatch: expected {expected}, got {actual}",
+            expected=expected,
+            actual=actual
+        )
@@ -0,0 +1,117 @@
+"""Parcours paginé des listes"""
+from .util import array_to_tassi_object
+
+
+def auto_paging_iter(fetch_page, list_key, params=None, prefetch=False):
+    """Parcourt une liste paginée élément par élément
+
+    `fetch_page(params)` effectue la requête d'une page et retourne la
+    réponse du requestor. La page suivante n'est demandée qu'une fois la
+    page courante consommée, ou en arrière-plan si `prefetch` est vrai.
+    """
+    params = dict(params or {})
+    page = int(params.get('page', 1))
+    per_page = params.get('per_page')
+    seen = 0
+
+    executor = None
+    if prefetch:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        params['page'] = page
+        response = fetch_page(dict(params))
+
+        while response is not None:
+            data = response['data']
+            items = _extract_items(data, list_key)
+            seen += len(items)
+
+            next_page = _next_page(data, len(items), page, per_page, seen)
+            pending = None
+            if next_page is not None:
+                params['page'] = next_page
+                if executor is not None:
+                    pending = executor.submit(fetch_page, dict(params))
+
+            for item in items:
+                yield array_to_tassi_object(item, response['options'])
+
+            if next_page is None:
+                response = None
+            elif pending is not None:
+                response = pending.result()
+            else:
+                response = fetch_page(dict(params))
+            page = next_page
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def auto_paging_stream(stream_page, params=None):
+    """Parcourt une liste paginée en analysant chaque page au fil de l'eau
+
+    `stream_page(params)` retourne `(JsonItemStream, options)` pour une
+    page. Les éléments sont convertis un à un à mesure qu'ils arrivent ;
+    la page suivante est demandée une fois la page courante lue.
+    """
+    params = dict(params or {})
+    page = int(params.get('page', 1))
+    per_page = params.get('per_page')
+    seen = 0
+
+    while page is not None:
+        params['page'] = page
+        items, options = stream_page(dict(params))
+        try:
+            for item in items:
+                yield array_to_tassi_object(item, options)
+        finally:
+            items.close()
+
+        seen += items.count
+        page = _next_page(items.rest, items.count, page, per_page, seen)
+
+
+def _extract_items(data, list_key):
+    """Retourne les éléments de la page"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return data.get(list_key) or []
+    return []
+
+
+def _next_page(data, count, page, per_page, seen):
+    """Retourne le numéro de la page suivante, ou None s'il n'y en a pas
+
+    `count` est le nombre d'éléments de la page. Sans métadonnées de
+    pagination, la liste n'est considérée comme paginée que si `per_page`
+    a été fourni et que la page est pleine.
+    """
+    if not count:
+        return None
+
+    meta = data.get('meta') if isinstance(data, dict) else None
+    if isinstance(meta, dict):
+        current_page = int(meta.get('current_page') or page)
+        if 'next_page' in meta:
+            return int(meta['next_page']) if meta['next_page'] else None
+        if meta.get('total_pages') is not None:
+            total_pages = int(meta['total_pages'])
+            return current_page + 1 if current_page < total_pages else None
+        if meta.get('total_count') is not None:
+            total_count = int(meta['total_count'])
+            page_size = meta.get('per_page') or per_page
+            if page_size:
+                has_next = current_page * int(page_size) < total_count
+            else:
+                has_next = seen < total_count
+            return current_page + 1 if has_next else None
+        page = current_page
+
+    if per_page and count >= int(per_page):
+        return page + 1
+
+    return None
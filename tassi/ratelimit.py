@@ -0,0 +1,166 @@
+"""Limitation du débit des requêtes côté client"""
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+def _take(state, rate, capacity, now):
+    """Réserve un jeton dans le seau et retourne (nouvel état, attente)
+
+    Le nombre de jetons peut devenir négatif : chaque appelant réserve ainsi
+    sa place et attend le temps nécessaire pour que son jeton soit produit.
+    """
+    tokens, updated = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate) - 1
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return (tokens, now), wait
+
+
+def _pause(state, rate, capacity, now, seconds):
+    """Vide le seau pour qu'aucun jeton ne soit disponible avant `seconds`"""
+    tokens, updated = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    return (min(tokens, 1 - seconds * rate), now), None
+
+
+class MemoryBackend:
+    """État des seaux en mémoire, partagé entre les threads du processus"""
+
+    def __init__(self):
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def update(self, key, func):
+        """Applique `func(état)` de façon atomique et retourne son résultat"""
+        with self._lock:
+            state, result = func(self._state.get(key))
+            self._state[key] = state
+            return result
+
+
+class FileBackend:
+    """État des seaux dans un fichier local, partagé entre processus
+
+    Chaque mise à jour verrouille le fichier (`fcntl.flock`), ce qui
+    convient à quelques processus sur une même machine.
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise RuntimeError("FileBackend requires fcntl (POSIX)")
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def update(self, key, func):
+        """Applique `func(état)` de façon atomique et retourne son résultat"""
+        with self._lock, open(self.path, 'a+b') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                states = json.loads(f.read() or b'{}')
+            except ValueError:
+                states = {}
+
+            state, result = func(states.get(key))
+            states[key] = list(state)
+
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(states).encode())
+            f.flush()
+            return result
+
+
+def _split_limit(limit):
+    """Retourne (débit, burst) d'une limite : débit seul ou couple (débit, burst)"""
+    if isinstance(limit, (tuple, list)):
+        rate, burst = limit
+        return rate, burst
+    return limit, None
+
+
+def _check_limit(name, rate, burst):
+    """Lève ValueError si le débit n'est pas positif ou si le burst est inférieur à 1"""
+    if not rate > 0:
+        raise ValueError(f"Invalid rate for {name}: {rate!r} (must be > 0)")
+    if burst is not None and not burst >= 1:
+        raise ValueError(f"Invalid burst for {name}: {burst!r} (must be >= 1)")
+
+
+class RateLimiter:
+    """Limiteur de débit à seau de jetons
+
+    - `rate` : requêtes par seconde autorisées par seau
+    - `burst` : taille du seau, soit le nombre de requêtes pouvant partir
+      d'un coup ; par défaut `rate`
+    - `per_endpoint` : un seau par méthode et modèle de chemin
+      (`GET /packages/{id}`) ; sinon un seau unique
+    - `limits` : débits propres à certains endpoints, par exemple
+      `{"POST /shipments": (2, 5), "/packages/{id}/track": 1}` ; une valeur
+      est un débit ou un couple (débit, burst)
+    - `backend` : `MemoryBackend()` (défaut) ou `FileBackend(path)` pour
+      partager les seaux entre processus
+
+    Lorsqu'un seau est vide, l'appelant attend son tour au lieu d'envoyer
+    une requête vouée au 429. Un 429 reçu vide le seau pendant la durée
+    indiquée par `Retry-After`, pour tous les appelants.
+    """
+
+    def __init__(self, rate=10.0, burst=None, per_endpoint=True, limits=None, backend=None,
+                 clock=time.time):
+        _check_limit('rate limiter', rate, burst)
+        for endpoint, limit in (limits or {}).items():
+            _check_limit(endpoint, *_split_limit(limit))
+        self.rate = rate
+        self.burst = burst
+        self.per_endpoint = per_endpoint
+        self.limits = limits or {}
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.clock = clock
+
+    def bucket(self, method, path_template):
+        """Retourne (clé, débit, capacité) du seau de l'endpoint"""
+        endpoint = f"{method.upper()} {path_template}"
+        limit = self.limits.get(endpoint, self.limits.get(path_template))
+        if limit is None:
+            rate, burst = self.rate, self.burst
+            key = endpoint if self.per_endpoint else '*'
+        else:
+            rate, burst = _split_limit(limit)
+            key = endpoint
+
+        return key, float(rate), float(burst if burst is not None else max(1.0, rate))
+
+    def reserve(self, method, path_template):
+        """Réserve un jeton et retourne le délai d'attente en secondes"""
+        key, rate, capacity = self.bucket(method, path_template)
+        now = self.clock()
+        return self.backend.update(key, lambda state: _take(state, rate, capacity, now))
+
+    def acquire(self, method, path_template):
+        """Attend qu'un jeton soit disponible"""
+        wait = self.reserve(method, path_template)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, method, path_template):
+        """Attend qu'un jeton soit disponible, sans bloquer la boucle d'événements"""
+        import asyncio
+
+        wait = self.reserve(method, path_template)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, method, path_template, seconds):
+        """Suspend l'endpoint pendant `seconds` secondes"""
+        key, rate, capacity = self.bucket(method, path_template)
+        now = self.clock()
+        self.backend.update(key, lambda state: _pause(state, rate, capacity, now, seconds))
@@ -1,54 +1,391 @@
 """Gestionnaire des requêtes HTTP"""
-import requests
+import json
+import threading
+import time
+from urllib.parse import urlsplit
 from .tassi import Tassi
 from .error import ApiConnectionError
+from .retry import RetryPolicy, parse_retry_after, with_idempotency_key
+from .codec import get_codec
+from .compression import DEFAULT_THRESHOLD, accept_encoding, get_compressor
+from .singleflight import SingleFlight
+from .hooks import HookRegistry, RequestInfo
 
 
 class Requestor:
+    """Gestionnaire des requêtes HTTP
+
+    Chaque thread dispose de sa propre `requests.Session`, mais toutes les
+    sessions partagent le même `HTTPAdapter` et donc le même pool de
+    connexions urllib3, qui est thread-safe. Un requestor peut ainsi être
+    utilisé par autant de threads que nécessaire.
+
+    - `pool_connections` : nombre d'hôtes distincts gardés en cache
+    - `pool_maxsize` : connexions conservées par hôte ; à aligner sur le
+      nombre de threads qui appellent l'API simultanément
+    - `pool_block` : si vrai, un thread attend qu'une connexion se libère
+      au lieu d'en ouvrir une nouvelle, non réutilisée, au-delà du pool
+    - `keep_alive` : si faux, chaque connexion est fermée après la réponse
+    - `retry_policy` : politique de nouvelles tentatives (`RetryPolicy`),
+      `RetryPolicy(max_retries=0)` pour les désactiver
+    - `json_codec` : codec JSON ('auto', 'orjson', 'ujson', 'json') ; par
+      défaut celui de `Tassi.get_json_codec()`
+    - `coalesce_gets` : regroupe les GET identiques (même URL, paramètres et
+      en-têtes) lancés simultanément en un seul appel réseau dont la
+      réponse est partagée
+    - `rate_limiter` : limiteur de débit (`RateLimiter`) appliqué avant
+      chaque tentative
+    - `api_key`, `api_base`, `environment`, `verify_ssl_certs` : configuration
+      propre au requestor ; chaque option laissée à None est lue dans `Tassi`
+    - `http2` : envoie les requêtes en HTTP/2 (`Http2Adapter`), les requêtes
+      simultanées étant multiplexées sur au plus `pool_maxsize` connexions
+    - `adapter` : adaptateur requests à utiliser à la place de celui
+      construit par le requestor
+    - `circuit_breaker` : disjoncteur (`CircuitBreaker`) consulté avant
+      chaque tentative ; une requête vers un endpoint dont le circuit est
+      ouvert échoue immédiatement avec `CircuitOpenError`
+    - `compression` : compresse les corps de requête ('auto' pour brotli si
+      installé, sinon gzip ; 'br' ou 'gzip') d'au moins
+      `compression_threshold` octets, avec l'en-tête Content-Encoding ; par
+      défaut les corps ne sont pas compressés. Les réponses sont toujours
+      négociées (Accept-Encoding) et décompressées au fil de la lecture
+    """
+
     SANDBOX_BASE = 'https://tassi-api.exanora.com'
     LIVE_BASE = 'https://tassi-api.exanora.com'  # Même URL pour le moment
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 retry_policy=None, json_codec=None, coalesce_gets=True, rate_limiter=None,
+                 api_key=None, api_base=None, environment=None, verify_ssl_certs=None,
+                 http2=False, adapter=None, circuit_breaker=None, compression=None,
+                 compression_threshold=DEFAULT_THRESHOLD):
+        self.api_key = api_key
+        self.api_base = api_base
+        self.environment = environment
+        self.verify_ssl_certs = verify_ssl_certs
+        self._headers = None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.json_codec = json_codec
+        self.coalesce_gets = coalesce_gets
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._single_flight = SingleFlight()
+        self.hooks = HookRegistry()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.custom_adapter = adapter
+        self._adapter = adapter
+        self._adapter_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def adapter(self):
+        """Retourne l'adaptateur HTTP partagé par tous les threads"""
+        if self._adapter is None:
+            with self._adapter_lock:
+                if self._adapter is None:
+                    self._adapter = self._build_adapter()
+        return self._adapter
+
+    def _build_adapter(self):
+        """Construit l'adaptateur HTTP"""
+        if self.http2:
+            from .http2 import Http2Adapter
+
+            return Http2Adapter(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize
+            )
+
+        from requests.adapters import HTTPAdapter
+
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+
+    @property
+    def session(self):
+        """Retourne la session du thread courant"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            session.mount('https://', self.adapter)
+            session.mount('http://', self.adapter)
+            if not self.keep_alive:
+                session.headers['Connection'] = 'close'
+            self._local.session = session
+        return session
+
+    @property
+    def codec(self):
+        """Retourne le codec JSON utilisé pour les corps de requête et de réponse"""
+        return get_codec(self.json_codec or Tassi.get_json_codec())
+
+    def close(self):
+        """Ferme toutes les connexions du pool"""
+        with self._adapter_lock:
+            if self._adapter is not None:
+                self._adapter.close()
+                self._adapter = self.custom_adapter
+        self._local = threading.local()
 
     def request(self, method, path, params=None, headers=None):
-        """Effectue une requête HTTP"""
+        """Effectue une requête HTTP
+
+        Les erreurs transitoires sont réessayées selon `retry_policy`. Les
+        requêtes POST et PUT reçoivent une clé d'idempotence commune à
+        toutes les tentatives.
+        """
         url = self._url(path)
         request_headers = {**self._default_headers(), **(headers or {})}
+        with_idempotency_key(method, request_headers)
+
+        if self.coalesce_gets and method.upper() == 'GET':
+            key = self._coalesce_key(method, url, params, request_headers)
+            result, shared = self._single_flight.do(
+                key,
+                lambda: self._request(method, path, url, params, request_headers)
+            )
+            return dict(result) if shared else result
+
+        return self._request(method, path, url, params, request_headers)
 
+    def _request(self, method, path, url, params, headers):
+        """Effectue la requête et construit la réponse"""
+        response = self._perform(method, path, url, params, headers)
+
+        return {
+            'data': self._decode(response),
+            'options': {
+                'environment': self.get_environment()
+            },
+            'status': response.status_code,
+            'headers': response.headers
+        }
+
+    def stream(self, method, path, params=None, headers=None, chunk_size=65536):
+        """Effectue une requête HTTP et génère le corps de la réponse par blocs
+
+        Le corps n'est jamais chargé entièrement en mémoire. La connexion est
+        rendue au pool une fois le générateur épuisé ou fermé. `path` peut
+        être une URL absolue, par exemple un fichier renvoyé par l'API.
+        """
+        import requests
+
+        url = self._url(path)
+        request_headers = {**self._default_headers(), **(headers or {})}
+        with_idempotency_key(method, request_headers)
+        if self._is_absolute(path):
+            path = urlsplit(path).path
+            if not self._same_origin(url, self._base_url()):
+                # Fichier hébergé ailleurs (URL signée) : l'API key n'y est pas envoyée
+                request_headers.pop('Authorization', None)
+
+        response = self._perform(method, path, url, params, request_headers, stream=True)
         try:
-            if method.upper() in ['GET', 'HEAD', 'DELETE']:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    headers=request_headers,
-                    verify=Tassi.get_verify_ssl_certs()
-                )
-            else:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=params,
-                    headers=request_headers,
-                    verify=Tassi.get_verify_ssl_certs()
-                )
-
-            response.raise_for_status()
-
-            return {
-                'data': response.json() if response.content else {},
-                'options': {
-                    'environment': Tassi.get_environment()
-                }
-            }
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
         except requests.exceptions.RequestException as e:
             self._handle_request_exception(e)
+        finally:
+            response.close()
+
+    def _coalesce_key(self, method, url, params, headers):
+        """Clé identifiant les requêtes identiques"""
+        return (
+            method.upper(),
+            url,
+            json.dumps(params, sort_keys=True, default=str),
+            tuple(sorted(headers.items()))
+        )
+
+    def add_hook(self, event, func):
+        """Enregistre un hook ('before_request', 'after_response' ou 'on_error')"""
+        self.hooks.add(event, func)
+
+    def remove_hook(self, event, func):
+        """Retire un hook"""
+        self.hooks.remove(event, func)
+
+    def _perform(self, method, path, url, params, headers, stream=False):
+        """Envoie la requête en réessayant les erreurs transitoires"""
+        import requests
+
+        body = None if self._is_query_method(method) else self._encode(params)
+        body, headers = self._compress(body, headers)
+        info = RequestInfo(method, url, path, params, headers, len(body or b''), stream)
+        started_at = time.monotonic()
+
+        while True:
+            info.start_attempt()
+            probe = self._before_call(info)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(info.method, info.path_template)
+                self.hooks.run('before_request', info)
+                attempt_started_at = time.monotonic()
+                try:
+                    timeout = self.retry_policy.timeout_for(started_at)
+                    response = self._send(method, url, params, body, headers, stream, timeout)
+                    info.status = response.status_code
+                    info.elapsed = time.monotonic() - attempt_started_at
+                    info.bytes_in = self._response_size(response, stream)
+                    self._record_call(info)
+                    probe = False
+                    self._check_rate_limited(info, response)
+                    self.hooks.run('after_response', info, response)
+
+                    response.raise_for_status()
+                    return response
+                except requests.exceptions.RequestException as e:
+                    if info.elapsed is None:
+                        info.elapsed = time.monotonic() - attempt_started_at
+                    if info.status is None:
+                        self._record_call(info)
+                    probe = False
+                    info.error = e
+                    self.hooks.run('on_error', info, e)
+
+                    delay = self._retry_delay(e, info.attempt, started_at)
+                    if delay is None:
+                        self._handle_request_exception(e)
+                    if getattr(e, 'response', None) is not None:
+                        e.response.close()
+            finally:
+                if probe:
+                    # Tentative abandonnée sans résultat : la place de test est rendue
+                    self.circuit_breaker.release(info.method, info.path_template)
+
+            time.sleep(delay)
+            info.attempt += 1
+
+    def _before_call(self, info):
+        """Consulte le disjoncteur ; retourne vrai si la tentative est une requête de test"""
+        if self.circuit_breaker is None:
+            return False
+        return self.circuit_breaker.before_call(info.method, info.path_template)
+
+    def _record_call(self, info):
+        """Transmet le résultat de la tentative au disjoncteur"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(info.method, info.path_template, info.status, info.elapsed)
+
+    def _check_rate_limited(self, info, response):
+        """Suspend l'endpoint dans le limiteur de débit après un 429"""
+        if self.rate_limiter is None or response.status_code != 429:
+            return
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after:
+            self.rate_limiter.pause(info.method, info.path_template, retry_after)
+
+    def _is_query_method(self, method):
+        """Indique si les paramètres sont transmis dans l'URL"""
+        return method.upper() in ['GET', 'HEAD', 'DELETE']
+
+    def _response_size(self, response, stream):
+        """Taille du corps de la réponse, sans consommer un flux"""
+        if stream:
+            return int(response.headers.get('Content-Length') or 0)
+        return len(response.content)
+
+    def _send(self, method, url, params, body, headers, stream=False, timeout=None):
+        """Envoie une requête sur la session du thread courant"""
+        if self._is_query_method(method):
+            return self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                headers=headers,
+                verify=self.get_verify_ssl_certs(),
+                stream=stream,
+                timeout=timeout
+            )
+
+        return self.session.request(
+            method=method,
+            url=url,
+            data=body,
+            headers=headers,
+            verify=self.get_verify_ssl_certs(),
+            stream=stream,
+            timeout=timeout
+        )
+
+    def _encode(self, params):
+        """Encode le corps de la requête"""
+        if params is None:
+            return None
+        return self.codec.dumps(params)
+
+    def _compress(self, body, headers):
+        """Compresse le corps s'il atteint le seuil ; retourne le corps et les headers"""
+        if self.compression is None or body is None or len(body) < self.compression_threshold:
+            return body, headers
+
+        compressor = get_compressor(self.compression)
+        return compressor.compress(body), {**headers, 'Content-Encoding': compressor.name}
+
+    def _decode(self, response):
+        """Décode le corps de la réponse"""
+        if not response.content:
+            return {}
+
+        try:
+            return self.codec.loads(response.content)
+        except ValueError as e:
+            raise ApiConnectionError(
+                f"Invalid JSON response: {str(e)}",
+                http_status=response.status_code,
+                http_request=getattr(response, 'request', None),
+                http_response=response
+            )
+
+    def _retry_delay(self, e, attempt, started_at):
+        """Retourne le délai avant une nouvelle tentative, ou None"""
+        response = getattr(e, 'response', None)
+        if response is not None:
+            return self.retry_policy.next_delay(
+                attempt,
+                started_at,
+                status=response.status_code,
+                retry_after=response.headers.get('Retry-After')
+            )
+
+        import requests
+
+        if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return self.retry_policy.next_delay(attempt, started_at)
+
+        return None
+
+    def get_api_key(self):
+        """Retourne l'API key"""
+        return self.api_key if self.api_key is not None else Tassi.get_api_key()
+
+    def get_environment(self):
+        """Retourne l'environnement"""
+        return self.environment if self.environment is not None else Tassi.get_environment()
+
+    def get_verify_ssl_certs(self):
+        """Retourne si on vérifie les certificats SSL"""
+        if self.verify_ssl_certs is not None:
+            return self.verify_ssl_certs
+        return Tassi.get_verify_ssl_certs()
 
     def _base_url(self):
         """Retourne l'URL de base"""
-        api_base = Tassi.get_api_base()
-        environment = Tassi.get_environment()
+        api_base = self.api_base if self.api_base is not None else Tassi.get_api_base()
+        environment = self.get_environment()
 
         if api_base:
             return api_base
@@ -58,28 +395,49 @@ class Requestor:
         else:  # sandbox par défaut
             return self.SANDBOX_BASE
 
+    def _same_origin(self, url, other):
+        """Indique si deux URL ont le même schéma et le même hôte (port compris)"""
+        first, second = urlsplit(url), urlsplit(other)
+        return (first.scheme.lower(), first.netloc.lower()) == (second.scheme.lower(), second.netloc.lower())
+
+    def _is_absolute(self, path):
+        """Indique si `path` est une URL complète"""
+        return path.startswith(('https://', 'http://'))
+
     def _url(self, path=''):
         """Construit l'URL complète"""
+        if self._is_absolute(path):
+            return path
         return f"{self._base_url()}{path}"
 
     def _default_headers(self):
-        """Retourne les headers par défaut"""
-        api_key = Tassi.get_api_key()
+        """Retourne les headers par défaut
 
-        return {
+        Les headers ne sont reconstruits que lorsque l'API key change ; le
+        dictionnaire retourné est partagé et ne doit pas être modifié.
+        """
+        api_key = self.get_api_key()
+        cached = self._headers
+        if cached is not None and cached[0] == api_key:
+            return cached[1]
+
+        headers = {
             'X-Version': Tassi.VERSION,
             'X-Source': 'Tassi PythonLib',
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': accept_encoding()
         }
+        self._headers = (api_key, headers)
+        return headers
 
     def _handle_request_exception(self, e):
         """Gère les exceptions de requête"""
         message = f"Request error: {str(e)}"
-        http_status = e.response.status_code if hasattr(e, 'response') and e.response else None
-        http_request = e.request if hasattr(e, 'request') else None
-        http_response = e.response if hasattr(e, 'response') else None
+        http_response = getattr(e, 'response', None)
+        http_status = http_response.status_code if http_response is not None else None
+        http_request = getattr(e, 'request', None)
 
         raise ApiConnectionError(
             message,
@@ -1,13 +1,20 @@
 """Classe de base pour toutes les ressources"""
-from inflection import pluralize
+import threading
 from .tassi_object import TassiObject
 from .requestor import Requestor
+from .async_requestor import AsyncRequestor
 from .error import InvalidRequestError
 from .util import array_to_tassi_object
+from .pagination import auto_paging_iter, auto_paging_stream
+from .streaming import JsonItemStream
+from .bulk import BulkResult, run_concurrently
 
 
 class Resource(TassiObject):
     _requestor = None
+    _async_requestor = None
+    _requestor_lock = threading.Lock()
+    _cache = None
 
     @classmethod
     def set_requestor(cls, req):
@@ -18,9 +25,35 @@ class Resource(TassiObject):
     def get_requestor(cls):
         """Retourne le requestor"""
         if cls._requestor is None:
-            cls._requestor = Requestor()
+            with cls._requestor_lock:
+                if cls._requestor is None:
+                    cls._requestor = Requestor()
         return cls._requestor
 
+    @classmethod
+    def set_async_requestor(cls, req):
+        """Définit le requestor asynchrone"""
+        cls._async_requestor = req
+
+    @classmethod
+    def get_async_requestor(cls):
+        """Retourne le requestor asynchrone"""
+        if cls._async_requestor is None:
+            with cls._requestor_lock:
+                if cls._async_requestor is None:
+                    cls._async_requestor = AsyncRequestor()
+        return cls._async_requestor
+
+    @classmethod
+    def set_cache(cls, cache):
+        """Active un cache (ResponseCache) pour les récupérations, None pour le désactiver"""
+        cls._cache = cache
+
+    @classmethod
+    def get_cache(cls):
+        """Retourne le cache des récupérations"""
+        return cls._cache
+
     @classmethod
     def class_name(cls):
         """Retourne le nom de la classe"""
@@ -28,10 +61,14 @@ class Resource(TassiObject):
 
     @classmethod
     def class_path(cls):
-        """Retourne le chemin de la classe"""
-        base = cls.class_name()
-        plural = pluralize(base)
-        return f"/{plural}"
+        """Retourne le chemin de la classe, calculé une fois par classe"""
+        path = cls.__dict__.get('_class_path')
+        if path is None:
+            from inflection import pluralize
+
+            path = f"/{pluralize(cls.class_name())}"
+            cls._class_path = path
+        return path
 
     @classmethod
     def resource_path(cls, id):
@@ -68,26 +105,149 @@ class Resource(TassiObject):
         return cls.get_requestor().request(method, url, params, headers)
 
     @classmethod
-    def _retrieve(cls, id, headers=None):
-        """Récupère une ressource"""
+    async def _static_request_async(cls, method, url, params=None, headers=None):
+        """Effectue une requête statique asynchrone"""
+        if params is None:
+            params = {}
         if headers is None:
             headers = {}
 
-        url = cls.resource_path(id)
-        class_name = cls.class_name()
+        return await cls.get_async_requestor().request(method, url, params, headers)
 
-        response = cls._static_request('get', url, None, headers)
+    @classmethod
+    def _static_stream(cls, method, url, params=None, headers=None, chunk_size=65536):
+        """Effectue une requête statique et génère le corps par blocs"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        return cls.get_requestor().stream(method, url, params, headers, chunk_size)
+
+    @classmethod
+    def _static_stream_items(cls, url, list_key, params=None, headers=None):
+        """Effectue une requête GET dont la liste est analysée au fil de l'eau
+
+        Retourne `(JsonItemStream, options)`.
+        """
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        requestor = cls.get_requestor()
+        chunks = requestor.stream('get', url, params, headers)
+        options = {'environment': requestor.get_environment()}
+        return JsonItemStream(chunks, list_key), options
+
+    @classmethod
+    def construct_from(cls, values, options):
+        """Construit une ressource à partir des valeurs renvoyées par l'API"""
+        obj = cls()
+        obj.refresh_from(values, options)
+        return obj
+
+    def refresh_from(self, values, options):
+        """Rafraîchit la ressource avec les valeurs renvoyées par l'API
+
+        Les sous-objets sont convertis selon `Tassi.get_object_mode()` et les
+        valeurs deviennent la référence de `serialize_changes`.
+        """
+        super().refresh_from({
+            key: array_to_tassi_object(value, options) if isinstance(value, (dict, list)) else value
+            for key, value in values.items()
+        }, options)
+        self._original = {**(self._original or {}), **values}
+
+    @classmethod
+    def _response_values(cls, response):
+        """Retourne les valeurs d'une ressource unique dans une réponse"""
         data = response['data']
-        options = response['options']
+        class_name = cls.class_name()
 
         # Si la réponse contient la clé du nom de classe, l'utiliser
         if class_name in data:
-            obj_data = data[class_name]
-        else:
-            obj_data = data
+            return data[class_name]
+        return data
 
-        obj = array_to_tassi_object(obj_data, options)
-        return obj
+    @classmethod
+    def _convert_response(cls, response):
+        """Convertit la réponse d'une ressource unique en ressource"""
+        obj_data = cls._response_values(response)
+
+        if isinstance(obj_data, dict):
+            return cls.construct_from(obj_data, response['options'])
+        return array_to_tassi_object(obj_data, response['options'])
+
+    def _saved(self, response):
+        """Prend en compte la réponse d'un enregistrement"""
+        # Les valeurs envoyées sont désormais celles de l'API
+        self._original = self.to_dict()
+
+        obj_data = self.__class__._response_values(response)
+        if isinstance(obj_data, dict):
+            self.refresh_from(obj_data, response['options'])
+        return self
+
+    @classmethod
+    def _retrieve(cls, id, headers=None):
+        """Récupère une ressource"""
+        if headers is None:
+            headers = {}
+
+        url = cls.resource_path(id)
+        cache = cls.get_cache()
+
+        if cache is None:
+            response = cls._static_request('get', url, None, headers)
+            return cls._convert_response(response)
+
+        entry, version = cache.get(url), cache.version()
+        if entry is not None and entry.fresh:
+            return cls._convert_response(entry.response)
+
+        response = cls._static_request('get', url, None, cls._revalidation_headers(entry, headers))
+        return cls._convert_response(cls._store_in_cache(url, entry, version, response))
+
+    @classmethod
+    def _revalidation_headers(cls, entry, headers):
+        """Ajoute If-None-Match si l'entrée en cache porte un ETag"""
+        if entry is not None and entry.etag:
+            return {**headers, 'If-None-Match': entry.etag}
+        return headers
+
+    @classmethod
+    def _store_in_cache(cls, url, entry, version, response):
+        """Met à jour le cache et retourne la réponse à convertir"""
+        cache = cls.get_cache()
+
+        if response.get('status') == 304 and entry is not None:
+            cache.touch(url)
+            return entry.response
+
+        response_headers = response.get('headers') or {}
+        cache.set(url, response, response_headers.get('ETag'), version)
+        return response
+
+    @classmethod
+    def _invalidate_cache(cls, url):
+        """Retire une ressource du cache"""
+        cache = cls.get_cache()
+        if cache is not None:
+            cache.invalidate(url)
+
+    @classmethod
+    def _retrieve_many(cls, ids, headers=None, max_workers=8, ordered=True):
+        """Récupère plusieurs ressources en parallèle"""
+        if headers is None:
+            headers = {}
+
+        return run_concurrently(
+            lambda id: cls._retrieve(id, headers),
+            ids,
+            max_workers=max_workers,
+            ordered=ordered
+        )
 
     @classmethod
     def _all(cls, params=None, headers=None):
@@ -103,6 +263,29 @@ class Resource(TassiObject):
         response = cls._static_request('get', path, params, headers)
         return array_to_tassi_object(response['data'], response['options'])
 
+    @classmethod
+    def _iter_all(cls, params=None, headers=None, prefetch=False, stream=False):
+        """Parcourt toutes les ressources, page par page"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        cls._validate_params(params)
+        path = cls.class_path()
+        list_key = path.lstrip('/')
+
+        if stream:
+            return auto_paging_stream(
+                lambda page_params: cls._static_stream_items(path, list_key, page_params, headers),
+                params
+            )
+
+        def fetch_page(page_params):
+            return cls._static_request('get', path, page_params, headers)
+
+        return auto_paging_iter(fetch_page, list_key, params, prefetch)
+
     @classmethod
     def _create(cls, params, headers=None):
         """Crée une ressource"""
@@ -111,20 +294,31 @@ class Resource(TassiObject):
 
         cls._validate_params(params)
         url = cls.class_path()
-        class_name = cls.class_name()
 
         response = cls._static_request('post', url, params, headers)
-        data = response['data']
-        options = response['options']
+        return cls._convert_response(response)
 
-        # Si la réponse contient la clé du nom de classe, l'utiliser
-        if class_name in data:
-            obj_data = data[class_name]
-        else:
-            obj_data = data
+    @classmethod
+    def _create_many(cls, params_list, headers=None, max_workers=8):
+        """Crée plusieurs ressources en parallèle
 
-        obj = array_to_tassi_object(obj_data, options)
-        return obj
+        Les clés des résultats sont les index dans `params_list`.
+        """
+        if headers is None:
+            headers = {}
+
+        result = BulkResult()
+        for item in run_concurrently(
+            lambda entry: cls._create(entry[1], headers),
+            enumerate(params_list),
+            max_workers=max_workers,
+            ordered=False,
+            key=lambda entry: entry[0]
+        ):
+            result.add(item)
+
+        result.sort()
+        return result
 
     @classmethod
     def _update(cls, id, params, headers=None):
@@ -134,20 +328,24 @@ class Resource(TassiObject):
 
         cls._validate_params(params)
         url = cls.resource_path(id)
-        class_name = cls.class_name()
 
         response = cls._static_request('put', url, params, headers)
-        data = response['data']
-        options = response['options']
+        cls._invalidate_cache(url)
+        return cls._convert_response(response)
 
-        # Si la réponse contient la clé du nom de classe, l'utiliser
-        if class_name in data:
-            obj_data = data[class_name]
-        else:
-            obj_data = data
+    def _save(self, headers=None):
+        """Envoie les attributs modifiés (PUT) ; aucune requête si rien n'a changé"""
+        if headers is None:
+            headers = {}
 
-        obj = array_to_tassi_object(obj_data, options)
-        return obj
+        params = self.serialize_changes()
+        if not params:
+            return self
+
+        url = self.instance_url()
+        response = self.__class__._static_request('put', url, params, headers)
+        self.__class__._invalidate_cache(url)
+        return self._saved(response)
 
     def _delete(self, headers=None):
         """Supprime une ressource"""
@@ -156,4 +354,90 @@ class Resource(TassiObject):
 
         url = self.instance_url()
         self.__class__._static_request('delete', url, {}, headers)
-        return self
\ No newline at end of file
+        self.__class__._invalidate_cache(url)
+        return self
+
+    @classmethod
+    async def _retrieve_async(cls, id, headers=None):
+        """Récupère une ressource (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        url = cls.resource_path(id)
+        cache = cls.get_cache()
+
+        if cache is None:
+            response = await cls._static_request_async('get', url, None, headers)
+            return cls._convert_response(response)
+
+        entry, version = cache.get(url), cache.version()
+        if entry is not None and entry.fresh:
+            return cls._convert_response(entry.response)
+
+        response = await cls._static_request_async(
+            'get', url, None, cls._revalidation_headers(entry, headers)
+        )
+        return cls._convert_response(cls._store_in_cache(url, entry, version, response))
+
+    @classmethod
+    async def _all_async(cls, params=None, headers=None):
+        """Liste toutes les ressources (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+
+        cls._validate_params(params)
+        path = cls.class_path()
+
+        response = await cls._static_request_async('get', path, params, headers)
+        return array_to_tassi_object(response['data'], response['options'])
+
+    @classmethod
+    async def _create_async(cls, params, headers=None):
+        """Crée une ressource (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        cls._validate_params(params)
+        url = cls.class_path()
+
+        response = await cls._static_request_async('post', url, params, headers)
+        return cls._convert_response(response)
+
+    @classmethod
+    async def _update_async(cls, id, params, headers=None):
+        """Met à jour une ressource (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        cls._validate_params(params)
+        url = cls.resource_path(id)
+
+        response = await cls._static_request_async('put', url, params, headers)
+        cls._invalidate_cache(url)
+        return cls._convert_response(response)
+
+    async def _save_async(self, headers=None):
+        """Envoie les attributs modifiés (PUT, asynchrone) ; aucune requête si rien n'a changé"""
+        if headers is None:
+            headers = {}
+
+        params = self.serialize_changes()
+        if not params:
+            return self
+
+        url = self.instance_url()
+        response = await self.__class__._static_request_async('put', url, params, headers)
+        self.__class__._invalidate_cache(url)
+        return self._saved(response)
+
+    async def _delete_async(self, headers=None):
+        """Supprime une ressource (asynchrone)"""
+        if headers is None:
+            headers = {}
+
+        url = self.instance_url()
+        await self.__class__._static_request_async('delete', url, {}, headers)
+        self.__class__._invalidate_cache(url)
+        return self
@@ -0,0 +1,130 @@
+"""Politique de nouvelles tentatives"""
+import random
+import time
+
+# Statuts HTTP pour lesquels une nouvelle tentative peut réussir
+RETRYABLE_STATUSES = (408, 429, 500, 502, 503, 504)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+
+class RetryPolicy:
+    """Politique de nouvelles tentatives avec backoff exponentiel
+
+    - `max_retries` : nombre maximal de nouvelles tentatives (0 désactive)
+    - `backoff_factor` : délai de base, doublé à chaque tentative
+    - `max_backoff` : délai maximal entre deux tentatives
+    - `jitter` : tire le délai au hasard entre 0 et le backoff calculé
+      pour éviter que les clients ne réessaient tous en même temps
+    - `retry_statuses` : statuts HTTP réessayables
+    - `respect_retry_after` : utilise l'en-tête `Retry-After` s'il est présent
+    - `total_timeout` : budget total en secondes, tentatives comprises
+    - `attempt_timeout` : délai maximal d'une tentative (connexion, puis
+      attente de chaque lecture), réduit au budget restant ; None pour ne
+      borner une tentative que par `total_timeout`
+    """
+
+    # Délai minimal d'une tentative, lorsque le budget est presque épuisé
+    MIN_ATTEMPT_TIMEOUT = 0.001
+
+    def __init__(self, max_retries=2, backoff_factor=0.5, max_backoff=30.0, jitter=True,
+                 retry_statuses=RETRYABLE_STATUSES, respect_retry_after=True,
+                 total_timeout=60.0, attempt_timeout=30.0):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.total_timeout = total_timeout
+        self.attempt_timeout = attempt_timeout
+
+    def is_retryable_status(self, status):
+        """Indique si le statut HTTP est réessayable"""
+        return status in self.retry_statuses
+
+    def timeout_for(self, started_at):
+        """Retourne le délai de la prochaine tentative, ou None s'il n'est pas borné
+
+        C'est `attempt_timeout`, réduit au budget `total_timeout` restant
+        depuis `started_at`.
+        """
+        timeout = self.attempt_timeout
+        if self.total_timeout is not None:
+            remaining = self.total_timeout - (time.monotonic() - started_at)
+            remaining = max(remaining, self.MIN_ATTEMPT_TIMEOUT)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+    def backoff(self, attempt):
+        """Retourne le délai avant la tentative suivant `attempt` (à partir de 0)"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(self, attempt, started_at, status=None, retry_after=None):
+        """Retourne le délai avant la prochaine tentative, ou None pour abandonner
+
+        `status` vaut None pour une erreur de connexion, qui est toujours
+        réessayable.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status is not None and not self.is_retryable_status(status):
+            return None
+
+        delay = None
+        if self.respect_retry_after and retry_after is not None:
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if self.total_timeout is not None:
+            elapsed = time.monotonic() - started_at
+            if elapsed + delay > self.total_timeout:
+                return None
+
+        return delay
+
+
+def parse_retry_after(value):
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes"""
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def with_idempotency_key(method, headers):
+    """Ajoute une clé d'idempotence aux requêtes POST et PUT
+
+    La même clé est réutilisée pour toutes les tentatives d'une requête, le
+    serveur peut ainsi ignorer les doublons. Une clé fournie par l'appelant
+    est conservée.
+    """
+    if method.upper() not in ('POST', 'PUT'):
+        return headers
+    if not any(key.lower() == IDEMPOTENCY_HEADER.lower() for key in headers):
+        import uuid
+
+        headers[IDEMPOTENCY_HEADER] = str(uuid.uuid4())
+    return headers
@@ -12,4 +12,24 @@ class Shipment(Resource):
             params = {}
         if headers is None:
             headers = {}
-        return cls._create(params, headers)
\ No newline at end of file
+        return cls._create(params, headers)
+
+    @classmethod
+    def create_many(cls, params_list, headers=None, max_workers=8):
+        """Crée plusieurs expéditions en parallèle
+
+        Retourne un BulkResult dont les listes `succeeded`, `failed` et
+        `retryable` sont indexées par position dans `params_list`.
+        """
+        if headers is None:
+            headers = {}
+        return cls._create_many(params_list, headers, max_workers)
+
+    @classmethod
+    async def create_async(cls, params=None, headers=None):
+        """Crée une expédition (asynchrone)"""
+        if params is None:
+            params = {}
+        if headers is None:
+            headers = {}
+        return await cls._create_async(params, headers)
@@ -0,0 +1,110 @@
+"""Regroupement des requêtes identiques simultanées"""
+import threading
+
+
+class _Call:
+    """Appel en cours partagé par plusieurs appelants"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Exécute une seule fois les appels simultanés portant la même clé
+
+    Le premier appelant exécute la fonction ; ceux qui arrivent avant la
+    fin attendent et reçoivent le même résultat (ou la même exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """Exécute `func()` ou attend l'appel en cours pour `key`
+
+        Retourne `(résultat, partagé)`, `partagé` étant vrai si le résultat
+        provient de l'appel d'un autre thread.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+
+class _AsyncCall:
+    """Tâche partagée par les appelants asyncio d'une même clé"""
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Équivalent asyncio de SingleFlight, pour une boucle d'événements
+
+    L'appel partagé s'exécute dans sa propre tâche : l'annulation d'un
+    appelant (par exemple un délai `asyncio.wait_for`) n'affecte pas les
+    autres. La tâche n'est annulée que lorsque plus personne ne l'attend.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func):
+        """Exécute `await func()` ou attend l'appel en cours pour `key`
+
+        Retourne `(résultat, partagé)`.
+        """
+        import asyncio
+
+        call = self._calls.get(key)
+        shared = call is not None
+        if not shared:
+            call = _AsyncCall(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._forget(key, call))
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Tous les appelants ont été annulés
+                call.task.cancel()
+
+        return result, shared
+
+    def _forget(self, key, call):
+        """Retire l'appel terminé"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # L'exception est transmise aux appelants ; éviter l'avertissement
+        # « exception was never retrieved » si tous ont été annulés
+        if not call.task.cancelled():
+            call.task.exception()
@@ -0,0 +1,173 @@
+"""Analyse incrémentale des réponses JSON de liste"""
+import codecs
+import json
+from .error import ApiConnectionError
+
+_WHITESPACE = ' \t\n\r'
+
+# Caractères pouvant prolonger un nombre JSON
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+# Au-delà, la partie déjà analysée du tampon est libérée
+_COMPACT_THRESHOLD = 65536
+
+
+class JsonItemStream:
+    """Génère un à un les éléments d'une liste JSON lue par blocs
+
+    `chunks` est un itérable de blocs d'octets (par exemple
+    `Requestor.stream`). Le corps peut être une liste ou un objet dont la
+    clé `list_key` contient la liste ; seul l'élément en cours d'analyse est
+    gardé en mémoire. Les autres clés de l'objet (`meta`…) sont disponibles
+    dans `rest` une fois la liste parcourue.
+    """
+
+    def __init__(self, chunks, list_key=None):
+        self.list_key = list_key
+        self.rest = {}
+        self.count = 0
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        try:
+            yield from self._parse()
+        except ValueError as e:
+            raise ApiConnectionError(f"Invalid JSON response: {str(e)}")
+        finally:
+            self.close()
+
+    def close(self):
+        """Libère le flux sous-jacent"""
+        close = getattr(self._chunks, 'close', None)
+        if close is not None:
+            close()
+
+    def _parse(self):
+        """Parcourt le document"""
+        char = self._peek()
+        if char == '[':
+            yield from self._items()
+            self._end()
+        elif char == '{':
+            yield from self._object()
+        elif char is None:
+            return
+        else:
+            # Un autre document JSON ne contient pas de liste
+            self._value()
+            self._end()
+
+    def _object(self):
+        """Parcourt l'objet de premier niveau"""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return self._end()
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expecting property name at position {self._pos}")
+            self._expect(':')
+
+            if key == self.list_key and self._peek() == '[':
+                yield from self._items()
+            else:
+                self.rest[key] = self._value()
+
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect('}')
+            return self._end()
+
+    def _items(self):
+        """Génère les éléments de la liste"""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            item = self._value()
+            self.count += 1
+            yield item
+
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect(']')
+            return
+
+    def _end(self):
+        """Vérifie qu'il ne reste rien après le document"""
+        if self._peek() is not None:
+            raise ValueError(f"Extra data at position {self._pos}")
+
+    def _value(self):
+        """Décode la valeur JSON suivante, en lisant autant de blocs que nécessaire"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+
+            # Un nombre suivi uniquement de caractères numériques jusqu'à la fin
+            # du tampon (`1.`, `2e`…) peut se poursuivre dans le bloc suivant
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and _NUMBER_CHARS.issuperset(self._buffer[end:]) and self._fill()):
+                continue
+
+            self._pos = end
+            return value
+
+    def _peek(self):
+        """Retourne le prochain caractère significatif, ou None en fin de flux"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char):
+        """Consomme le caractère attendu"""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expecting '{char}' at position {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def _fill(self):
+        """Ajoute le bloc suivant au tampon ; retourne False en fin de flux"""
+        if self._eof:
+            return False
+
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+
+        self._eof = True
+        tail = self._decoder.decode(b'', final=True)
+        if tail:
+            self._buffer += tail
+            return True
+        return False
@@ -0,0 +1,227 @@
+"""Synchronisation incrémentale des listes avec un point de reprise persistant"""
+import json
+import os
+import threading
+import time
+
+
+class MemoryCheckpointStore:
+    """Points de reprise en mémoire (tests, traitements ponctuels)"""
+
+    def __init__(self):
+        self._checkpoints = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Retourne le point de reprise, ou None"""
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def set(self, key, checkpoint):
+        """Enregistre le point de reprise"""
+        with self._lock:
+            self._checkpoints[key] = checkpoint
+
+
+class FileCheckpointStore:
+    """Points de reprise dans un fichier JSON local
+
+    Le fichier est réécrit puis renommé à chaque mise à jour : un arrêt en
+    cours d'écriture laisse le point de reprise précédent intact.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, key):
+        """Retourne le point de reprise, ou None"""
+        with self._lock:
+            return self._read().get(key)
+
+    def set(self, key, checkpoint):
+        """Enregistre le point de reprise"""
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = checkpoint
+            temporary = f"{self.path}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(checkpoints, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.path)
+
+
+class SqliteCheckpointStore:
+    """Points de reprise dans une base SQLite, partagée entre processus"""
+
+    def __init__(self, path, table='tassi_checkpoints'):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = os.fspath(path)
+        self.table = table
+        with self._connect() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, checkpoint TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        """Ouvre une connexion (une par appel : sqlite3 lie les connexions à leur thread)"""
+        import sqlite3
+
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        """Retourne le point de reprise, ou None"""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                f"SELECT checkpoint FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            connection.close()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key, checkpoint):
+        """Enregistre le point de reprise"""
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, checkpoint, updated_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(checkpoint), time.time())
+                )
+        finally:
+            connection.close()
+
+
+class SyncResult:
+    """Bilan d'une synchronisation : éléments transmis et point de reprise final"""
+
+    def __init__(self, count, checkpoint):
+        self.count = count
+        self.checkpoint = checkpoint
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={self.count} checkpoint={self.checkpoint}>"
+
+
+def _position(item, cursor_field):
+    """Retourne (curseur, id) d'un élément"""
+    cursor = getattr(item, cursor_field, None)
+    if cursor is None:
+        raise ValueError(f"Item has no '{cursor_field}' field to use as sync cursor")
+    return cursor, getattr(item, 'id', None)
+
+
+def _is_new(cursor, item_id, checkpoint):
+    """Indique si l'élément est postérieur au point de reprise"""
+    if checkpoint is None:
+        return True
+    if cursor != checkpoint['cursor']:
+        return cursor > checkpoint['cursor']
+    # Même curseur (horodatage partagé) : nouveau s'il n'a pas déjà été transmis
+    return item_id not in checkpoint['ids']
+
+
+def _advance(checkpoint, cursor, item_id):
+    """Retourne le point de reprise après transmission d'un élément"""
+    if checkpoint is not None and checkpoint['cursor'] == cursor:
+        return {'cursor': cursor, 'ids': checkpoint['ids'] + [item_id]}
+    return {'cursor': cursor, 'ids': [item_id]}
+
+
+def sync_new_items(items, callback, store, key, cursor_field='id', initial_cursor=None,
+                   checkpoint_every=100, newest_first=False):
+    """Transmet à `callback` les éléments apparus depuis le dernier point de reprise
+
+    `items` parcourt la liste du plus récent au plus ancien ; le parcours
+    (et donc la pagination) s'arrête dès que le point de reprise est atteint.
+    Par défaut, les nouveaux éléments sont gardés en mémoire jusqu'à la fin
+    du parcours, puis transmis du plus ancien au plus récent ; le point de
+    reprise est enregistré dans `store` tous les `checkpoint_every`
+    éléments puis à la fin : après un arrêt, seuls les éléments non encore
+    enregistrés sont transmis de nouveau.
+
+    Si `newest_first` est vrai, chaque élément est transmis dès sa lecture,
+    du plus récent au plus ancien, sans être gardé en mémoire. Le point de
+    reprise n'est alors enregistré qu'à la fin : après un arrêt, tous les
+    éléments de la synchronisation sont transmis de nouveau.
+
+    Le curseur est la valeur du champ `cursor_field` (identifiant croissant
+    ou horodatage) ; `initial_cursor` sert de point de départ lorsqu'aucun
+    point de reprise n'existe encore.
+    """
+    checkpoint = store.get(key)
+    if checkpoint is None and initial_cursor is not None:
+        checkpoint = {'cursor': initial_cursor, 'ids': []}
+
+    if newest_first:
+        count, final = _deliver_while_scanning(items, callback, checkpoint, cursor_field)
+        if final is not checkpoint:
+            store.set(key, final)
+        return SyncResult(count, final)
+
+    new_items = list(_new_items(items, checkpoint, cursor_field))
+
+    pending = 0
+    for cursor, item_id, item in reversed(new_items):
+        callback(item)
+        checkpoint = _advance(checkpoint, cursor, item_id)
+        pending += 1
+        if pending >= checkpoint_every:
+            store.set(key, checkpoint)
+            pending = 0
+    if pending:
+        store.set(key, checkpoint)
+
+    return SyncResult(len(new_items), checkpoint)
+
+
+def _new_items(items, checkpoint, cursor_field):
+    """Génère (curseur, id, élément) pour les éléments postérieurs au point de reprise
+
+    Le parcours de `items` s'arrête dès que le point de reprise est atteint.
+    """
+    # Éléments du point de reprise pas encore revus pendant le parcours
+    remaining = set(checkpoint['ids']) if checkpoint is not None else set()
+    iterator = iter(items)
+    try:
+        for item in iterator:
+            cursor, item_id = _position(item, cursor_field)
+            if _is_new(cursor, item_id, checkpoint):
+                yield cursor, item_id, item
+                continue
+            remaining.discard(item_id)
+            if cursor != checkpoint['cursor'] or not remaining:
+                break
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def _deliver_while_scanning(items, callback, checkpoint, cursor_field):
+    """Transmet les nouveaux éléments au fil du parcours, du plus récent au plus ancien
+
+    Retourne (nombre transmis, point de reprise final).
+    """
+    count = 0
+    final = checkpoint
+    for cursor, item_id, item in _new_items(items, checkpoint, cursor_field):
+        callback(item)
+        count += 1
+        # Le point de reprise final est le plus récent élément et ceux de même curseur
+        if count == 1:
+            final = _advance(checkpoint, cursor, item_id)
+        elif cursor == final['cursor']:
+            final = _advance(final, cursor, item_id)
+    return count, final
@@ -10,6 +10,8 @@ class Tassi:
     api_base = None
     environment = 'sandbox'
     verify_ssl_certs = True
+    json_codec = 'auto'
+    object_mode = 'eager'
 
     @staticmethod
     def get_api_key():
@@ -49,4 +51,24 @@ class Tassi:
     @staticmethod
     def set_verify_ssl_certs(verify):
         """Définit si on vérifie les certificats SSL"""
-        Tassi.verify_ssl_certs = verify
\ No newline at end of file
+        Tassi.verify_ssl_certs = verify
+
+    @staticmethod
+    def get_json_codec():
+        """Retourne le codec JSON ('auto', 'orjson', 'ujson' ou 'json')"""
+        return Tassi.json_codec
+
+    @staticmethod
+    def set_json_codec(json_codec):
+        """Définit le codec JSON ('auto', 'orjson', 'ujson' ou 'json')"""
+        Tassi.json_codec = json_codec
+
+    @staticmethod
+    def get_object_mode():
+        """Retourne le mode de conversion des réponses ('eager', 'lazy' ou 'compact')"""
+        return Tassi.object_mode
+
+    @staticmethod
+    def set_object_mode(object_mode):
+        """Définit le mode de conversion des réponses ('eager', 'lazy' ou 'compact')"""
+        Tassi.object_mode = object_mode
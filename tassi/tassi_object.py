@@ -1,7 +1,12 @@
 """Classe de base pour tous les objets Tassi"""
+import keyword
 
 
 class TassiObject:
+    # Valeurs brutes de référence pour `serialize_changes` ; None si l'objet
+    # n'est pas suivi (toutes ses valeurs sont alors des modifications)
+    _original = None
+
     def __init__(self, id=None):
         if id:
             self.id = id
@@ -16,11 +21,141 @@ class TassiObject:
         params = {}
 
         for key, value in self.__dict__.items():
-            if key != 'id' and not callable(value):
+            if key != 'id' and not key.startswith('_') and not callable(value):
+                params[key] = value
+
+        return params
+
+    def serialize_changes(self):
+        """Sérialise les attributs modifiés par rapport aux valeurs de référence
+
+        Les sous-objets sont comparés champ par champ et seuls leurs champs
+        modifiés sont retournés ; une liste modifiée, même en place, est
+        retournée entière.
+        """
+        current = self.to_dict()
+        current.pop('id', None)
+        if self._original is None:
+            return current
+        return _diff(self._original, current)
+
+    def has_changes(self):
+        """Indique si des attributs ont été modifiés"""
+        return bool(self.serialize_changes())
+
+    def to_dict(self):
+        """Retourne les attributs publics, sous-objets compris, en dictionnaire"""
+        return {
+            key: to_plain(value) for key, value in self.__dict__.items()
+            if not key.startswith('_') and not callable(value)
+        }
+
+    def __repr__(self):
+        id_str = f" id={self.id}" if hasattr(self, 'id') else ""
+        return f"<{self.__class__.__name__}{id_str}>"
+
+
+def to_plain(value):
+    """Convertit un objet Tassi, ou une liste d'objets, en valeurs JSON"""
+    if isinstance(value, (TassiObject, TassiRecord)):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def _diff(original, current):
+    """Retourne les entrées de `current` qui diffèrent de `original`"""
+    changes = {}
+    for key, value in current.items():
+        if key not in original:
+            changes[key] = value
+            continue
+        previous = original[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = _diff(previous, value)
+            if nested:
+                changes[key] = nested
+        elif value != previous:
+            changes[key] = value
+    return changes
+
+
+class TassiRecord:
+    """Représentation compacte d'un objet Tassi
+
+    Les attributs sont stockés dans des `__slots__` : les objets d'une même
+    liste partagent une classe par disposition de champs et n'ont pas de
+    `__dict__` individuel. La lecture des attributs et
+    `serialize_parameters` se comportent comme pour `TassiObject`, mais
+    seuls les champs de la disposition peuvent être affectés.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def refresh_from(self, values, options):
+        """Rafraîchit l'objet avec les valeurs"""
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def serialize_parameters(self):
+        """Sérialise les paramètres"""
+        params = {}
+
+        for key in self._fields:
+            if key == 'id' or key.startswith('_'):
+                continue
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if not callable(value):
                 params[key] = value
 
         return params
 
+    def to_dict(self):
+        """Retourne les attributs, sous-objets compris, en dictionnaire"""
+        result = {}
+        for key in self._fields:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if not key.startswith('_') and not callable(value):
+                result[key] = to_plain(value)
+        return result
+
     def __repr__(self):
         id_str = f" id={self.id}" if hasattr(self, 'id') else ""
-        return f"<{self.__class__.__name__}{id_str}>"
\ No newline at end of file
+        return f"<{self.__class__.__name__}{id_str}>"
+
+
+# Nombre maximal de dispositions de champs distinctes
+MAX_RECORD_CLASSES = 1024
+
+_record_classes = {}
+
+
+def record_class(fields):
+    """Retourne la classe TassiRecord associée à une disposition de champs
+
+    Retourne None si un champ ne peut pas devenir un slot (nom invalide ou
+    réservé) ou si trop de dispositions différentes ont déjà été créées.
+    """
+    fields = tuple(fields)
+    klass = _record_classes.get(fields)
+    if klass is not None:
+        return klass
+
+    if len(_record_classes) >= MAX_RECORD_CLASSES:
+        return None
+    for field in fields:
+        if (not isinstance(field, str) or not field.isidentifier() or keyword.iskeyword(field)
+                or field.startswith('__') or hasattr(TassiRecord, field)):
+            return None
+
+    klass = type('TassiRecord', (TassiRecord,), {'__slots__': fields, '_fields': fields})
+    _record_classes[fields] = klass
+    return klass
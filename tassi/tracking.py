@@ -0,0 +1,280 @@
+"""Surveillance du suivi des packages"""
+import heapq
+import json
+import logging
+import threading
+import time
+from .package import Package
+from .util import array_to_tassi_object
+
+logger = logging.getLogger(__name__)
+
+# Statuts après lesquels un package n'est plus surveillé
+TERMINAL_STATUSES = ('delivered', 'returned', 'cancelled')
+
+# Clés sous lesquelles la réponse de suivi peut porter ses événements
+EVENTS_KEYS = ('events', 'tracking_events', 'tracking_history')
+
+
+def default_extract(data):
+    """Retourne (événements, statut) d'une réponse de suivi"""
+    if isinstance(data, list):
+        return data, None
+    if not isinstance(data, dict):
+        return [], None
+
+    if isinstance(data.get('tracking'), dict):
+        data = data['tracking']
+
+    events = []
+    for key in EVENTS_KEYS:
+        if isinstance(data.get(key), list):
+            events = data[key]
+            break
+
+    status = data.get('status')
+    if status is None and isinstance(data.get('package'), dict):
+        status = data['package'].get('status')
+
+    return events, status
+
+
+def event_key(event):
+    """Identifiant stable d'un événement de suivi"""
+    if isinstance(event, dict):
+        if event.get('id') is not None:
+            return ('id', event['id'])
+        return ('json', json.dumps(event, sort_keys=True, default=str))
+    return ('value', repr(event))
+
+
+class _Watch:
+    """État de surveillance d'un package"""
+
+    def __init__(self, package_id, interval, next_poll):
+        self.package_id = package_id
+        self.interval = interval
+        self.next_poll = next_poll
+        self.seen = set()
+        self.first_poll = True
+
+
+class TrackingWatcher:
+    """Surveille le suivi de packages avec une fréquence adaptative
+
+    Chaque package a sa propre échéance. Un package dont le suivi évolue
+    est interrogé toutes les `min_interval` secondes ; sans nouvel
+    événement, l'intervalle est multiplié par `backoff_factor` jusqu'à
+    `max_interval`. Un package dans un statut terminal n'est plus surveillé.
+
+    Les nouveaux événements (détectés par différence avec les événements
+    déjà vus) sont transmis à `callback(package_id, events)`. Les
+    interrogations et les callbacks s'exécutent sur au plus `max_workers`
+    threads. Les erreurs (API ou callback) sont transmises à
+    `on_error(package_id, error)`, ou journalisées à défaut, sans arrêter
+    la surveillance ; des événements dont le callback a échoué sont
+    transmis de nouveau à l'interrogation suivante.
+    """
+
+    def __init__(self, callback, on_error=None, max_workers=8, min_interval=60.0,
+                 max_interval=3600.0, backoff_factor=2.0, emit_existing=True,
+                 terminal_statuses=TERMINAL_STATUSES, extract=default_extract,
+                 headers=None, resource=Package, clock=time.monotonic):
+        self.callback = callback
+        self.on_error = on_error
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.emit_existing = emit_existing
+        self.terminal_statuses = tuple(terminal_statuses)
+        self.extract = extract
+        self.headers = headers or {}
+        self.resource = resource
+        self.clock = clock
+
+        self._watches = {}
+        self._schedule = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+
+    def watch(self, package_id, delay=0.0):
+        """Ajoute un package à surveiller"""
+        with self._lock:
+            if package_id in self._watches:
+                return
+            watch = _Watch(package_id, self.min_interval, self.clock() + delay)
+            self._watches[package_id] = watch
+            heapq.heappush(self._schedule, (watch.next_poll, id(watch), watch))
+        self._wakeup.set()
+
+    def unwatch(self, package_id):
+        """Retire un package de la surveillance"""
+        with self._lock:
+            self._watches.pop(package_id, None)
+
+    @property
+    def watched(self):
+        """Liste des packages surveillés"""
+        with self._lock:
+            return list(self._watches)
+
+    def next_poll_in(self):
+        """Secondes avant la prochaine échéance, ou None si rien n'est surveillé"""
+        with self._lock:
+            self._drop_stale()
+            if not self._schedule:
+                return None
+            return max(0.0, self._schedule[0][0] - self.clock())
+
+    def poll_due(self):
+        """Interroge tous les packages arrivés à échéance et retourne leur nombre"""
+        due = []
+        with self._lock:
+            now = self.clock()
+            self._drop_stale()
+            while self._schedule and self._schedule[0][0] <= now:
+                _, _, watch = heapq.heappop(self._schedule)
+                if self._watches.get(watch.package_id) is watch:
+                    due.append(watch)
+                self._drop_stale()
+
+        if not due:
+            return 0
+
+        executor = self._get_executor()
+        for future in [executor.submit(self._poll, watch) for watch in due]:
+            future.result()
+
+        return len(due)
+
+    def run(self, exit_when_idle=True):
+        """Boucle d'interrogation jusqu'à `stop()`
+
+        Si `exit_when_idle` est vrai, la boucle s'arrête aussi lorsque plus
+        aucun package n'est surveillé.
+        """
+        while not self._stop_event.is_set():
+            self._wakeup.clear()
+            self.poll_due()
+            wait = self.next_poll_in()
+            if wait is None and exit_when_idle:
+                return
+            self._wakeup.wait(wait)
+
+    def start(self):
+        """Démarre la boucle d'interrogation dans un thread d'arrière-plan"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run,
+            kwargs={'exit_when_idle': False},
+            name='tassi-tracking-watcher',
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Arrête la boucle d'interrogation et libère les threads"""
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self):
+        """Retourne le pool de threads, créé à la demande"""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='tassi-tracking'
+            )
+        return self._executor
+
+    def _drop_stale(self):
+        """Retire de l'échéancier les packages qui ne sont plus surveillés"""
+        while self._schedule:
+            watch = self._schedule[0][2]
+            if self._watches.get(watch.package_id) is watch:
+                return
+            heapq.heappop(self._schedule)
+
+    def _poll(self, watch):
+        """Interroge le suivi d'un package et transmet les nouveaux événements
+
+        Les événements ne sont marqués comme vus qu'une fois le callback
+        réussi : en cas d'erreur, ils sont transmis de nouveau au prochain
+        passage.
+        """
+        terminal = False
+        try:
+            url = f"{self.resource.resource_path(watch.package_id)}/track"
+            response = self.resource._static_request('get', url, {}, self.headers)
+            events, status = self.extract(response['data'])
+        except Exception as e:
+            watch.interval = min(watch.interval * self.backoff_factor, self.max_interval)
+            self._report_error(watch.package_id, e)
+        else:
+            new_events = []
+            new_keys = set()
+            for event in events:
+                key = event_key(event)
+                if key not in watch.seen and key not in new_keys:
+                    new_keys.add(key)
+                    new_events.append(event)
+
+            if watch.first_poll and not self.emit_existing:
+                watch.seen.update(new_keys)
+                new_events = []
+            watch.first_poll = False
+
+            delivered = True
+            if new_events:
+                watch.interval = self.min_interval
+                try:
+                    self.callback(
+                        watch.package_id,
+                        array_to_tassi_object(new_events, response['options'])
+                    )
+                except Exception as e:
+                    delivered = False
+                    self._report_error(watch.package_id, e)
+                else:
+                    watch.seen.update(new_keys)
+            else:
+                watch.interval = min(watch.interval * self.backoff_factor, self.max_interval)
+
+            # Un package terminé reste surveillé tant que ses événements n'ont pas été transmis
+            terminal = delivered and status in self.terminal_statuses
+
+        with self._lock:
+            if self._watches.get(watch.package_id) is not watch:
+                return
+            if terminal:
+                del self._watches[watch.package_id]
+                return
+            watch.next_poll = self.clock() + watch.interval
+            heapq.heappush(self._schedule, (watch.next_poll, id(watch), watch))
+
+    def _report_error(self, package_id, error):
+        """Transmet une erreur à `on_error`, ou la journalise
+
+        Une exception levée par `on_error` est journalisée : elle
+        n'interrompt pas la boucle d'interrogation.
+        """
+        if self.on_error is None:
+            logger.error("Tracking poll failed for package %s", package_id, exc_info=error)
+            return
+        try:
+            self.on_error(package_id, error)
+        except Exception:
+            logger.exception("Tracking on_error hook failed for package %s", package_id)
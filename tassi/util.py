@@ -1,33 +1,146 @@
 """Fonctions utilitaires"""
-from .tassi_object import TassiObject
+from .tassi import Tassi
+from .tassi_object import TassiObject, record_class
 
+OBJECT_MODES = ('eager', 'lazy', 'compact')
+
+
+def array_to_tassi_object(data, options, mode=None):
+    """Convertit un tableau en objet Tassi
+
+    `mode` vaut 'eager' (tous les sous-objets sont convertis immédiatement),
+    'lazy' (les sous-objets sont convertis au premier accès) ou 'compact'
+    (objets TassiRecord à slots, sans `__dict__`) ; par défaut celui de
+    `Tassi.get_object_mode()`.
+    """
+    if mode is None:
+        mode = Tassi.get_object_mode()
+    if mode not in OBJECT_MODES:
+        raise ValueError(f"Unknown object mode: {mode}")
+
+    convert = _CONVERTERS[mode]
 
-def array_to_tassi_object(data, options):
-    """Convertit un tableau en objet Tassi"""
     if isinstance(data, list):
-        return [_convert_to_tassi_object(item, options) for item in data]
+        return [convert(item, options) for item in data]
 
-    return _convert_to_tassi_object(data, options)
+    return convert(data, options)
 
 
 def _convert_to_tassi_object(data, options):
     """Convertit en objet Tassi"""
     if isinstance(data, dict):
         obj = TassiObject()
-        obj.refresh_from(data, options)
 
         # Convertir récursivement les sous-objets
+        values = {}
         for key, value in data.items():
             if isinstance(value, dict):
-                setattr(obj, key, _convert_to_tassi_object(value, options))
+                values[key] = _convert_to_tassi_object(value, options)
             elif isinstance(value, list):
-                setattr(obj, key, [
+                values[key] = [
                     _convert_to_tassi_object(item, options) if isinstance(item, dict) else item
                     for item in value
-                ])
+                ]
             else:
-                setattr(obj, key, value)
+                values[key] = value
 
+        obj.refresh_from(values, options)
         return obj
     else:
-        return data
\ No newline at end of file
+        return data
+
+
+def _convert_to_lazy_tassi_object(data, options):
+    """Convertit en objet Tassi dont les sous-objets sont convertis à la demande"""
+    if isinstance(data, dict):
+        return LazyTassiObject(data, options)
+    else:
+        return data
+
+
+def _convert_to_tassi_record(data, options):
+    """Convertit en objet compact, avec repli sur TassiObject"""
+    if isinstance(data, dict):
+        klass = record_class(data.keys())
+        obj = klass.__new__(klass) if klass is not None else TassiObject()
+
+        for key, value in data.items():
+            if isinstance(value, dict):
+                value = _convert_to_tassi_record(value, options)
+            elif isinstance(value, list):
+                value = [
+                    _convert_to_tassi_record(item, options) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            setattr(obj, key, value)
+
+        return obj
+    else:
+        return data
+
+
+class LazyTassiObject(TassiObject):
+    """Objet Tassi qui conserve le dictionnaire brut de la réponse
+
+    Chaque attribut n'est converti (et les sous-objets créés) qu'au premier
+    accès, puis mémorisé. Lire quelques champs d'une longue liste ne coûte
+    ainsi que la création des objets effectivement utilisés.
+    """
+
+    def __init__(self, values=None, options=None):
+        super().__init__()
+        self._raw = values if values is not None else {}
+        self._options = options
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get('_raw')
+        if raw is None or name not in raw:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        value = raw[name]
+        if isinstance(value, dict):
+            value = LazyTassiObject(value, self._options)
+        elif isinstance(value, list):
+            value = [
+                LazyTassiObject(item, self._options) if isinstance(item, dict) else item
+                for item in value
+            ]
+
+        self.__dict__[name] = value
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('_raw', {})))
+
+    def refresh_from(self, values, options):
+        """Rafraîchit l'objet avec les valeurs, converties à la demande"""
+        for key in values:
+            self.__dict__.pop(key, None)
+        self._raw = {**self._raw, **values}
+        self._options = options
+
+    def materialize(self):
+        """Convertit tous les attributs non encore lus"""
+        for key in self._raw:
+            if key not in self.__dict__:
+                getattr(self, key)
+        return self
+
+    def serialize_parameters(self):
+        """Sérialise les paramètres"""
+        self.materialize()
+        return super().serialize_parameters()
+
+    def to_dict(self):
+        """Retourne les attributs publics, sous-objets compris, en dictionnaire"""
+        self.materialize()
+        return super().to_dict()
+
+
+_CONVERTERS = {
+    'eager': _convert_to_tassi_object,
+    'lazy': _convert_to_lazy_tassi_object,
+    'compact': _convert_to_tassi_record,
+}
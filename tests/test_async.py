@@ -0,0 +1,221 @@
+"""Tests pour le requestor asynchrone"""
+import asyncio
+import json
+import httpx
+import pytest
+from tassi import Tassi, Package, Shipment, Marketplace, AsyncRequestor, MetricsCollector
+from tassi.resource import Resource
+from tassi.error import ApiConnectionError
+from tassi.retry import RetryPolicy
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsync:
+    """Tests pour les méthodes asynchrones"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        self.calls = []
+
+    def teardown_method(self):
+        """Réinitialise le requestor asynchrone"""
+        Resource.set_async_requestor(None)
+
+    def use_handler(self, handler):
+        """Installe un transport httpx simulé"""
+        def recording_handler(request):
+            self.calls.append(request)
+            return handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(recording_handler))
+        Resource.set_async_requestor(AsyncRequestor(client=client))
+
+    def test_retrieve(self):
+        """Test de récupération asynchrone d'un package"""
+        self.use_handler(lambda request: httpx.Response(
+            200, json={"package": {"id": 4, "status": "in_transit"}}
+        ))
+
+        pkg = run(Package.retrieve_async(4))
+        assert pkg.id == 4
+        assert pkg.status == "in_transit"
+        assert str(self.calls[0].url) == 'https://tassi-api.exanora.com/packages/4'
+        assert self.calls[0].headers['Authorization'] == 'Bearer test_api_key'
+
+    def test_all(self):
+        """Test de la liste asynchrone des packages"""
+        self.use_handler(lambda request: httpx.Response(
+            200, json={"packages": [{"id": 1}, {"id": 2}], "meta": {"current_page": 1}}
+        ))
+
+        result = run(Package.all_async({"page": 1}))
+        assert [p.id for p in result.packages] == [1, 2]
+        assert self.calls[0].url.params['page'] == '1'
+
+    def test_create(self):
+        """Test de création asynchrone d'une expédition"""
+        self.use_handler(lambda request: httpx.Response(
+            201, json={"shipment": {"id": 1, "status": "created"}}
+        ))
+
+        shipment = run(Shipment.create_async({"marketplace_id": "1"}))
+        assert shipment.status == "created"
+        assert self.calls[0].method == 'POST'
+        assert json.loads(self.calls[0].content) == {"marketplace_id": "1"}
+
+    def test_save(self):
+        """Test de l'enregistrement asynchrone des attributs modifiés"""
+        self.use_handler(lambda request: httpx.Response(
+            200, json={"package": {"id": 4, "status": "in_transit", "weight": "5.0"}}
+        ))
+
+        async def scenario():
+            pkg = await Package.retrieve_async(4)
+            await pkg.save_async()
+            pkg.weight = "7.5"
+            return await pkg.save_async()
+
+        pkg = run(scenario())
+        assert [request.method for request in self.calls] == ['GET', 'PUT']
+        assert json.loads(self.calls[1].content) == {"weight": "7.5"}
+        assert pkg.weight == "5.0"
+
+    def test_wallet_history(self):
+        """Test de l'historique du wallet asynchrone"""
+        self.use_handler(lambda request: httpx.Response(
+            200, json={"wallet_movements": [{"id": 7, "action": "Credit"}]}
+        ))
+
+        marketplace = Marketplace()
+        marketplace.id = 1
+        result = run(marketplace.get_wallet_history_async())
+        assert result.wallet_movements[0].action == "Credit"
+
+    def test_concurrent_requests(self):
+        """Test de plusieurs requêtes simultanées sur le même client"""
+        self.use_handler(lambda request: httpx.Response(
+            200, json={"id": int(request.url.path.rsplit('/', 1)[1])}
+        ))
+
+        async def fetch_all():
+            return await asyncio.gather(*(Package.retrieve_async(i) for i in range(1, 21)))
+
+        packages = run(fetch_all())
+        assert [p.id for p in packages] == list(range(1, 21))
+
+    def test_http_error(self):
+        """Test de conversion des erreurs HTTP"""
+        self.use_handler(lambda request: httpx.Response(400, json={"error": "invalid"}))
+
+        with pytest.raises(ApiConnectionError) as excinfo:
+            run(Marketplace.update_async(1, {"email": "invalid-email"}))
+        assert excinfo.value.http_status == 400
+
+    def test_retry(self):
+        """Test des nouvelles tentatives asynchrones"""
+        statuses = iter([503, 200])
+        self.use_handler(lambda request: httpx.Response(
+            next(statuses), json={"shipment": {"id": 1}}, headers={"Retry-After": "0"}
+        ))
+
+        shipment = run(Shipment.create_async({"marketplace_id": "1"}))
+        assert shipment.id == 1
+        assert len(self.calls) == 2
+        assert self.calls[0].headers['Idempotency-Key'] == self.calls[1].headers['Idempotency-Key']
+
+    def test_coalesce_identical_gets(self):
+        """Test du regroupement asynchrone des GET identiques"""
+        async def handler(request):
+            self.calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"package": {"id": 4}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        Resource.set_async_requestor(AsyncRequestor(client=client))
+
+        async def fetch_all():
+            return await asyncio.gather(*(Package.retrieve_async(4) for _ in range(10)))
+
+        packages = run(fetch_all())
+        assert [p.id for p in packages] == [4] * 10
+        assert len(self.calls) == 1
+
+    def test_coalesce_leader_cancelled(self):
+        """Test d'un premier appelant annulé : les autres reçoivent la réponse"""
+        async def handler(request):
+            self.calls.append(request)
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json={"package": {"id": 4}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        Resource.set_async_requestor(AsyncRequestor(client=client))
+
+        async def scenario():
+            leader = asyncio.ensure_future(asyncio.wait_for(Package.retrieve_async(4), 0.05))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(Package.retrieve_async(4))
+            with pytest.raises(asyncio.TimeoutError):
+                await leader
+            return await waiter
+
+        assert run(scenario()).id == 4
+        assert len(self.calls) == 1
+
+    def test_coalesce_all_cancelled(self):
+        """Test de l'annulation de l'appel partagé quand plus personne ne l'attend"""
+        cancelled = []
+
+        async def handler(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        Resource.set_async_requestor(AsyncRequestor(client=client))
+
+        async def scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(Package.retrieve_async(4), 0.05)
+            await asyncio.sleep(0.01)
+
+        run(scenario())
+        assert len(cancelled) == 1
+
+    def test_attempt_timeout(self):
+        """Test du délai par tentative transmis à httpx"""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions['timeout'])
+            return httpx.Response(200, json={"package": {"id": 4}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        Resource.set_async_requestor(AsyncRequestor(
+            client=client,
+            retry_policy=RetryPolicy(attempt_timeout=2.5)
+        ))
+
+        run(Package.retrieve_async(4))
+        assert timeouts[0] == {'connect': 2.5, 'read': 2.5, 'write': 2.5, 'pool': 2.5}
+
+    def test_metrics(self):
+        """Test des mesures sur le requestor asynchrone"""
+        statuses = iter([503, 200])
+        self.use_handler(lambda request: httpx.Response(
+            next(statuses), json={"package": {"id": 4}}, headers={"Retry-After": "0"}
+        ))
+        metrics = MetricsCollector().install(Resource.get_async_requestor())
+
+        run(Package.retrieve_async(4))
+
+        snapshot = metrics.snapshot()
+        assert snapshot['latency'][('GET', '/packages/{id}')]['count'] == 2
+        assert snapshot['errors'][('GET', '/packages/{id}', 'http_503')] == 1
+        assert snapshot['retries'][('GET', '/packages/{id}')] == 1
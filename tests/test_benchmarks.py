@@ -0,0 +1,72 @@
+"""Tests de fumée pour les benchmarks"""
+import json
+from benchmarks import bench_import, bench_replay, bench_suite
+from tassi import Package
+
+
+class TestBenchSuite:
+    """Tests pour la suite de benchmarks"""
+
+    def test_run(self):
+        """Test d'une exécution réduite contre le serveur simulé"""
+        report = bench_suite.run({
+            'requests': 20, 'threads': 2, 'items': 50, 'total_count': 30,
+            'per_page': 10, 'bulk': 5, 'repeat': 1
+        })
+
+        assert set(report['results']) == {
+            'conversion_eager', 'conversion_lazy', 'conversion_compact',
+            'requestor_throughput', 'requestor_throughput_http2', 'pagination', 'pagination_prefetch', 'pagination_stream',
+            'bulk_create', 'pagination_compressed', 'bulk_create_compressed'
+        }
+        assert report['results']['pagination']['ops'] == 30
+
+        # Corps compressés dans les deux sens
+        plain = report['results']['bulk_create']
+        compressed = report['results']['bulk_create_compressed']
+        assert plain['wire_bytes'] == plain['body_bytes']
+        assert compressed['body_bytes'] == plain['body_bytes']
+        assert compressed['wire_bytes'] < plain['wire_bytes'] / 2
+        assert report['results']['pagination_compressed']['wire_bytes'] < report['results']['pagination']['wire_bytes']
+
+    def test_compare(self):
+        """Test de la détection des régressions"""
+        baseline = {'results': {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0}, 'c': {'seconds': 0.001}}}
+        current = {'results': {'a': {'seconds': 1.1}, 'b': {'seconds': 1.5}, 'c': {'seconds': 0.004}}}
+
+        assert bench_suite.compare(current, baseline, 0.25) == [('b', 1.0, 1.5)]
+
+
+class TestBenchImport:
+    """Tests pour le benchmark d'import"""
+
+    def test_heavy_modules_are_lazy(self):
+        """Test de l'import différé des dépendances lourdes"""
+        assert bench_import.loaded_modules() == []
+
+    def test_class_path_is_memoized(self):
+        """Test du calcul unique du chemin de la classe"""
+        assert Package.class_path() == '/packages'
+        assert Package.__dict__['_class_path'] == '/packages'
+
+
+class TestBenchReplay:
+    """Tests pour le rejeu d'une cassette"""
+
+    def test_replay(self, tmp_path):
+        """Test du rejeu d'un trafic enregistré"""
+        path = tmp_path / 'traffic.jsonl'
+        lines = [
+            {'method': 'GET', 'url': 'https://api.example.com/packages?page=2', 'status': 200,
+             'body': '{"packages": []}', 'elapsed': 0.01, 'offset': 0.0},
+            {'method': 'POST', 'url': 'https://api.example.com/shipments', 'status': 201,
+             'request_body': '{"weight":2}', 'body': '{"shipment": {"id": 7}}', 'elapsed': 0.01, 'offset': 0.02}
+        ]
+        path.write_text(''.join(json.dumps(line) + '\n' for line in lines))
+
+        report = bench_replay.replay(path, latency=1.0, speed=1.0, threads=2)
+
+        assert report['requests'] == 2
+        assert report['errors'] == 0
+        assert report['seconds'] >= 0.03
+        assert report['p50'] >= 0.01
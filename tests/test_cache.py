@@ -0,0 +1,137 @@
+"""Tests pour le cache des réponses"""
+import time
+import responses
+from tassi import Tassi, Package, Marketplace
+from tassi.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests pour ResponseCache"""
+
+    def test_lru_eviction(self):
+        """Test de l'éviction des entrées les moins récemment utilisées"""
+        cache = ResponseCache(ttl=60, maxsize=2)
+        cache.set('/packages/1', {'data': 1})
+        cache.set('/packages/2', {'data': 2})
+        cache.get('/packages/1')
+        cache.set('/packages/3', {'data': 3})
+
+        assert cache.get('/packages/2') is None
+        assert cache.get('/packages/1').response == {'data': 1}
+        assert len(cache) == 2
+
+    def test_expiration(self):
+        """Test de l'expiration des entrées sans ETag"""
+        cache = ResponseCache(ttl=0.01)
+        cache.set('/packages/1', {'data': 1})
+        cache.set('/packages/2', {'data': 2}, etag='"v2"')
+        time.sleep(0.02)
+
+        assert cache.get('/packages/1') is None
+        entry = cache.get('/packages/2')
+        assert entry is not None and not entry.fresh
+
+    def test_stale_write_after_invalidation(self):
+        """Test du rejet d'une réponse lue avant une invalidation"""
+        cache = ResponseCache()
+        version = cache.version()
+        cache.invalidate('/packages/1')
+        cache.set('/packages/1', {'data': 'old'}, version=version)
+
+        assert cache.get('/packages/1') is None
+
+
+class TestResourceCache:
+    """Tests du cache sur les ressources"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        Package.set_cache(ResponseCache(ttl=60))
+
+    def teardown_method(self):
+        """Désactive le cache"""
+        Package.set_cache(None)
+
+    @responses.activate
+    def test_retrieve_cached(self):
+        """Test d'une récupération servie depuis le cache"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "status": "in_transit"}},
+            status=200
+        )
+
+        first = Package.retrieve(4)
+        second = Package.retrieve(4)
+
+        assert first.status == second.status == "in_transit"
+        assert first is not second
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_cache_is_per_resource(self):
+        """Test d'un cache propre à chaque ressource"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1',
+            json={"id": 1},
+            status=200
+        )
+
+        Marketplace.retrieve(1)
+        Marketplace.retrieve(1)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_etag_revalidation(self):
+        """Test de la revalidation par ETag"""
+        Package.set_cache(ResponseCache(ttl=0))
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "status": "in_transit"}},
+            headers={"ETag": '"v1"'},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            status=304
+        )
+
+        Package.retrieve(4)
+        pkg = Package.retrieve(4)
+
+        assert pkg.status == "in_transit"
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+
+    @responses.activate
+    def test_update_invalidates(self):
+        """Test de l'invalidation du cache après une mise à jour"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "weight": "5.0"}},
+            status=200
+        )
+        responses.add(
+            responses.PUT,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "weight": "15.0"}},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "weight": "15.0"}},
+            status=200
+        )
+
+        assert Package.retrieve(4).weight == "5.0"
+        Package.update(4, {"weight": "15.0"})
+        assert Package.retrieve(4).weight == "15.0"
+        assert len(responses.calls) == 3
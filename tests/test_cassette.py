@@ -0,0 +1,112 @@
+"""Tests pour l'enregistrement et le rejeu des échanges"""
+import json
+import time
+import pytest
+import responses
+from tassi import Tassi, Package, Shipment, Requestor
+from tassi.cassette import RecordAdapter, ReplayAdapter, load_cassette
+from tassi.error import CassetteError
+
+
+class TestCassette:
+    """Tests pour RecordAdapter et ReplayAdapter"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+
+    def teardown_method(self):
+        """Réinitialise les requestors"""
+        Package.set_requestor(None)
+        Shipment.set_requestor(None)
+
+    @responses.activate
+    def record(self, path):
+        """Enregistre quelques échanges contre l'API simulée"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "status": "in_transit"}}
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "status": "delivered"}}
+        )
+        responses.add(
+            responses.POST,
+            'https://tassi-api.exanora.com/shipments',
+            json={"shipment": {"id": 7}},
+            status=201
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4/label',
+            body=b'%PDF\xff\x00',
+            content_type='application/pdf'
+        )
+
+        requestor = Requestor(adapter=RecordAdapter(path))
+        Package.set_requestor(requestor)
+        Shipment.set_requestor(requestor)
+
+        Package.retrieve(4)
+        Package.retrieve(4)
+        Shipment.create({"marketplace_id": "1", "weight": 2})
+        label = b''.join(requestor.stream('get', '/packages/4/label'))
+        requestor.close()
+        return label
+
+    def test_record(self, tmp_path):
+        """Test du contenu de la cassette"""
+        path = tmp_path / 'traffic.jsonl'
+        self.record(path)
+
+        interactions = load_cassette(path)
+        assert [(i['method'], i['status']) for i in interactions] == [
+            ('GET', 200), ('GET', 200), ('POST', 201), ('GET', 200)
+        ]
+        assert json.loads(interactions[2]['request_body']) == {"marketplace_id": "1", "weight": 2}
+        assert interactions[3]['encoding'] == 'base64'
+        assert interactions[0]['offset'] == 0.0
+        assert all(i['elapsed'] >= 0 for i in interactions)
+        assert 'test_api_key' not in path.read_text()
+
+    def test_replay(self, tmp_path):
+        """Test du rejeu sans réseau, dans l'ordre d'enregistrement"""
+        path = tmp_path / 'traffic.jsonl.gz'
+        label = self.record(path)
+
+        requestor = Requestor(adapter=ReplayAdapter(path, repeat=False))
+        Package.set_requestor(requestor)
+        Shipment.set_requestor(requestor)
+
+        assert Package.retrieve(4).status == 'in_transit'
+        assert Package.retrieve(4).status == 'delivered'
+        assert Shipment.create({"marketplace_id": "1", "weight": 2}).id == 7
+        assert b''.join(requestor.stream('get', '/packages/4/label')) == label
+
+        with pytest.raises(CassetteError):
+            Package.retrieve(4)
+        with pytest.raises(CassetteError):
+            Shipment.create({"marketplace_id": "1", "weight": 3})
+
+    def test_replay_repeat_and_latency(self, tmp_path):
+        """Test du rejeu en boucle avec la durée enregistrée"""
+        path = tmp_path / 'traffic.jsonl'
+        path.write_text(json.dumps({
+            'method': 'GET',
+            'url': 'https://api.example.com/packages/1',
+            'status': 200,
+            'headers': {'Content-Type': 'application/json'},
+            'body': '{"package": {"id": 1}}',
+            'elapsed': 0.05,
+            'offset': 0.0
+        }) + '\n')
+
+        requestor = Requestor(adapter=ReplayAdapter(path, latency=1.0))
+        started_at = time.monotonic()
+        for _ in range(2):
+            assert requestor.request('get', '/packages/1')['data'] == {"package": {"id": 1}}
+        assert time.monotonic() - started_at >= 0.1
@@ -0,0 +1,203 @@
+"""Tests pour le disjoncteur"""
+import asyncio
+import httpx
+import pytest
+import responses
+from tassi import Tassi, Requestor, AsyncRequestor, CircuitBreaker, CircuitOpenError, TassiClient
+from tassi.error import ApiConnectionError
+from tassi.retry import RetryPolicy
+
+
+class FakeClock:
+    """Horloge manuelle"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests pour CircuitBreaker"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        self.clock = FakeClock()
+
+    def test_opens_on_failure_rate(self):
+        """Test de l'ouverture au-delà du taux d'échec"""
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4, clock=self.clock)
+
+        for status in (200, 404, 503):
+            breaker.record('GET', '/packages/{id}', status, 0.1)
+        assert breaker.state('GET', '/packages/{id}') == 'closed'
+
+        breaker.record('GET', '/packages/{id}', None, 0.1)
+        assert breaker.state('get', '/packages/{id}') == 'open'
+        assert breaker.state('GET', '/packages') == 'closed'
+        assert not breaker.healthy
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call('GET', '/packages/{id}')
+        assert exc_info.value.endpoint == 'GET /packages/{id}'
+        assert exc_info.value.retry_after == 30.0
+        breaker.before_call('GET', '/packages')
+
+    def test_window(self):
+        """Test de l'oubli des appels sortis de la fenêtre"""
+        breaker = CircuitBreaker(minimum_calls=2, window=10, clock=self.clock)
+
+        breaker.record('GET', '/packages', 500, 0.1)
+        self.clock.now = 11.0
+        breaker.record('GET', '/packages', 200, 0.1)
+        breaker.record('GET', '/packages', 200, 0.1)
+
+        assert breaker.states()['GET /packages'] == {
+            'state': 'closed',
+            'calls': 2,
+            'failure_rate': 0.0,
+            'retry_after': None
+        }
+
+    def test_opens_on_slow_calls(self):
+        """Test de l'ouverture sur les appels lents"""
+        breaker = CircuitBreaker(
+            slow_call_duration=1.0, slow_call_rate_threshold=0.5, minimum_calls=2, clock=self.clock
+        )
+
+        breaker.record('POST', '/shipments', 201, 0.2)
+        breaker.record('POST', '/shipments', 201, 2.5)
+
+        assert breaker.state('POST', '/shipments') == 'open'
+
+    def test_half_open_probe(self):
+        """Test de la requête de test après le délai"""
+        breaker = CircuitBreaker(minimum_calls=1, reset_timeout=5, clock=self.clock)
+        breaker.record('GET', '/packages', 502, 0.1)
+
+        self.clock.now = 5.0
+        assert breaker.state('GET', '/packages') == 'half_open'
+        breaker.before_call('GET', '/packages')
+
+        # Une seule requête de test à la fois
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call('GET', '/packages')
+
+        breaker.record('GET', '/packages', 502, 0.1)
+        assert breaker.state('GET', '/packages') == 'open'
+        assert breaker.states()['GET /packages']['retry_after'] == 5.0
+
+        self.clock.now = 10.0
+        breaker.before_call('GET', '/packages')
+        breaker.record('GET', '/packages', 200, 0.1)
+        assert breaker.state('GET', '/packages') == 'closed'
+        assert breaker.healthy
+
+    @responses.activate
+    def test_requestor_fails_fast(self):
+        """Test de l'échec immédiat du requestor quand le circuit est ouvert"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', json={}, status=503)
+
+        breaker = CircuitBreaker(minimum_calls=2, clock=self.clock)
+        requestor = Requestor(
+            retry_policy=RetryPolicy(max_retries=5, backoff_factor=0, jitter=False),
+            circuit_breaker=breaker
+        )
+
+        # Les nouvelles tentatives s'arrêtent dès l'ouverture du circuit
+        with pytest.raises(CircuitOpenError):
+            requestor.request('get', '/packages/1')
+        assert len(responses.calls) == 2
+
+        with pytest.raises(ApiConnectionError):
+            requestor.request('get', '/packages/2')
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_requestor_client_errors(self):
+        """Test des erreurs 4xx, qui ne comptent pas comme des échecs"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', json={}, status=404)
+
+        breaker = CircuitBreaker(minimum_calls=1, clock=self.clock)
+        requestor = Requestor(circuit_breaker=breaker)
+        for _ in range(3):
+            with pytest.raises(ApiConnectionError):
+                requestor.request('get', '/packages/1')
+
+        assert breaker.states()['GET /packages/{id}']['calls'] == 3
+        assert breaker.state('GET', '/packages/{id}') == 'closed'
+
+    def test_async_requestor(self):
+        """Test du disjoncteur avec le requestor asynchrone"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("connection refused")
+
+        breaker = CircuitBreaker(minimum_calls=1, clock=self.clock)
+        requestor = AsyncRequestor(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry_policy=RetryPolicy(max_retries=3, backoff_factor=0, jitter=False),
+            circuit_breaker=breaker
+        )
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(requestor.request('get', '/packages/1'))
+        assert len(calls) == 1
+        assert breaker.state('GET', '/packages/{id}') == 'open'
+
+    def test_cancelled_probe_released(self):
+        """Test d'une requête de test annulée : la place est rendue"""
+        async def handler(request):
+            if request.url.params.get('hang'):
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={})
+
+        breaker = CircuitBreaker(minimum_calls=1, reset_timeout=5, clock=self.clock)
+        breaker.record('GET', '/packages', 500, 0.1)
+        self.clock.now = 5.0
+        requestor = AsyncRequestor(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            coalesce_gets=False,
+            circuit_breaker=breaker
+        )
+
+        async def scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(requestor.request('get', '/packages', {"hang": "1"}), 0.05)
+            assert breaker.state('GET', '/packages') == 'half_open'
+            await requestor.request('get', '/packages')
+
+        asyncio.run(scenario())
+        assert breaker.state('GET', '/packages') == 'closed'
+
+    def test_probe_released_on_unexpected_error(self):
+        """Test d'une requête de test interrompue par une exception inattendue"""
+        class FailingAdapter:
+            def send(self, request, **kwargs):
+                raise RuntimeError("adapter failure")
+
+            def close(self):
+                pass
+
+        breaker = CircuitBreaker(minimum_calls=1, reset_timeout=5, clock=self.clock)
+        breaker.record('GET', '/packages', 500, 0.1)
+        self.clock.now = 5.0
+        requestor = Requestor(adapter=FailingAdapter(), circuit_breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                requestor.request('get', '/packages')
+        assert breaker.state('GET', '/packages') == 'half_open'
+
+    def test_client_option(self):
+        """Test de la transmission du disjoncteur par TassiClient"""
+        breaker = CircuitBreaker()
+        client = TassiClient('client_key', circuit_breaker=breaker)
+
+        assert client.requestor.circuit_breaker is breaker
+        assert client.async_requestor.circuit_breaker is breaker
@@ -0,0 +1,98 @@
+"""Tests pour TassiClient"""
+import asyncio
+import threading
+import httpx
+import responses
+from tassi import Tassi, TassiClient, Package, ResponseCache
+
+
+class TestTassiClient:
+    """Tests pour TassiClient"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('global_api_key')
+        Tassi.set_environment('sandbox')
+
+    @responses.activate
+    def test_own_configuration(self):
+        """Test de l'utilisation de la configuration du client"""
+        responses.add(
+            responses.GET,
+            'https://tenant-a.example.com/packages/4',
+            json={"package": {"id": 4}},
+            status=200
+        )
+
+        client = TassiClient('key_a', environment='live', api_base='https://tenant-a.example.com')
+        package = client.Package.retrieve(4)
+
+        assert package.id == 4
+        assert responses.calls[0].request.headers['Authorization'] == 'Bearer key_a'
+        assert Tassi.get_api_key() == 'global_api_key'
+        assert Package.get_requestor() is not client.requestor
+
+    @responses.activate
+    def test_concurrent_tenants(self):
+        """Test de plusieurs clients utilisés simultanément"""
+        def callback(request):
+            key = request.headers['Authorization'].split()[-1]
+            return (200, {}, f'{{"marketplace": {{"id": 1, "key": "{key}"}}}}')
+
+        responses.add_callback(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1',
+            callback=callback,
+            content_type='application/json'
+        )
+
+        clients = [TassiClient(f'key_{i}') for i in range(8)]
+        results = {}
+
+        def worker(client):
+            results[client.api_key] = client.Marketplace.retrieve(1).key
+
+        threads = [threading.Thread(target=worker, args=(client,)) for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {f'key_{i}': f'key_{i}' for i in range(8)}
+
+    def test_resources_are_isolated(self):
+        """Test de l'isolation des requestors et des caches"""
+        first = TassiClient('key_a')
+        second = TassiClient('key_b')
+        first.Package.set_cache(ResponseCache())
+
+        assert issubclass(first.Package, Package)
+        assert first.Package.class_path() == '/packages'
+        assert first.Package.get_requestor() is first.requestor
+        assert second.Package.get_requestor() is second.requestor
+        assert second.Package.get_cache() is None
+        assert Package.get_cache() is None
+
+    def test_headers_are_precomputed(self):
+        """Test de la réutilisation des headers par défaut"""
+        client = TassiClient('key_a')
+
+        headers = client.requestor._default_headers()
+        assert headers['Authorization'] == 'Bearer key_a'
+        assert client.requestor._default_headers() is headers
+
+    def test_async(self):
+        """Test du requestor asynchrone du client"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"shipment": {"id": 1}})
+
+        client = TassiClient('key_a')
+        client.async_requestor._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        shipment = asyncio.run(client.Shipment.create_async({"marketplace_id": "1"}))
+
+        assert shipment.id == 1
+        assert calls[0].headers['Authorization'] == 'Bearer key_a'
@@ -0,0 +1,76 @@
+"""Tests pour les codecs JSON"""
+import json
+import sys
+import pytest
+import responses
+from tassi import Tassi, Requestor
+from tassi import codec
+from tassi.error import ApiConnectionError
+
+
+class TestCodec:
+    """Tests pour get_codec et les codecs"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+
+    def test_json_codec(self):
+        """Test du codec de la bibliothèque standard"""
+        json_codec = codec.get_codec('json')
+        assert json_codec.loads(json_codec.dumps({"a": [1, "é"]})) == {"a": [1, "é"]}
+
+    def test_orjson_codec(self):
+        """Test du codec orjson et de son repli sur json"""
+        pytest.importorskip('orjson')
+        orjson_codec = codec.get_codec('orjson')
+
+        assert orjson_codec.name == 'orjson'
+        assert codec.get_codec('auto').name == 'orjson'
+        assert json.loads(orjson_codec.dumps({1: "a"})) == {"1": "a"}
+        assert json.loads(orjson_codec.dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+    def test_missing_backend_fallback(self, monkeypatch):
+        """Test du repli sur json quand le module n'est pas installé"""
+        monkeypatch.setattr(codec, '_instances', {})
+        monkeypatch.setitem(sys.modules, 'ujson', None)
+
+        assert codec.get_codec('ujson').name == 'json'
+
+    def test_unknown_codec(self, monkeypatch):
+        """Test d'un codec inconnu"""
+        monkeypatch.setattr(codec, '_instances', {})
+        with pytest.raises(ValueError):
+            codec.get_codec('yaml')
+
+    @responses.activate
+    def test_requestor_codec(self):
+        """Test de l'encodage et du décodage par le requestor"""
+        responses.add(
+            responses.POST,
+            'https://tassi-api.exanora.com/shipments',
+            json={"shipment": {"id": 1}},
+            status=201
+        )
+
+        requestor = Requestor(json_codec='json')
+        response = requestor.request('post', '/shipments', {"marketplace_id": "1"})
+
+        assert response['data'] == {"shipment": {"id": 1}}
+        assert json.loads(responses.calls[0].request.body) == {"marketplace_id": "1"}
+        assert responses.calls[0].request.headers['Content-Type'] == 'application/json'
+
+    @responses.activate
+    def test_invalid_json_response(self):
+        """Test d'une réponse JSON invalide"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            body="<html>Bad gateway</html>",
+            status=200
+        )
+
+        with pytest.raises(ApiConnectionError) as excinfo:
+            Requestor().request('get', '/packages/1')
+        assert excinfo.value.http_status == 200
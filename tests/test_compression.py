@@ -0,0 +1,93 @@
+"""Tests pour la compression des corps"""
+import asyncio
+import gzip
+import json
+import httpx
+import pytest
+import responses
+from tassi import Tassi, Requestor, AsyncRequestor
+from tassi.compression import accept_encoding, get_compressor
+
+
+class TestCompression:
+    """Tests pour la compression des requêtes et la décompression des réponses"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+
+    def test_get_compressor(self):
+        """Test du choix du compresseur"""
+        assert get_compressor('gzip').name == 'gzip'
+        assert get_compressor('auto').name in ('br', 'gzip')
+        assert gzip.decompress(get_compressor('gzip').compress(b'{"a":1}')) == b'{"a":1}'
+
+        with pytest.raises(ValueError):
+            get_compressor('zip')
+
+    @responses.activate
+    def test_request_body_compressed_above_threshold(self):
+        """Test de la compression des corps à partir du seuil"""
+        received = []
+
+        def callback(request):
+            received.append(request)
+            return (201, {}, json.dumps({"shipment": {"id": 1}}))
+
+        responses.add_callback(responses.POST, 'https://tassi-api.exanora.com/shipments', callback=callback)
+
+        requestor = Requestor(compression='gzip', compression_threshold=100)
+        large = {"packages": [{"description": "Colis test"} for _ in range(20)]}
+        requestor.request('post', '/shipments', large)
+        requestor.request('post', '/shipments', {"weight": 2})
+
+        assert received[0].headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(received[0].body)) == large
+        assert 'Content-Encoding' not in received[1].headers
+        assert json.loads(received[1].body) == {"weight": 2}
+
+    @responses.activate
+    def test_no_compression_by_default(self):
+        """Test des corps non compressés sans option"""
+        responses.add(responses.POST, 'https://tassi-api.exanora.com/shipments', json={}, status=201)
+
+        Requestor().request('post', '/shipments', {"notes": "x" * 5000})
+
+        assert 'Content-Encoding' not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_response_decompressed_while_streaming(self):
+        """Test de la négociation et de la décompression au fil de la lecture"""
+        content = b'%PDF' + b'0123456789' * 10000
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4/label',
+            body=gzip.compress(content),
+            headers={'Content-Encoding': 'gzip'},
+            content_type='application/pdf'
+        )
+
+        chunks = list(Requestor().stream('get', '/packages/4/label', chunk_size=8192))
+
+        assert b''.join(chunks) == content
+        assert len(chunks) > 1
+        assert responses.calls[0].request.headers['Accept-Encoding'] == accept_encoding()
+
+    def test_async_request_body_compressed(self):
+        """Test de la compression avec le requestor asynchrone"""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(201, json={"shipment": {"id": 1}})
+
+        requestor = AsyncRequestor(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            compression='gzip',
+            compression_threshold=10
+        )
+        asyncio.run(requestor.request('post', '/shipments', {"notes": "x" * 100}))
+
+        assert received[0].headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(received[0].content)) == {"notes": "x" * 100}
@@ -0,0 +1,85 @@
+"""Tests pour le transport HTTP/2"""
+import threading
+import pytest
+from benchmarks.stub_server import H2StubServer
+from tassi import Requestor, TassiClient
+from tassi.error import ApiConnectionError
+from tassi.http2 import Http2Adapter
+from tassi.retry import RetryPolicy
+
+
+class TestHttp2:
+    """Tests pour Http2Adapter contre un serveur HTTP/2 local"""
+
+    def setup_method(self):
+        """Démarre le serveur HTTP/2"""
+        self.server = H2StubServer(latency=0.05).start()
+        self.requestor = Requestor(
+            api_key='test_api_key',
+            api_base=self.server.url,
+            adapter=Http2Adapter(http1=False),
+            retry_policy=RetryPolicy(max_retries=0)
+        )
+
+    def teardown_method(self):
+        """Arrête le serveur"""
+        self.requestor.close()
+        self.server.stop()
+
+    def test_request(self):
+        """Test d'une requête HTTP/2"""
+        response = self.requestor.request('post', '/shipments', {"weight": 2})
+
+        assert response['status'] == 200
+        assert response['data'] == {"shipment": {"id": 1, "weight": 2}}
+        assert self.requestor.session.get(f"{self.server.url}/packages/1").http_version == 'HTTP/2'
+
+    def test_multiplexing(self):
+        """Test du multiplexage des requêtes simultanées sur une connexion"""
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(self.requestor.request('get', f'/packages/{i}')))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(r['data']['package']['id'] for r in results) == list(range(20))
+        assert self.server.connections == 1
+
+    def test_stream(self):
+        """Test de la lecture par blocs"""
+        body = b''.join(self.requestor.stream('get', '/packages', {"per_page": 500}, chunk_size=1024))
+        assert body.startswith(b'{"packages": [')
+        assert len(body) > 65535
+
+    def test_http_error(self):
+        """Test de conversion des erreurs HTTP"""
+        with pytest.raises(ApiConnectionError) as excinfo:
+            self.requestor.request('get', '/unknown')
+        assert excinfo.value.http_status == 404
+
+    def test_connection_error(self):
+        """Test de conversion des erreurs de connexion"""
+        url = self.server.url
+        self.server.stop()
+
+        requestor = Requestor(
+            api_base=url,
+            adapter=Http2Adapter(http1=False),
+            retry_policy=RetryPolicy(max_retries=0)
+        )
+        with pytest.raises(ApiConnectionError) as excinfo:
+            requestor.request('get', '/packages/1')
+        assert excinfo.value.http_status is None
+        self.server = H2StubServer().start()
+
+    def test_client_option(self):
+        """Test de l'activation de HTTP/2 pour un client"""
+        client = TassiClient('key_a', http2=True, pool_maxsize=4)
+
+        adapter = client.requestor.adapter
+        assert isinstance(adapter, Http2Adapter)
+        assert adapter.max_connections == 4
@@ -1,6 +1,7 @@
 """Tests pour la ressource Marketplace"""
 import pytest
 import responses
+from responses import matchers
 from tassi import Tassi, Marketplace
 from tassi.error import ApiConnectionError
 
@@ -72,6 +73,30 @@ class TestMarketplace:
         marketplace = Marketplace.update(1, {"website": "market-app.com"})
         assert marketplace.website == "market-app.com"
 
+    @responses.activate
+    def test_save(self):
+        """Test de l'enregistrement d'une marketplace"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1',
+            json={"id": 1, "name": "Market1", "website": "market-app.com", "is_active": True}
+        )
+        responses.add(
+            responses.PUT,
+            'https://tassi-api.exanora.com/marketplaces/1',
+            json={"id": 1, "name": "Market1", "website": "market.bj", "is_active": True},
+            match=[matchers.json_params_matcher({"website": "market.bj"})]
+        )
+
+        marketplace = Marketplace.retrieve(1)
+        marketplace.save()
+        assert len(responses.calls) == 1
+
+        marketplace.website = "market.bj"
+        marketplace.save()
+        assert len(responses.calls) == 2
+        assert marketplace.website == "market.bj"
+
     @responses.activate
     def test_update_validation_error(self):
         """Test de validation avec email invalide"""
@@ -134,6 +159,53 @@ class TestMarketplace:
         assert result.wallet_movements[0].action == "Credit"
         assert result.wallet_movements[2].action == "Debit"
 
+    @responses.activate
+    def test_iter_wallet_history(self):
+        """Test du parcours paginé de l'historique du wallet"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1/wallet_history',
+            json={
+                "wallet_movements": [{"id": 7}, {"id": 6}],
+                "meta": {"current_page": 1, "total_pages": 2}
+            },
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1/wallet_history',
+            json={
+                "wallet_movements": [{"id": 5}],
+                "meta": {"current_page": 2, "total_pages": 2}
+            },
+            status=200
+        )
+
+        marketplace = Marketplace()
+        marketplace.id = 1
+        movements = list(marketplace.iter_wallet_history())
+
+        assert [m.id for m in movements] == [7, 6, 5]
+        assert len(responses.calls) == 2
+        assert 'page=2' in responses.calls[1].request.url
+
+    @responses.activate
+    def test_iter_wallet_history_stream(self):
+        """Test du parcours de l'historique avec analyse au fil de l'eau"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/marketplaces/1/wallet_history',
+            json={"wallet_movements": [{"id": 7, "action": "Credit"}, {"id": 6, "action": "Debit"}]},
+            status=200
+        )
+
+        marketplace = Marketplace()
+        marketplace.id = 1
+        movements = list(marketplace.iter_wallet_history(stream=True))
+
+        assert [m.action for m in movements] == ["Credit", "Debit"]
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_get_wallet_history_empty(self):
         """Test avec historique vide"""
@@ -0,0 +1,94 @@
+"""Tests pour les mesures des requêtes"""
+import pytest
+import requests
+import responses
+from tassi import Tassi, Requestor, MetricsCollector
+from tassi.error import ApiConnectionError
+from tassi.hooks import path_template
+from tassi.retry import RetryPolicy
+
+
+class TestMetricsCollector:
+    """Tests pour MetricsCollector"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        self.spans = []
+        self.metrics = MetricsCollector(span_callback=self.spans.append)
+        self.requestor = Requestor(retry_policy=RetryPolicy(backoff_factor=0, jitter=False))
+        self.metrics.install(self.requestor)
+
+    def test_path_template(self):
+        """Test du remplacement des identifiants dans le chemin"""
+        assert path_template('/packages/4/shipping_labels/12') == '/packages/{id}/shipping_labels/{id}'
+        assert path_template('/marketplaces/tassi_abc123/wallet') == '/marketplaces/{id}/wallet'
+        assert path_template('/packages?page=2') == '/packages'
+
+    @responses.activate
+    def test_latency_and_bytes(self):
+        """Test des mesures de latence et de volume"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', body='{"id": 1}', status=200)
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/2', body='{"id": 2}', status=200)
+        responses.add(responses.POST, 'https://tassi-api.exanora.com/shipments', body='{}', status=200)
+
+        self.requestor.request('get', '/packages/1')
+        self.requestor.request('get', '/packages/2')
+        self.requestor.request('post', '/shipments', {"weight": 1})
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot['latency'][('GET', '/packages/{id}')]['count'] == 2
+        assert snapshot['responses'][('GET', '/packages/{id}', '200')] == 2
+        assert snapshot['bytes_in'][('GET', '/packages/{id}')] == 18
+        assert snapshot['bytes_out'][('POST', '/shipments')] == len(self.requestor.codec.dumps({"weight": 1}))
+        assert [span['name'] for span in self.spans] == [
+            'GET /packages/{id}', 'GET /packages/{id}', 'POST /shipments'
+        ]
+
+    @responses.activate
+    def test_errors_and_retries(self):
+        """Test des compteurs d'erreurs et de nouvelles tentatives"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', json={}, status=503)
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', json={}, status=200)
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/2',
+            body=requests.exceptions.ConnectionError("refused")
+        )
+
+        self.requestor.request('get', '/packages/1')
+        with pytest.raises(ApiConnectionError):
+            self.requestor.request('get', '/packages/2')
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot['errors'][('GET', '/packages/{id}', 'http_503')] == 1
+        assert snapshot['errors'][('GET', '/packages/{id}', 'ConnectionError')] == 3
+        assert snapshot['retries'][('GET', '/packages/{id}')] == 3
+        assert snapshot['responses'][('GET', '/packages/{id}', 'error')] == 3
+        assert self.spans[-1]['error'] is not None
+
+    @responses.activate
+    def test_prometheus_export(self):
+        """Test de l'export au format Prometheus"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', json={}, status=404)
+
+        with pytest.raises(ApiConnectionError):
+            self.requestor.request('get', '/packages/1')
+
+        text = self.metrics.to_prometheus()
+        assert '# TYPE tassi_request_duration_seconds histogram' in text
+        assert 'tassi_request_duration_seconds_count{method="GET",path="/packages/{id}"} 1' in text
+        assert 'tassi_request_duration_seconds_bucket{method="GET",path="/packages/{id}",le="+Inf"} 1' in text
+        assert 'tassi_responses_total{method="GET",path="/packages/{id}",status="404"} 1' in text
+        assert 'tassi_errors_total{method="GET",path="/packages/{id}",error="http_404"} 1' in text
+
+    @responses.activate
+    def test_uninstall(self):
+        """Test du retrait du collecteur"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages', json={}, status=200)
+
+        self.metrics.uninstall(self.requestor)
+        self.requestor.request('get', '/packages')
+
+        assert self.metrics.snapshot()['latency'] == {}
@@ -1,8 +1,33 @@
 """Tests pour la ressource Package"""
+import hashlib
+import io
 import pytest
 import responses
+from responses import matchers
 from tassi import Tassi, Package
-from tassi.error import InvalidRequestError
+from tassi.error import InvalidRequestError, ApiConnectionError, ChecksumMismatchError
+
+
+def add_label_metadata(label_id, file_url, checksum):
+    """Simule les métadonnées d'une étiquette du package 1"""
+    responses.add(
+        responses.GET,
+        f'https://tassi-api.exanora.com/packages/1/shipping_labels/{label_id}',
+        json={
+            "shipping_label": {
+                "id": label_id,
+                "label_type": "shipping_label",
+                "format": "pdf",
+                "size": "a4",
+                "file_url": file_url,
+                "checksum": checksum,
+                "version": 1,
+                "package_id": 1,
+                "filename": "tassi_TRK_99F75AD8447EA4C0_v1.pdf"
+            }
+        },
+        status=200
+    )
 
 
 class TestPackage:
@@ -53,6 +78,66 @@ class TestPackage:
         assert result.packages[0].insurance is False
         assert result.packages[0].signature_required is True
 
+    @responses.activate
+    def test_iter_all(self):
+        """Test du parcours paginé des packages"""
+        for page, ids in [(1, [1, 2]), (2, [3, 4]), (3, [5])]:
+            responses.add(
+                responses.GET,
+                'https://tassi-api.exanora.com/packages',
+                match=[matchers.query_param_matcher({"page": str(page), "per_page": "2"})],
+                json={
+                    "packages": [{"id": i} for i in ids],
+                    "meta": {"current_page": page, "total_count": 5}
+                },
+                status=200
+            )
+
+        packages = Package.iter_all({"per_page": 2})
+        assert next(packages).id == 1
+        assert len(responses.calls) == 1
+
+        assert [p.id for p in packages] == [2, 3, 4, 5]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_iter_all_prefetch(self):
+        """Test du parcours paginé avec préchargement"""
+        for page, ids in [(1, [1, 2]), (2, [])]:
+            responses.add(
+                responses.GET,
+                'https://tassi-api.exanora.com/packages',
+                match=[matchers.query_param_matcher({"page": str(page), "per_page": "2"})],
+                json={"packages": [{"id": i} for i in ids]},
+                status=200
+            )
+
+        packages = list(Package.iter_all({"per_page": 2}, prefetch=True))
+        assert [p.id for p in packages] == [1, 2]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_iter_all_stream(self):
+        """Test du parcours paginé avec analyse au fil de l'eau"""
+        for page, ids in [(1, [1, 2]), (2, [3])]:
+            responses.add(
+                responses.GET,
+                'https://tassi-api.exanora.com/packages',
+                match=[matchers.query_param_matcher({"page": str(page), "per_page": "2"})],
+                json={
+                    "packages": [{"id": i, "status": "in_transit"} for i in ids],
+                    "meta": {"current_page": page, "total_pages": 2}
+                },
+                status=200
+            )
+
+        packages = Package.iter_all({"per_page": 2}, stream=True)
+        assert next(packages).id == 1
+        assert len(responses.calls) == 1
+
+        assert [p.id for p in packages] == [2, 3]
+        assert len(responses.calls) == 2
+
     @responses.activate
     def test_retrieve(self):
         """Test de récupération d'un package"""
@@ -86,6 +171,42 @@ class TestPackage:
         assert pkg.insurance is False
         assert pkg.signature_required is True
 
+    @responses.activate
+    def test_retrieve_many(self):
+        """Test de récupération groupée avec erreurs partielles"""
+        for i in range(1, 11):
+            responses.add(
+                responses.GET,
+                f'https://tassi-api.exanora.com/packages/{i}',
+                json={"package": {"id": i}},
+                status=404 if i == 3 else 200
+            )
+
+        results = list(Package.retrieve_many(range(1, 11), max_workers=4))
+
+        assert [r.key for r in results] == list(range(1, 11))
+        assert [r.result.id for r in results if r.ok] == [1, 2, 4, 5, 6, 7, 8, 9, 10]
+        assert isinstance(results[2].error, ApiConnectionError)
+        assert results[2].error.http_status == 404
+
+    @responses.activate
+    def test_retrieve_many_unordered(self):
+        """Test de récupération groupée dans l'ordre de fin"""
+        for i in range(1, 6):
+            responses.add(
+                responses.GET,
+                f'https://tassi-api.exanora.com/packages/{i}',
+                json={"package": {"id": i}},
+                status=200
+            )
+
+        results = list(Package.retrieve_many([1, 2, 3, 4, 5, None], ordered=False))
+
+        assert sorted(r.result.id for r in results if r.ok) == [1, 2, 3, 4, 5]
+        failed = [r for r in results if not r.ok]
+        assert len(failed) == 1
+        assert isinstance(failed[0].error, InvalidRequestError)
+
     def test_retrieve_invalid_id(self):
         """Test avec un ID invalide"""
         with pytest.raises(InvalidRequestError):
@@ -122,6 +243,90 @@ class TestPackage:
         assert pkg.description == "Colis test contenant accessoires de coifure"
         assert pkg.weight == "15.0"
 
+    @responses.activate
+    def test_save(self):
+        """Test de l'enregistrement des seuls attributs modifiés"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {
+                "id": 4,
+                "status": "in_transit",
+                "weight": "5.0",
+                "customer": {"first_name": "Doe", "city": "Cotonou"},
+                "tags": ["fragile"]
+            }}
+        )
+        responses.add(
+            responses.PUT,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "weight": "15.0", "updated_at": "2024-01-02"}},
+            match=[matchers.json_params_matcher({
+                "weight": "15.0",
+                "customer": {"city": "Porto-Novo"},
+                "tags": ["fragile", "urgent"]
+            })]
+        )
+
+        pkg = Package.retrieve(4)
+        assert isinstance(pkg, Package)
+        assert not pkg.has_changes()
+
+        pkg.weight = "15.0"
+        pkg.status = "in_transit"
+        pkg.customer.city = "Porto-Novo"
+        pkg.tags.append("urgent")
+
+        assert pkg.save() is pkg
+        assert pkg.updated_at == "2024-01-02"
+        assert not pkg.has_changes()
+
+        # Rien n'a changé : aucune requête
+        pkg.save()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_save_lazy(self):
+        """Test de l'enregistrement en mode de conversion paresseuse"""
+        Tassi.set_object_mode('lazy')
+        try:
+            responses.add(
+                responses.GET,
+                'https://tassi-api.exanora.com/packages/4',
+                json={"package": {"id": 4, "customer": {"first_name": "Doe", "city": "Cotonou"}}}
+            )
+            responses.add(
+                responses.PUT,
+                'https://tassi-api.exanora.com/packages/4',
+                json={"package": {"id": 4}},
+                match=[matchers.json_params_matcher({"customer": {"first_name": "Jane"}})]
+            )
+
+            pkg = Package.retrieve(4)
+            pkg.customer.first_name = "Jane"
+            pkg.save()
+        finally:
+            Tassi.set_object_mode('eager')
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_save_new_instance(self):
+        """Test de l'enregistrement d'une instance construite localement"""
+        responses.add(
+            responses.PUT,
+            'https://tassi-api.exanora.com/packages/4',
+            json={"package": {"id": 4, "weight": "2.0"}},
+            match=[matchers.json_params_matcher({"weight": "2.0"})]
+        )
+
+        pkg = Package(4)
+        pkg.weight = "2.0"
+        pkg.save()
+
+        assert len(responses.calls) == 1
+        assert not pkg.has_changes()
+
     @responses.activate
     def test_track(self):
         """Test de suivi d'un package"""
@@ -171,4 +376,104 @@ class TestPackage:
         assert result.shipping_label.label_type == "shipping_label"
         assert result.shipping_label.format == "pdf"
         assert result.shipping_label.version == 1
-        assert result.shipping_label.filename == "tassi_TRK_99F75AD8447EA4C0_v1.pdf"
\ No newline at end of file
+        assert result.shipping_label.filename == "tassi_TRK_99F75AD8447EA4C0_v1.pdf"
+
+    @responses.activate
+    def test_download_shipping_label(self, tmp_path):
+        """Test du téléchargement d'étiquette par blocs vers un fichier"""
+        body = b"%PDF-1.4" + b"x" * 200000
+        file_url = 'https://files.exanora.com/labels/TRK_99F75AD8447EA4C0_v1.pdf?signature=abc'
+        add_label_metadata(1, file_url, hashlib.sha256(body).hexdigest())
+        responses.add(responses.GET, file_url, body=body, content_type='application/pdf')
+
+        pkg = Package()
+        pkg.id = 1
+        destination = tmp_path / "label.pdf"
+        result = pkg.download_shipping_label(1, destination, chunk_size=8192)
+
+        assert destination.read_bytes() == body
+        assert result.bytes_written == len(body)
+        assert result.checksum == hashlib.sha256(body).hexdigest()
+        assert result.filename == "tassi_TRK_99F75AD8447EA4C0_v1.pdf"
+        assert not (tmp_path / "label.pdf.part").exists()
+
+        # L'API key n'est pas envoyée à l'hôte du fichier
+        file_request = responses.calls[1].request
+        assert 'Authorization' not in file_request.headers
+        assert file_request.headers['Accept'] == '*/*'
+
+    @pytest.mark.parametrize('file_url', [
+        'https://tassi-api.exanora.com.evil.net/labels/1.pdf',
+        'https://tassi-api.exanora.com@evil.net/labels/1.pdf',
+        'http://tassi-api.exanora.com/labels/1.pdf',
+        'https://cdn.example.com/labels/1.pdf'
+    ])
+    @responses.activate
+    def test_download_shipping_label_foreign_host(self, file_url):
+        """Test d'un fichier hors de l'hôte de l'API : l'API key n'est pas envoyée"""
+        add_label_metadata(1, file_url, None)
+        responses.add(responses.GET, file_url, body=b"label")
+
+        pkg = Package()
+        pkg.id = 1
+        pkg.download_shipping_label(1, io.BytesIO())
+
+        assert 'Authorization' not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_download_shipping_label_to_buffer(self):
+        """Test du téléchargement d'étiquette vers un buffer"""
+        file_url = 'https://tassi-api.exanora.com/files/labels/2.pdf'
+        add_label_metadata(2, file_url, hashlib.sha256(b"label").hexdigest())
+        responses.add(responses.GET, file_url, body=b"label")
+
+        pkg = Package()
+        pkg.id = 1
+        buffer = io.BytesIO()
+        result = pkg.download_shipping_label(2, buffer)
+
+        assert buffer.getvalue() == b"label"
+        assert result.bytes_written == 5
+        assert responses.calls[1].request.headers['Authorization'] == 'Bearer test_api_key'
+
+    @responses.activate
+    def test_download_shipping_label_checksum_mismatch(self, tmp_path):
+        """Test d'un fichier altéré : l'erreur est levée et aucun fichier n'est créé"""
+        file_url = 'https://files.exanora.com/labels/3.pdf'
+        add_label_metadata(3, file_url, hashlib.sha256(b"expected").hexdigest())
+        responses.add(responses.GET, file_url, body=b"truncated")
+
+        pkg = Package()
+        pkg.id = 1
+        with pytest.raises(ChecksumMismatchError) as excinfo:
+            pkg.download_shipping_label(3, tmp_path / "label.pdf")
+
+        assert excinfo.value.actual == hashlib.sha256(b"truncated").hexdigest()
+        assert list(tmp_path.iterdir()) == []
+
+    @responses.activate
+    def test_download_shipping_label_not_generated(self, tmp_path):
+        """Test d'une étiquette dont le fichier n'est pas encore disponible"""
+        add_label_metadata(4, None, None)
+
+        pkg = Package()
+        pkg.id = 1
+        with pytest.raises(InvalidRequestError):
+            pkg.download_shipping_label(4, tmp_path / "label.pdf")
+
+        assert len(responses.calls) == 1
+        assert list(tmp_path.iterdir()) == []
+
+    @responses.activate
+    def test_download_shipping_label_error(self, tmp_path):
+        """Test d'un téléchargement en erreur sans fichier partiel"""
+        file_url = 'https://files.exanora.com/labels/5.pdf'
+        add_label_metadata(5, file_url, None)
+        responses.add(responses.GET, file_url, status=404)
+
+        pkg = Package()
+        pkg.id = 1
+        with pytest.raises(ApiConnectionError):
+            pkg.download_shipping_label(5, tmp_path / "label.pdf")
+
+        assert list(tmp_path.iterdir()) == []
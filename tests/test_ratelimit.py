@@ -0,0 +1,127 @@
+"""Tests pour la limitation du débit"""
+import multiprocessing
+import pytest
+import responses
+from tassi import Tassi, Requestor, RateLimiter, FileBackend
+from tassi.retry import RetryPolicy
+
+
+class FakeClock:
+    """Horloge manuelle"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reserve_in_process(path, queue):
+    limiter = RateLimiter(rate=1, burst=1, backend=FileBackend(path))
+    queue.put([limiter.reserve('GET', '/packages') for _ in range(2)])
+
+
+class TestRateLimiter:
+    """Tests pour RateLimiter"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        self.clock = FakeClock()
+
+    def test_token_bucket(self):
+        """Test du burst puis de l'attente"""
+        limiter = RateLimiter(rate=2, burst=3, clock=self.clock)
+
+        assert [limiter.reserve('GET', '/packages') for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+        # Après 1 seconde, les deux jetons réservés viennent d'être produits
+        self.clock.now = 1.0
+        assert limiter.reserve('GET', '/packages') == 0.5
+
+    def test_per_endpoint_buckets(self):
+        """Test des seaux par endpoint et des limites spécifiques"""
+        limiter = RateLimiter(rate=1, limits={"POST /shipments": (10, 2)}, clock=self.clock)
+
+        assert limiter.reserve('GET', '/packages') == 0
+        assert limiter.reserve('GET', '/packages/{id}') == 0
+        assert limiter.bucket('post', '/shipments') == ('POST /shipments', 10.0, 2.0)
+
+        shared = RateLimiter(rate=1, per_endpoint=False, clock=self.clock)
+        assert shared.reserve('GET', '/packages') == 0
+        assert shared.reserve('GET', '/packages/{id}') == 1.0
+
+    def test_pause(self):
+        """Test de la suspension d'un endpoint"""
+        limiter = RateLimiter(rate=10, clock=self.clock)
+        limiter.pause('GET', '/packages', 3)
+
+        assert limiter.reserve('GET', '/packages') == 3.0
+
+    @pytest.mark.parametrize('kwargs', [
+        {'rate': 0},
+        {'rate': -1},
+        {'rate': 5, 'burst': 0},
+        {'limits': {"POST /shipments": 0}},
+        {'limits': {"POST /shipments": (2, 0.5)}}
+    ])
+    def test_invalid_limits(self, kwargs):
+        """Test du refus d'un débit nul ou négatif et d'un burst inférieur à 1"""
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+    def test_file_backend_across_processes(self, tmp_path):
+        """Test du partage des seaux entre processus"""
+        path = tmp_path / 'ratelimit.json'
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_reserve_in_process, args=(path, queue))
+        process.start()
+        first = queue.get(timeout=10)
+        process.join()
+
+        limiter = RateLimiter(rate=1, burst=1, backend=FileBackend(path))
+        waits = first + [limiter.reserve('GET', '/packages')]
+
+        # Un seul jeton disponible pour les trois réservations
+        assert waits[0] == 0
+        assert 0.5 < waits[1] <= 1.0
+        assert 1.5 < waits[2] <= 2.0
+
+    @responses.activate
+    def test_requestor_pauses_on_429(self):
+        """Test de la suspension de l'endpoint après un 429"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            json={},
+            status=429,
+            headers={"Retry-After": "30"}
+        )
+
+        limiter = RateLimiter(rate=100, clock=self.clock)
+        requestor = Requestor(retry_policy=RetryPolicy(max_retries=0), rate_limiter=limiter)
+        try:
+            requestor.request('get', '/packages/1')
+        except Exception:
+            pass
+
+        assert limiter.reserve('GET', '/packages/{id}') == 30.0
+
+    @responses.activate
+    def test_requestor_throttles(self):
+        """Test de l'attente avant l'envoi des requêtes"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages', json={}, status=200)
+
+        waits = []
+        limiter = RateLimiter(rate=50, burst=1)
+        original = limiter.acquire
+        limiter.acquire = lambda *args: waits.append(original(*args))
+
+        requestor = Requestor(rate_limiter=limiter)
+        requestor.request('get', '/packages', {"page": 1})
+        requestor.request('get', '/packages', {"page": 2})
+
+        assert len(responses.calls) == 2
+        assert waits[0] == 0
+        assert waits[1] > 0
@@ -0,0 +1,304 @@
+"""Tests pour le Requestor"""
+import contextlib
+import socket
+import threading
+import time
+import pytest
+import requests
+import responses
+from tassi import Tassi, Requestor
+from tassi.error import ApiConnectionError
+from tassi.retry import RetryPolicy, parse_retry_after
+
+
+@contextlib.contextmanager
+def silent_server():
+    """Serveur local qui accepte les connexions sans jamais répondre"""
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(8)
+    connections = []
+    stop = threading.Event()
+
+    def accept():
+        server.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                connections.append(server.accept()[0])
+            except OSError:
+                continue
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    try:
+        yield server.getsockname()[1]
+    finally:
+        stop.set()
+        thread.join()
+        for connection in connections:
+            connection.close()
+        server.close()
+
+
+class TestRequestor:
+    """Tests pour Requestor"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+
+    def test_pool_configuration(self):
+        """Test de la configuration du pool de connexions"""
+        requestor = Requestor(pool_connections=4, pool_maxsize=32, pool_block=True)
+        adapter = requestor.session.get_adapter('https://tassi-api.exanora.com')
+
+        assert adapter is requestor.adapter
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+    def test_keep_alive_disabled(self):
+        """Test de la désactivation du keep-alive"""
+        requestor = Requestor(keep_alive=False)
+        assert requestor.session.headers['Connection'] == 'close'
+
+    def test_session_per_thread(self):
+        """Test d'une session par thread partageant le même pool"""
+        requestor = Requestor()
+        sessions = []
+
+        def worker():
+            sessions.append(requestor.session)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(session) for session in sessions}) == 4
+        adapters = {id(session.get_adapter('https://tassi-api.exanora.com')) for session in sessions}
+        assert adapters == {id(requestor.adapter)}
+
+    @responses.activate
+    def test_concurrent_requests(self):
+        """Test de requêtes simultanées depuis plusieurs threads"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            json={"id": 1},
+            status=200
+        )
+
+        requestor = Requestor(pool_maxsize=8)
+        results = []
+
+        def worker():
+            results.append(requestor.request('get', '/packages/1')['data'])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"id": 1}] * 8
+        requestor.close()
+
+    @responses.activate
+    def test_retry_on_transient_status(self):
+        """Test des nouvelles tentatives sur 502 et 429"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', status=502)
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            headers={"Retry-After": "0"},
+            status=429
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            json={"id": 1},
+            status=200
+        )
+
+        requestor = Requestor(retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+        assert requestor.request('get', '/packages/1')['data'] == {"id": 1}
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_retry_exhausted(self):
+        """Test de l'abandon après le nombre maximal de tentatives"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/1', status=503)
+
+        requestor = Requestor(retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+        with pytest.raises(ApiConnectionError) as excinfo:
+            requestor.request('get', '/packages/1')
+
+        assert excinfo.value.http_status == 503
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_no_retry_on_client_error(self):
+        """Test de l'absence de nouvelle tentative sur 400"""
+        responses.add(responses.PUT, 'https://tassi-api.exanora.com/packages/1', status=400)
+
+        requestor = Requestor(retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+        with pytest.raises(ApiConnectionError):
+            requestor.request('put', '/packages/1', {"weight": -1})
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retry_on_connection_error(self):
+        """Test des nouvelles tentatives sur erreur de connexion"""
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            body=requests.exceptions.ConnectionError("Connection reset by peer")
+        )
+        responses.add(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            json={"id": 1},
+            status=200
+        )
+
+        requestor = Requestor(retry_policy=RetryPolicy(max_retries=1, backoff_factor=0))
+        assert requestor.request('get', '/packages/1')['data'] == {"id": 1}
+
+    def test_retry_policy_budget(self):
+        """Test du budget total et du Retry-After"""
+        policy = RetryPolicy(max_retries=5, total_timeout=10)
+        started_at = time.monotonic()
+
+        assert policy.next_delay(0, started_at, status=503, retry_after="2") == 2.0
+        assert policy.next_delay(0, started_at, status=503, retry_after="30") is None
+        assert policy.next_delay(0, started_at, status=404) is None
+        assert policy.next_delay(5, started_at, status=503) is None
+        assert 0 <= policy.next_delay(1, started_at) <= 1.0
+
+    def test_attempt_timeout(self):
+        """Test du délai par tentative, réduit au budget restant"""
+        policy = RetryPolicy(attempt_timeout=5, total_timeout=60)
+        assert policy.timeout_for(time.monotonic()) == 5
+        assert 1.9 < policy.timeout_for(time.monotonic() - 58) <= 2
+        assert policy.timeout_for(time.monotonic() - 70) == RetryPolicy.MIN_ATTEMPT_TIMEOUT
+        assert RetryPolicy(attempt_timeout=None, total_timeout=None).timeout_for(time.monotonic()) is None
+
+    def test_slow_server_cut_off(self):
+        """Test d'un serveur qui ne répond pas : chaque tentative est interrompue"""
+        with silent_server() as port:
+            requestor = Requestor(
+                api_base=f'http://127.0.0.1:{port}',
+                retry_policy=RetryPolicy(max_retries=1, backoff_factor=0, attempt_timeout=0.2)
+            )
+            started_at = time.monotonic()
+            with pytest.raises(ApiConnectionError):
+                requestor.request('get', '/packages/1')
+            elapsed = time.monotonic() - started_at
+
+        assert 0.4 <= elapsed < 2
+
+    def test_slow_server_total_budget(self):
+        """Test du budget total appliqué à une tentative sans délai propre"""
+        with silent_server() as port:
+            requestor = Requestor(
+                api_base=f'http://127.0.0.1:{port}',
+                retry_policy=RetryPolicy(max_retries=5, attempt_timeout=None, total_timeout=0.3)
+            )
+            started_at = time.monotonic()
+            with pytest.raises(ApiConnectionError):
+                requestor.request('get', '/packages/1')
+
+        assert time.monotonic() - started_at < 2
+
+    def test_parse_retry_after(self):
+        """Test de l'analyse de l'en-tête Retry-After"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("invalid") is None
+
+    @responses.activate
+    def test_coalesce_identical_gets(self):
+        """Test du regroupement des GET identiques simultanés"""
+        release = threading.Event()
+
+        def callback(request):
+            release.wait(5)
+            return (200, {}, '{"id": 1}')
+
+        responses.add_callback(
+            responses.GET,
+            'https://tassi-api.exanora.com/packages/1',
+            callback=callback,
+            content_type='application/json'
+        )
+
+        requestor = Requestor()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(requestor.request('get', '/packages/1')))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(responses.calls) == 1
+        assert [result['data'] for result in results] == [{"id": 1}] * 8
+
+    @responses.activate
+    def test_coalesce_distinct_requests(self):
+        """Test de l'absence de regroupement pour des requêtes différentes"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages', json={}, status=200)
+        responses.add(responses.PUT, 'https://tassi-api.exanora.com/packages/1', json={}, status=200)
+
+        requestor = Requestor()
+        requestor.request('get', '/packages', {"page": 1})
+        requestor.request('get', '/packages', {"page": 2})
+        requestor.request('put', '/packages/1', {"weight": 1})
+        requestor.request('put', '/packages/1', {"weight": 1})
+
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_hooks(self):
+        """Test des hooks du cycle de vie des requêtes"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/4', json={}, status=503)
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages/4', json={"id": 4}, status=200)
+
+        events = []
+        requestor = Requestor(retry_policy=RetryPolicy(backoff_factor=0, jitter=False))
+        requestor.add_hook('before_request', lambda info: events.append(('before', info.attempt)))
+        requestor.add_hook('after_response', lambda info, response: events.append(('after', info.status)))
+        requestor.add_hook('on_error', lambda info, error: events.append(('error', info.status)))
+
+        requestor.request('get', '/packages/4')
+
+        assert events == [
+            ('before', 0), ('after', 503), ('error', 503),
+            ('before', 1), ('after', 200)
+        ]
+
+    @responses.activate
+    def test_failing_hook_is_ignored(self):
+        """Test d'un hook qui lève une exception"""
+        responses.add(responses.GET, 'https://tassi-api.exanora.com/packages', json={}, status=200)
+
+        def hook(info):
+            raise RuntimeError("boom")
+
+        requestor = Requestor()
+        requestor.add_hook('before_request', hook)
+
+        assert requestor.request('get', '/packages')['status'] == 200
+
+    def test_unknown_hook_event(self):
+        """Test d'un événement de hook inconnu"""
+        with pytest.raises(ValueError):
+            Requestor().add_hook('on_success', lambda info: None)
@@ -1,7 +1,9 @@
 """Tests pour la ressource Shipment"""
+import json
 import pytest
 import responses
-from tassi import Tassi, Shipment
+from tassi import Tassi, Shipment, Requestor
+from tassi.retry import RetryPolicy
 from tassi.error import ApiConnectionError
 
 
@@ -81,6 +83,30 @@ class TestShipment:
         assert hasattr(shipment, 'id')
         assert shipment.status == "created"
 
+    @responses.activate
+    def test_create_idempotency_key(self):
+        """Test de la clé d'idempotence réutilisée entre les tentatives"""
+        responses.add(
+            responses.POST,
+            'https://tassi-api.exanora.com/shipments',
+            json={"error": "Service unavailable"},
+            headers={"Retry-After": "0"},
+            status=503
+        )
+        responses.add(
+            responses.POST,
+            'https://tassi-api.exanora.com/shipments',
+            json={"shipment": {"id": 1, "status": "created"}},
+            status=201
+        )
+
+        shipment = Shipment.create({"marketplace_id": "1"})
+
+        assert shipment.status == "created"
+        assert len(responses.calls) == 2
+        keys = {call.request.headers['Idempotency-Key'] for call in responses.calls}
+        assert len(keys) == 1
+
     @responses.activate
     def test_create_validation_error(self):
         """Test de validation avec données invalides"""
@@ -127,4 +153,41 @@ class TestShipment:
         )
 
         with pytest.raises(ApiConnectionError):
-            Shipment.create(payload)
\ No newline at end of file
+            Shipment.create(payload)
+
+    @responses.activate
+    def test_create_many(self):
+        """Test de création groupée avec échecs partiels"""
+        def callback(request):
+            payload = json.loads(request.body)
+            if payload["marketplace_id"] == "bad":
+                return (400, {}, json.dumps({"error": "Invalid marketplace"}))
+            if payload["marketplace_id"] == "busy":
+                return (503, {}, json.dumps({"error": "Service unavailable"}))
+            return (201, {}, json.dumps({"shipment": {"id": payload["marketplace_id"]}}))
+
+        responses.add_callback(
+            responses.POST,
+            'https://tassi-api.exanora.com/shipments',
+            callback=callback,
+            content_type='application/json'
+        )
+
+        payloads = [{"marketplace_id": str(i)} for i in range(10)]
+        payloads[3] = {"marketplace_id": "bad"}
+        payloads[7] = {"marketplace_id": "busy"}
+
+        Shipment.set_requestor(Requestor(retry_policy=RetryPolicy(max_retries=0)))
+        try:
+            result = Shipment.create_many(payloads, max_workers=4)
+        finally:
+            Shipment.set_requestor(None)
+
+        assert len(result) == 10
+        assert not result.ok
+        assert [item.key for item in result.succeeded] == [0, 1, 2, 4, 5, 6, 8, 9]
+        assert result.succeeded[0].result.id == "0"
+        assert [item.key for item in result.failed] == [3]
+        assert result.failed[0].error.http_status == 400
+        assert [item.key for item in result.retryable] == [7]
+        assert result.retryable[0].error.http_status == 503
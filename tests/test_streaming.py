@@ -0,0 +1,74 @@
+"""Tests pour l'analyse incrémentale des listes JSON"""
+import json
+import pytest
+from tassi.error import ApiConnectionError
+from tassi.streaming import JsonItemStream
+
+
+def chunked(data, size):
+    """Découpe les octets en blocs de `size` octets"""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonItemStream:
+    """Tests pour JsonItemStream"""
+
+    @pytest.mark.parametrize('size', [1, 3, 7, 4096])
+    def test_items_and_rest(self, size):
+        """Test des éléments et des autres clés, quel que soit le découpage"""
+        document = {
+            "before": {"nested": [1, 2]},
+            "packages": [
+                {"id": 1, "city": "Cotonou", "weight": 12345},
+                {"id": 2, "description": "é \" ] } ,", "tags": []},
+                {"id": 3, "value": -1.5e3, "ok": True, "none": None}
+            ],
+            "meta": {"current_page": 1, "total_count": 3}
+        }
+        stream = JsonItemStream(chunked(json.dumps(document, ensure_ascii=False).encode(), size), 'packages')
+
+        assert list(stream) == document["packages"]
+        assert stream.count == 3
+        assert stream.rest == {"before": {"nested": [1, 2]}, "meta": {"current_page": 1, "total_count": 3}}
+
+    def test_top_level_list(self):
+        """Test d'un corps qui est directement une liste"""
+        stream = JsonItemStream(chunked(b' [1, 22, {"id": 333}] ', 2), 'packages')
+        assert list(stream) == [1, 22, {"id": 333}]
+
+    def test_missing_key_and_empty_body(self):
+        """Test d'un objet sans la liste attendue et d'un corps vide"""
+        stream = JsonItemStream([b'{"meta": {}}'], 'packages')
+        assert list(stream) == []
+        assert stream.rest == {"meta": {}}
+
+        assert list(JsonItemStream([], 'packages')) == []
+
+    def test_numbers_split_at_every_offset(self):
+        """Test des nombres coupés entre deux blocs, à chaque position"""
+        body = b'{"packages": [1.5, -2e3, 3E-2, 40, 0.125e+2, true], "total": 6}'
+        expected = json.loads(body)
+
+        for offset in range(1, len(body)):
+            stream = JsonItemStream([body[:offset], body[offset:]], 'packages')
+            assert list(stream) == expected['packages'], offset
+            assert stream.rest == {"total": 6}, offset
+
+    def test_lazy_consumption(self):
+        """Test de la lecture des blocs à la demande"""
+        read = []
+
+        def chunks():
+            for chunk in chunked(b'{"packages": [{"id": 1}, {"id": 2}, {"id": 3}]}', 8):
+                read.append(chunk)
+                yield chunk
+
+        items = iter(JsonItemStream(chunks(), 'packages'))
+        assert next(items) == {"id": 1}
+        assert len(read) < 5
+
+    @pytest.mark.parametrize('body', [b'{"packages": [{"id": 1}', b'{"packages": [1 2]}', b'[1] x'])
+    def test_invalid_json(self, body):
+        """Test d'un corps invalide"""
+        with pytest.raises(ApiConnectionError):
+            list(JsonItemStream(chunked(body, 4), 'packages'))
@@ -0,0 +1,160 @@
+"""Tests pour la synchronisation incrémentale de l'historique du wallet"""
+import pytest
+import responses
+from tassi import (
+    Tassi, Marketplace, MemoryCheckpointStore, FileCheckpointStore, SqliteCheckpointStore
+)
+
+HISTORY_URL = 'https://tassi-api.exanora.com/marketplaces/1/wallet_history'
+
+
+def add_pages(pages):
+    """Simule l'historique, du plus récent au plus ancien, une réponse par page"""
+    for number, movements in enumerate(pages, start=1):
+        responses.add(
+            responses.GET,
+            HISTORY_URL,
+            json={
+                "wallet_movements": movements,
+                "meta": {"current_page": number, "total_pages": len(pages)}
+            },
+            match=[responses.matchers.query_param_matcher({"page": str(number)})]
+        )
+
+
+class TestSyncWalletHistory:
+    """Tests pour Marketplace.sync_wallet_history"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        self.marketplace = Marketplace()
+        self.marketplace.id = 1
+
+    @pytest.mark.parametrize('store_type', ['memory', 'file', 'sqlite'])
+    @responses.activate
+    def test_incremental_sync(self, tmp_path, store_type):
+        """Test d'une première synchronisation puis d'une synchronisation incrémentale"""
+        store = {
+            'memory': lambda: MemoryCheckpointStore(),
+            'file': lambda: FileCheckpointStore(tmp_path / 'checkpoints.json'),
+            'sqlite': lambda: SqliteCheckpointStore(tmp_path / 'checkpoints.db')
+        }[store_type]()
+
+        add_pages([[{"id": 7}, {"id": 6}], [{"id": 5}]])
+        received = []
+        result = self.marketplace.sync_wallet_history(lambda m: received.append(m.id), store)
+
+        assert received == [5, 6, 7]
+        assert result.count == 3
+        assert store.get('marketplace:1:wallet_history') == {'cursor': 7, 'ids': [7]}
+
+        # Deux nouveaux mouvements : seule la première page est demandée
+        responses.reset()
+        add_pages([[{"id": 9}, {"id": 8}, {"id": 7}], [{"id": 6}, {"id": 5}]])
+        received = []
+        result = self.marketplace.sync_wallet_history(lambda m: received.append(m.id), store)
+
+        assert received == [8, 9]
+        assert len(responses.calls) == 1
+
+        # Rien de nouveau
+        responses.reset()
+        add_pages([[{"id": 9}, {"id": 8}]])
+        assert self.marketplace.sync_wallet_history(received.append, store).count == 0
+
+    @responses.activate
+    def test_timestamp_cursor(self):
+        """Test d'un curseur horodaté partagé par plusieurs mouvements"""
+        store = MemoryCheckpointStore()
+        add_pages([[
+            {"id": 12, "created_at": "2024-03-02T10:00:00Z"},
+            {"id": 11, "created_at": "2024-03-02T10:00:00Z"},
+            {"id": 10, "created_at": "2024-03-01T08:00:00Z"}
+        ]])
+
+        received = []
+        self.marketplace.sync_wallet_history(
+            lambda m: received.append(m.id),
+            store,
+            cursor_field='created_at',
+            initial_cursor="2024-03-02T00:00:00Z"
+        )
+        assert received == [11, 12]
+
+        # Un mouvement arrivé dans la même seconde que le dernier transmis
+        responses.reset()
+        add_pages([[
+            {"id": 13, "created_at": "2024-03-02T10:00:00Z"},
+            {"id": 12, "created_at": "2024-03-02T10:00:00Z"},
+            {"id": 11, "created_at": "2024-03-02T10:00:00Z"}
+        ]])
+        received = []
+        self.marketplace.sync_wallet_history(lambda m: received.append(m.id), store, cursor_field='created_at')
+        assert received == [13]
+
+    @responses.activate
+    def test_resume_after_failure(self):
+        """Test de la reprise après une erreur du callback"""
+        store = MemoryCheckpointStore()
+        add_pages([[{"id": 3}, {"id": 2}, {"id": 1}]])
+
+        def failing(movement):
+            if movement.id == 2:
+                raise RuntimeError("ledger unavailable")
+
+        with pytest.raises(RuntimeError):
+            self.marketplace.sync_wallet_history(failing, store, checkpoint_every=1)
+        assert store.get('marketplace:1:wallet_history')['cursor'] == 1
+
+        received = []
+        self.marketplace.sync_wallet_history(lambda m: received.append(m.id), store)
+        assert received == [2, 3]
+
+    @responses.activate
+    def test_newest_first(self):
+        """Test de la transmission au fil du parcours, du plus récent au plus ancien"""
+        store = MemoryCheckpointStore()
+        add_pages([[{"id": 7}, {"id": 6}], [{"id": 5}]])
+        received = []
+
+        def callback(movement):
+            received.append((movement.id, len(responses.calls)))
+
+        result = self.marketplace.sync_wallet_history(callback, store, newest_first=True)
+
+        # Les mouvements de la première page sont transmis avant la lecture de la seconde
+        assert received == [(7, 1), (6, 1), (5, 2)]
+        assert result.count == 3
+        assert store.get('marketplace:1:wallet_history') == {'cursor': 7, 'ids': [7]}
+
+        responses.reset()
+        add_pages([[{"id": 9}, {"id": 8}, {"id": 7}]])
+        received = []
+        self.marketplace.sync_wallet_history(lambda m: received.append(m.id), store, newest_first=True)
+        assert received == [9, 8]
+        assert store.get('marketplace:1:wallet_history') == {'cursor': 9, 'ids': [9]}
+
+    @responses.activate
+    def test_newest_first_failure_keeps_checkpoint(self):
+        """Test d'une erreur en mode newest_first : le point de reprise reste inchangé"""
+        store = MemoryCheckpointStore()
+        store.set('marketplace:1:wallet_history', {'cursor': 1, 'ids': [1]})
+        add_pages([[{"id": 3}, {"id": 2}, {"id": 1}]])
+
+        def failing(movement):
+            if movement.id == 2:
+                raise RuntimeError("ledger unavailable")
+
+        with pytest.raises(RuntimeError):
+            self.marketplace.sync_wallet_history(failing, store, newest_first=True)
+        assert store.get('marketplace:1:wallet_history') == {'cursor': 1, 'ids': [1]}
+
+    @responses.activate
+    def test_missing_cursor_field(self):
+        """Test d'un mouvement sans champ curseur"""
+        add_pages([[{"action": "Credit"}]])
+
+        with pytest.raises(ValueError):
+            self.marketplace.sync_wallet_history(print, MemoryCheckpointStore())
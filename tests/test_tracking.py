@@ -0,0 +1,199 @@
+"""Tests pour la surveillance du suivi des packages"""
+import json
+import threading
+import responses
+from tassi import Tassi, Package, Requestor, TrackingWatcher
+from tassi.retry import RetryPolicy
+
+
+class FakeClock:
+    """Horloge manuelle"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTrackingWatcher:
+    """Tests pour TrackingWatcher"""
+
+    def setup_method(self):
+        """Configuration avant chaque test"""
+        Tassi.set_api_key('test_api_key')
+        Tassi.set_environment('sandbox')
+        Package.set_requestor(Requestor(retry_policy=RetryPolicy(max_retries=0)))
+        self.clock = FakeClock()
+        self.received = []
+        self.errors = []
+        self.tracking = {}
+
+    def teardown_method(self):
+        """Réinitialise le requestor"""
+        Package.set_requestor(None)
+
+    def add_tracking(self, package_id):
+        """Simule l'endpoint de suivi d'un package"""
+        def callback(request):
+            data = self.tracking[package_id]
+            if data is None:
+                return (503, {}, "{}")
+            return (200, {}, json.dumps(data))
+
+        responses.add_callback(
+            responses.GET,
+            f'https://tassi-api.exanora.com/packages/{package_id}/track',
+            callback=callback,
+            content_type='application/json'
+        )
+
+    def make_watcher(self, **kwargs):
+        lock = threading.Lock()
+
+        def on_events(package_id, events):
+            with lock:
+                self.received.append((package_id, [event.id for event in events]))
+
+        return TrackingWatcher(
+            on_events,
+            on_error=lambda package_id, error: self.errors.append((package_id, error)),
+            min_interval=10,
+            max_interval=80,
+            clock=self.clock,
+            **kwargs
+        )
+
+    @responses.activate
+    def test_new_events_and_backoff(self):
+        """Test de la détection des nouveaux événements et du backoff"""
+        self.tracking[1] = {"status": "in_transit", "events": [{"id": 1}]}
+        self.add_tracking(1)
+        watcher = self.make_watcher()
+        watcher.watch(1)
+
+        assert watcher.poll_due() == 1
+        assert self.received == [(1, [1])]
+        assert watcher.next_poll_in() == 10
+
+        # Pas encore à échéance
+        self.clock.now = 5
+        assert watcher.poll_due() == 0
+
+        # Aucun nouvel événement : l'intervalle double
+        self.clock.now = 10
+        assert watcher.poll_due() == 1
+        assert self.received == [(1, [1])]
+        assert watcher.next_poll_in() == 20
+
+        # Nouvel événement : retour à l'intervalle minimal
+        self.tracking[1]["events"].append({"id": 2})
+        self.clock.now = 30
+        assert watcher.poll_due() == 1
+        assert self.received == [(1, [1]), (1, [2])]
+        assert watcher.next_poll_in() == 10
+
+    @responses.activate
+    def test_terminal_status(self):
+        """Test de l'arrêt de la surveillance d'un package livré"""
+        self.tracking[1] = {"status": "delivered", "events": [{"id": 1}, {"id": 2}]}
+        self.tracking[2] = {"status": "in_transit", "events": []}
+        self.add_tracking(1)
+        self.add_tracking(2)
+        watcher = self.make_watcher(emit_existing=False)
+        watcher.watch(1)
+        watcher.watch(2)
+
+        assert watcher.poll_due() == 2
+        assert self.received == []
+        assert watcher.watched == [2]
+
+    @responses.activate
+    def test_errors_back_off(self):
+        """Test des erreurs transmises à on_error"""
+        self.tracking[1] = None
+        self.add_tracking(1)
+        watcher = self.make_watcher()
+        watcher.watch(1)
+
+        watcher.poll_due()
+        watcher.poll_due()
+
+        assert len(self.errors) == 1
+        assert self.errors[0][1].http_status == 503
+        assert watcher.next_poll_in() == 20
+        assert watcher.watched == [1]
+
+    @responses.activate
+    def test_callback_error_redelivers(self):
+        """Test de la nouvelle transmission des événements après un callback en échec"""
+        self.tracking[1] = {"status": "delivered", "events": [{"id": 1}]}
+        self.add_tracking(1)
+        failures = [RuntimeError("webhook down")]
+
+        def on_events(package_id, events):
+            if failures:
+                raise failures.pop()
+            self.received.append((package_id, [event.id for event in events]))
+
+        watcher = TrackingWatcher(
+            on_events,
+            on_error=lambda package_id, error: self.errors.append((package_id, error)),
+            min_interval=10,
+            clock=self.clock
+        )
+        watcher.watch(1)
+
+        watcher.poll_due()
+        assert self.received == []
+        assert isinstance(self.errors[0][1], RuntimeError)
+        assert watcher.watched == [1]
+        assert watcher.next_poll_in() == 10
+
+        self.clock.now = 10
+        watcher.poll_due()
+        assert self.received == [(1, [1])]
+        assert watcher.watched == []
+
+    @responses.activate
+    def test_on_error_failure_keeps_running(self):
+        """Test d'une exception levée par on_error : la boucle continue"""
+        self.tracking[1] = None
+        self.add_tracking(1)
+
+        def on_error(package_id, error):
+            self.errors.append(package_id)
+            raise RuntimeError("alerting down")
+
+        watcher = TrackingWatcher(self.received.append, on_error=on_error, min_interval=10, clock=self.clock)
+        watcher.watch(1)
+
+        assert watcher.poll_due() == 1
+        self.clock.now = 20
+        assert watcher.poll_due() == 1
+        assert self.errors == [1, 1]
+
+    @responses.activate
+    def test_bounded_concurrency(self):
+        """Test de l'interrogation simultanée de nombreux packages"""
+        for package_id in range(1, 21):
+            self.tracking[package_id] = {"events": [{"id": package_id}]}
+            self.add_tracking(package_id)
+
+        watcher = self.make_watcher(max_workers=4)
+        for package_id in range(1, 21):
+            watcher.watch(package_id)
+
+        assert watcher.poll_due() == 20
+        watcher.stop()
+        assert sorted(self.received) == [(i, [i]) for i in range(1, 21)]
+
+    def test_unwatch(self):
+        """Test du retrait d'un package"""
+        watcher = self.make_watcher()
+        watcher.watch(1)
+        watcher.unwatch(1)
+
+        assert watcher.watched == []
+        assert watcher.next_poll_in() is None
+        assert watcher.poll_due() == 0
@@ -0,0 +1,115 @@
+"""Tests pour la conversion des réponses"""
+import pytest
+from tassi import Tassi, TassiObject, array_to_tassi_object
+from tassi.util import LazyTassiObject
+from tassi.tassi_object import TassiRecord, record_class
+
+
+PAYLOAD = {
+    "id": 4,
+    "status": "in_transit",
+    "customer": {"first_name": "Doe", "address": {"city": "Cotonou"}},
+    "stops": [{"city": "Sèmè-Kpodji"}, "direct"]
+}
+
+
+class TestArrayToTassiObject:
+    """Tests pour array_to_tassi_object"""
+
+    def teardown_method(self):
+        """Rétablit le mode par défaut"""
+        Tassi.set_object_mode('eager')
+
+    def test_eager(self):
+        """Test de la conversion immédiate"""
+        obj = array_to_tassi_object(PAYLOAD, {})
+
+        assert type(obj) is TassiObject
+        assert isinstance(obj.customer, TassiObject)
+        assert obj.customer.address.city == "Cotonou"
+        assert obj.stops[0].city == "Sèmè-Kpodji"
+        assert obj.stops[1] == "direct"
+
+    def test_lazy(self):
+        """Test de la conversion à la demande"""
+        obj = array_to_tassi_object(PAYLOAD, {}, mode='lazy')
+
+        assert isinstance(obj, TassiObject)
+        assert 'customer' not in obj.__dict__
+        assert obj.status == "in_transit"
+        assert 'customer' not in obj.__dict__
+
+        customer = obj.customer
+        assert isinstance(customer, LazyTassiObject)
+        assert obj.customer is customer
+        assert customer.address.city == "Cotonou"
+        assert obj.stops[0].city == "Sèmè-Kpodji"
+        assert hasattr(obj, 'id')
+        assert not hasattr(obj, 'missing')
+        assert repr(obj) == "<LazyTassiObject id=4>"
+
+    def test_lazy_global_mode(self):
+        """Test du mode global pour les listes"""
+        Tassi.set_object_mode('lazy')
+        objs = array_to_tassi_object([PAYLOAD, PAYLOAD], {})
+
+        assert all(isinstance(obj, LazyTassiObject) for obj in objs)
+        assert objs[1].customer.first_name == "Doe"
+
+    def test_serialize_parameters_match(self):
+        """Test de la sérialisation identique dans les deux modes"""
+        eager = array_to_tassi_object(PAYLOAD, {}).serialize_parameters()
+        lazy = array_to_tassi_object(PAYLOAD, {}, mode='lazy').serialize_parameters()
+
+        assert eager.keys() == lazy.keys() == {"status", "customer", "stops"}
+        assert lazy["status"] == "in_transit"
+
+    def test_to_dict_match(self):
+        """Test de la conversion en dictionnaire dans tous les modes"""
+        for mode in ('eager', 'lazy', 'compact'):
+            assert array_to_tassi_object(PAYLOAD, {}, mode=mode).to_dict() == PAYLOAD
+
+    def test_serialize_changes_untracked(self):
+        """Test d'un objet sans référence : tous ses attributs sont des modifications"""
+        obj = array_to_tassi_object(PAYLOAD, {})
+        assert obj.serialize_changes() == {k: v for k, v in PAYLOAD.items() if k != 'id'}
+
+    def test_lazy_assignment_and_refresh(self):
+        """Test de l'affectation et du rafraîchissement d'un objet paresseux"""
+        obj = array_to_tassi_object(PAYLOAD, {}, mode='lazy')
+        obj.status = "delivered"
+        assert obj.serialize_parameters()["status"] == "delivered"
+
+        obj.refresh_from({"status": "returned"}, {})
+        assert obj.status == "returned"
+
+    def test_compact(self):
+        """Test de la représentation compacte à slots"""
+        objs = array_to_tassi_object([PAYLOAD, dict(PAYLOAD, id=5)], {}, mode='compact')
+
+        assert all(isinstance(obj, TassiRecord) for obj in objs)
+        assert type(objs[0]) is type(objs[1])
+        assert not hasattr(objs[0], '__dict__')
+        assert objs[1].id == 5
+        assert objs[0].customer.address.city == "Cotonou"
+        assert objs[0].stops[0].city == "Sèmè-Kpodji"
+        assert repr(objs[0]) == "<TassiRecord id=4>"
+
+        objs[0].status = "delivered"
+        assert objs[0].serialize_parameters() == {
+            "status": "delivered",
+            "customer": objs[0].customer,
+            "stops": objs[0].stops
+        }
+
+    def test_compact_fallback(self):
+        """Test du repli sur TassiObject pour les champs invalides"""
+        obj = array_to_tassi_object({"id": 1, "class": "A", "refresh_from": 2}, {}, mode='compact')
+
+        assert type(obj) is TassiObject
+        assert record_class(("id", "first-name")) is None
+
+    def test_unknown_mode(self):
+        """Test d'un mode inconnu"""
+        with pytest.raises(ValueError):
+            array_to_tassi_object(PAYLOAD, {}, mode='unknown')